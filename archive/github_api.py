@@ -18,6 +18,7 @@ import requests
 import json
 import sys
 import inspect
+import weakref
 
 
 #####################
@@ -37,11 +38,35 @@ class GitHubAPI(object):
         """
         GitHubAPI self class to create a repository owner object that can
         be referenced and used by the parent GitHubAPI class object.
+
+        Owner objects are interned by owner id, so every repository that
+        belongs to the same user or organization shares a single RepoOwner
+        instance. The intern table only holds weak references, so an owner
+        is released as soon as the last repository object referencing it
+        is garbage collected.
         """
 
+        __slots__ = ('id', 'name', 'avatar', 'url', '__weakref__')
+
+        # Intern table of live owner objects keyed by owner id.
+        _instances = weakref.WeakValueDictionary()
+
+        def __new__(cls, owner_id, owner_name, owner_avatar, owner_url):
+            '''GitHubAPI Owner Class Instance Lookup'''
+            # Owners without an id can not be safely shared.
+            if owner_id is None:
+                return super().__new__(cls)
+
+            this_owner = cls._instances.get(owner_id)
+            if this_owner is None:
+                this_owner = super().__new__(cls)
+                cls._instances[owner_id] = this_owner
+            return this_owner
+
         def __init__(self, owner_id, owner_name, owner_avatar, owner_url):
             '''GitHubAPI Owner Class Constructor'''
-            # Set class instantiation variables
+            # Set class instantiation variables, refreshing any shared
+            # instance with the most recently received owner payload.
             self.id = owner_id
             self.name = owner_name
             self.avatar = owner_avatar
@@ -0,0 +1,11 @@
+##############################################################################
+# CloudMage : GitUtils Benchmark Suite
+#  ===========================================================================
+# CloudMage GitUtils Benchmarks
+#   - Time and peak memory benchmarks for the package hot paths, compared
+#     against stored baselines so regressions show up between releases.
+#   - Run with `python -m benchmarks`, see `python -m benchmarks --help`.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
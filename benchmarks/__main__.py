@@ -0,0 +1,22 @@
+##############################################################################
+# CloudMage : GitUtils Benchmark Suite Entry Point
+#  ===========================================================================
+# Run with `python -m benchmarks` from the repository root.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+import sys
+
+# Import Package Modules
+from . import (  # noqa: F401 (registration)
+    bench_gitconfig, bench_import, bench_reports
+)
+from .runner import main
+
+sys.exit(main())
@@ -0,0 +1,151 @@
+##############################################################################
+# CloudMage : GitConfigParser Benchmarks
+#  ===========================================================================
+# CloudMage GitConfigParser Benchmark Cases
+#   - GitConfigParser construction on small, large and pathological
+#     .git/config files.
+#   - Bulk provider and URL parsing, and log() overhead with logging on/off.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Pip Installed Modules
+from cloudmage.gitutils import GitConfigParser
+
+# Import Base Python Modules
+import tempfile
+import os
+
+# Import Package Modules
+from .runner import benchmark
+
+
+######################################
+# Fixtures:                          #
+######################################
+REPOSITORY_URLS = [
+    'https://github.com/TheCloudMage/Mock-Repository.git',
+    'http://gitlab.com/TheCloudMage/Mock-Repository.git',
+    'git@github.com:TheCloudMage/Mock-Repository.git',
+    'ssh://git@bitbucket.org/TheCloudMage/Mock-Repository.git',
+    'https://mage@bitbucket.org/TheCloudMage/Mock-Repository.git',
+    'git@gitlab.com:TheCloudMage/Mock-Repository.git'
+]
+
+SMALL_CONFIG = """[core]
+\trepositoryformatversion = 0
+\tfilemode = true
+\tbare = false
+\tlogallrefupdates = true
+[remote "origin"]
+\turl = https://github.com/TheCloudMage/Mock-Repository.git
+\tfetch = +refs/heads/*:refs/remotes/origin/*
+[branch "master"]
+\tremote = origin
+\tmerge = refs/heads/master
+"""
+
+
+def _large_config(branches=500):
+    """ A config with many tracked branches before the remote section """
+    this_branches = ''.join(
+        f'[branch "feature/{_n_}"]\n\tremote = origin\n'
+        f'\tmerge = refs/heads/feature/{_n_}\n'
+        for _n_ in range(branches)
+    )
+    return SMALL_CONFIG.replace('[remote "origin"]', this_branches +
+                                '[remote "origin"]')
+
+
+def _pathological_config(lines=1500):
+    """ A config where every line matches 'url' but fails validation """
+    this_rewrites = ''.join(
+        f'[url "https://mirror-{_n_}.example.com/"]\n'
+        f'\tinsteadOf = https://github.com/org-{_n_}/\n'
+        f'\tpushurl = ftp://mirror-{_n_}.example.com/{"x" * 200}\n'
+        for _n_ in range(lines // 3)
+    )
+    return this_rewrites + SMALL_CONFIG
+
+
+def _config_dir(content):
+    """ Yield a temporary directory containing .git/config """
+    with tempfile.TemporaryDirectory() as this_path:
+        os.mkdir(os.path.join(this_path, '.git'))
+        with open(os.path.join(this_path, '.git', 'config'), 'w') as f:
+            f.write(content)
+        yield this_path
+
+
+######################################
+# GitConfigParser Construction:      #
+######################################
+@benchmark('gitconfig.construct.small')
+def construct_small():
+    for this_path in _config_dir(SMALL_CONFIG):
+        yield lambda: GitConfigParser(this_path)
+
+
+@benchmark('gitconfig.construct.large')
+def construct_large():
+    for this_path in _config_dir(_large_config()):
+        yield lambda: GitConfigParser(this_path)
+
+
+@benchmark('gitconfig.construct.pathological')
+def construct_pathological():
+    for this_path in _config_dir(_pathological_config()):
+        yield lambda: GitConfigParser(this_path)
+
+
+######################################
+# Provider and URL Parsing:          #
+######################################
+@benchmark('gitconfig.provider.bulk')
+def provider_bulk():
+    for this_path in _config_dir(SMALL_CONFIG):
+        ThisParser = GitConfigParser(this_path)
+        this_urls = REPOSITORY_URLS * 100
+
+        def parse():
+            for _url_ in this_urls:
+                ThisParser.provider = _url_
+        yield parse
+
+
+######################################
+# Log Overhead:                      #
+######################################
+class _NullLog(object):
+    """ Log object that discards every message """
+
+    def debug(self, msg):
+        pass
+
+    info = warning = error = debug
+
+
+def _log_call(**kwargs):
+    """ Yield a log() call on a parser of a small .git/config """
+    for this_path in _config_dir(SMALL_CONFIG):
+        ThisParser = GitConfigParser(this_path, **kwargs)
+        yield lambda: ThisParser.log("Benchmark message", 'debug', 'bench')
+
+
+@benchmark('gitconfig.log.off')
+def log_off():
+    yield from _log_call(verbose=False)
+
+
+@benchmark('gitconfig.log.verbose')
+def log_verbose():
+    yield from _log_call(verbose=True)
+
+
+@benchmark('gitconfig.log.object')
+def log_object():
+    yield from _log_call(log=_NullLog())
@@ -0,0 +1,92 @@
+##############################################################################
+# CloudMage : GitUtils Import Time Benchmarks
+#  ===========================================================================
+# CloudMage GitUtils Import Time Benchmark Cases
+#   - Wall time and peak memory of importing the package, and of using only
+#     GitConfigParser, measured in a fresh interpreter per sample.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+import subprocess
+import json
+import sys
+import os
+
+# Import Package Modules
+from .runner import benchmark
+
+
+######################################
+# Fixtures:                          #
+######################################
+REPOSITORY_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The statement is measured inside the child interpreter, so interpreter
+# start up and site imports are not part of the measurement. Tracing slows
+# imports down several times over, so time and peak memory are taken in two
+# separate interpreters.
+TIME_PROBE = """
+import time, json
+this_start = time.perf_counter()
+{statement}
+print(json.dumps(time.perf_counter() - this_start))
+"""
+
+MEMORY_PROBE = """
+import tracemalloc, json
+tracemalloc.start()
+{statement}
+print(json.dumps(tracemalloc.get_traced_memory()[1]))
+"""
+
+
+def _run_probe(source):
+    """ Run a probe in a fresh interpreter and return its JSON result """
+    this_output = subprocess.run(
+        [sys.executable, '-c', source],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=REPOSITORY_ROOT,
+        env=dict(os.environ, PYTHONPATH=REPOSITORY_ROOT)
+    ).stdout
+    return json.loads(this_output.splitlines()[-1])
+
+
+def _import_probe(statement):
+    """ Return a callable measuring statement in fresh interpreters """
+    def probe():
+        return {
+            'time': _run_probe(TIME_PROBE.format(statement=statement)),
+            'peak_memory': _run_probe(
+                MEMORY_PROBE.format(statement=statement)
+            )
+        }
+    return probe
+
+
+######################################
+# Import Benchmarks:                 #
+######################################
+@benchmark('import.package', repeat=7, self_timed=True)
+def bench_import_package():
+    yield _import_probe("import cloudmage.gitutils")
+
+
+@benchmark('import.gitconfig_parser', repeat=7, self_timed=True)
+def bench_import_gitconfig_parser():
+    yield _import_probe(
+        "from cloudmage.gitutils import GitConfigParser\n"
+        f"GitConfigParser({REPOSITORY_ROOT!r}).provider"
+    )
+
+
+@benchmark('import.github_reports', repeat=7, self_timed=True)
+def bench_import_github_reports():
+    yield _import_probe("from cloudmage.gitutils import GithubReports")
@@ -0,0 +1,81 @@
+##############################################################################
+# CloudMage : GithubReports Benchmarks
+#  ===========================================================================
+# CloudMage GithubReports Benchmark Cases
+#   - search_open_pulls against a local GithubStubServer for 100, 1k and 10k
+#     synthetic pull requests.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Pip Installed Modules
+from cloudmage.gitutils import GithubReports
+
+# Import Base Python Modules
+import subprocess
+import sys
+
+# Import Package Modules
+from .runner import benchmark
+
+
+######################################
+# Fixtures:                          #
+######################################
+def _stub_server(pr_count):
+    """ Yield the base url of a GithubStubServer subprocess
+
+    The stub runs in its own process so that neither its CPU time nor its
+    allocations are attributed to the report run being measured.
+    """
+    ThisServer = subprocess.Popen(
+        [
+            sys.executable, '-m', 'cloudmage.gitutils.github_stub_server',
+            '--port', '0',
+            '--repos', str(max(1, pr_count // 100)),
+            '--prs', str(pr_count)
+        ],
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    try:
+        this_banner = ThisServer.stdout.readline()
+        yield this_banner.strip().rsplit(' ', 1)[-1]
+    finally:
+        ThisServer.terminate()
+        ThisServer.wait()
+
+
+def _search_open_pulls(pr_count):
+    """ Yield a search_open_pulls run against a stub with pr_count PRs """
+    for this_base_url in _stub_server(pr_count):
+        GitHubReportObj = GithubReports(
+            auth_token='benchmark',
+            base_url=this_base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.repo_namespace = 'StubOrg'
+        yield GitHubReportObj.search_open_pulls
+
+
+######################################
+# search_open_pulls:                 #
+######################################
+@benchmark('reports.search_open_pulls.100', repeat=3)
+def search_open_pulls_100():
+    yield from _search_open_pulls(100)
+
+
+@benchmark('reports.search_open_pulls.1k', repeat=1)
+def search_open_pulls_1k():
+    yield from _search_open_pulls(1000)
+
+
+@benchmark('reports.search_open_pulls.10k', repeat=1, slow=True)
+def search_open_pulls_10k():
+    yield from _search_open_pulls(10000)
@@ -0,0 +1,353 @@
+##############################################################################
+# CloudMage : GitUtils Benchmark Runner
+#  ===========================================================================
+# CloudMage GitUtils Benchmark Runner
+#   - Register benchmark cases, measure wall time and peak memory for each
+#     case, and compare the measurements against stored baselines.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+from contextlib import redirect_stdout, redirect_stderr
+import statistics
+import tracemalloc
+import platform
+import argparse
+import json
+import time
+import sys
+import os
+
+
+######################################
+# Benchmark Registry:                #
+######################################
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    'baselines.json'
+)
+
+BENCHMARKS = {}
+
+
+class Benchmark(object):
+    """ CloudMage Benchmark Case
+
+    A registered benchmark case. The setup function is a generator that
+    prepares any fixtures, yields the callable to be measured, and cleans up
+    its fixtures once the generator is closed.
+
+    A self timed case yields a callable that takes its own measurement and
+    returns a dict with time and peak_memory, for measurements such as
+    import time that have to be taken in a fresh interpreter.
+    """
+
+    def __init__(
+        self, name, setup, repeat=5, min_time=0.2, slow=False,
+        self_timed=False
+    ):
+        """ Benchmark Case Constructor
+
+        Parameters:
+            name     (str):   required
+            setup    (func):  required
+            repeat   (int):   optional [default=5]
+            min_time (float): optional [default=0.2]
+            slow     (bool):  optional [default=False]
+            self_timed (bool): optional [default=False]
+        """
+        self.name = name
+        self.setup = setup
+        self.repeat = repeat
+        self.min_time = min_time
+        self.slow = slow
+        self.self_timed = self_timed
+
+
+def benchmark(name, repeat=5, min_time=0.2, slow=False, self_timed=False):
+    """ Register a generator setup function as a benchmark case """
+    def register(setup):
+        BENCHMARKS[name] = Benchmark(
+            name, setup, repeat, min_time, slow, self_timed
+        )
+        return setup
+    return register
+
+
+######################################
+# Measurement:                       #
+######################################
+def _timed(func, loops):
+    """ Return the wall time of calling func loops times, output muted """
+    with open(os.devnull, 'w') as devnull:
+        with redirect_stdout(devnull), redirect_stderr(devnull):
+            this_start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            return time.perf_counter() - this_start
+
+
+def _peak_memory(func):
+    """ Return the peak traced memory allocated by a single call of func """
+    with open(os.devnull, 'w') as devnull:
+        with redirect_stdout(devnull), redirect_stderr(devnull):
+            tracemalloc.start()
+            try:
+                this_base = tracemalloc.get_traced_memory()[0]
+                func()
+                return tracemalloc.get_traced_memory()[1] - this_base
+            finally:
+                tracemalloc.stop()
+
+
+def _measure_self_timed(func, repeat):
+    """ Collect repeat samples from a self timed callable """
+    with open(os.devnull, 'w') as devnull:
+        with redirect_stdout(devnull), redirect_stderr(devnull):
+            this_samples = [func() for _ in range(repeat)]
+    this_times = [_sample_['time'] for _sample_ in this_samples]
+    return {
+        'time': statistics.median(this_times),
+        'min': min(this_times),
+        'loops': 1,
+        'repeat': len(this_samples),
+        'peak_memory': max(
+            _sample_['peak_memory'] for _sample_ in this_samples
+        )
+    }
+
+
+def measure(case):
+    """ Measure a benchmark case
+
+    The number of loops per sample is calibrated so that a sample takes at
+    least case.min_time seconds. Time is reported per call, peak memory is
+    measured separately with tracemalloc so tracing does not skew timings.
+    Self timed cases report their own time and peak memory per sample.
+
+    Returns:
+        dict: time (median), min, loops, repeat and peak_memory
+    """
+    this_setup = case.setup()
+    with open(os.devnull, 'w') as devnull:
+        with redirect_stdout(devnull), redirect_stderr(devnull):
+            this_func = next(this_setup)
+    try:
+        if case.self_timed:
+            return _measure_self_timed(this_func, case.repeat)
+
+        this_loops = 1
+        this_elapsed = _timed(this_func, this_loops)
+        while this_elapsed < case.min_time:
+            this_loops *= 10
+            this_elapsed = _timed(this_func, this_loops)
+
+        # A single calibration call is as good as any other sample.
+        this_samples = [this_elapsed] if this_loops == 1 else []
+        while len(this_samples) < case.repeat:
+            this_samples.append(_timed(this_func, this_loops))
+        this_samples = [_sample_ / this_loops for _sample_ in this_samples]
+
+        return {
+            'time': statistics.median(this_samples),
+            'min': min(this_samples),
+            'loops': this_loops,
+            'repeat': len(this_samples),
+            'peak_memory': _peak_memory(this_func)
+        }
+    finally:
+        this_setup.close()
+
+
+######################################
+# Baselines:                         #
+######################################
+def machine_info():
+    """ Describe the machine the measurements were taken on """
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'system': platform.system(),
+        'machine': platform.machine(),
+        'processor': platform.processor()
+    }
+
+
+def load_baselines(path=BASELINE_PATH):
+    """ Load stored baselines, or an empty baseline set """
+    if not os.path.exists(path):
+        return {'machine': {}, 'benchmarks': {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baselines(results, path=BASELINE_PATH):
+    """ Merge results into the stored baselines and write them """
+    this_baselines = load_baselines(path)
+    this_baselines['machine'] = machine_info()
+    for _name_, _result_ in results.items():
+        this_baselines['benchmarks'][_name_] = {
+            'time': _result_['time'],
+            'peak_memory': _result_['peak_memory']
+        }
+    with open(path, 'w') as f:
+        json.dump(this_baselines, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(results, baselines, time_tolerance=0.25, memory_tolerance=0.10):
+    """ Compare results against baselines
+
+    Returns:
+        list: (name, metric, baseline, result) for every metric that
+        exceeds its baseline by more than the tolerance.
+    """
+    this_regressions = []
+    this_tolerances = (
+        ('time', time_tolerance),
+        ('peak_memory', memory_tolerance)
+    )
+    for _name_, _result_ in results.items():
+        this_baseline = baselines.get('benchmarks', {}).get(_name_)
+        if this_baseline is None:
+            continue
+        for _metric_, _tolerance_ in this_tolerances:
+            if _result_[_metric_] > this_baseline[_metric_] * (
+                1 + _tolerance_
+            ):
+                this_regressions.append((
+                    _name_,
+                    _metric_,
+                    this_baseline[_metric_],
+                    _result_[_metric_]
+                ))
+    return this_regressions
+
+
+######################################
+# Reporting:                         #
+######################################
+def _format_time(seconds):
+    """ Format a duration in the most readable unit """
+    for _unit_, _scale_ in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= _scale_:
+            return f"{seconds / _scale_:.2f} {_unit_}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _format_bytes(size):
+    """ Format a byte count in the most readable unit """
+    for _unit_, _scale_ in (('MiB', 2 ** 20), ('KiB', 2 ** 10)):
+        if size >= _scale_:
+            return f"{size / _scale_:.1f} {_unit_}"
+    return f"{size} B"
+
+
+def _change(result, baseline):
+    """ Format the relative change from baseline to result """
+    if not baseline:
+        return '-'
+    return f"{(result - baseline) / baseline:+.0%}"
+
+
+def run(cases, baselines, stream=sys.stdout):
+    """ Measure each case and print a result table row as it completes """
+    this_results = {}
+    this_width = max([len(_case_.name) for _case_ in cases] + [9])
+    print(
+        f"{'benchmark':<{this_width}}  {'time':>10} {'vs base':>8}  "
+        f"{'peak mem':>10} {'vs base':>8}",
+        file=stream
+    )
+    for _case_ in cases:
+        this_result = measure(_case_)
+        this_results[_case_.name] = this_result
+        this_baseline = baselines.get('benchmarks', {}).get(_case_.name, {})
+        this_time = this_result['time']
+        this_memory = this_result['peak_memory']
+        print(
+            f"{_case_.name:<{this_width}}  "
+            f"{_format_time(this_time):>10} "
+            f"{_change(this_time, this_baseline.get('time')):>8}  "
+            f"{_format_bytes(this_memory):>10} "
+            f"{_change(this_memory, this_baseline.get('peak_memory')):>8}",
+            file=stream,
+            flush=True
+        )
+    return this_results
+
+
+def main(argv=None):
+    """ Run the benchmark suite, returning a non zero status on regression """
+    ThisParser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description="Run the GitUtils benchmark suite."
+    )
+    ThisParser.add_argument(
+        '-k', dest='keyword', default=None,
+        help="only run benchmarks whose name contains this string"
+    )
+    ThisParser.add_argument(
+        '--quick', action='store_true',
+        help="skip slow benchmarks"
+    )
+    ThisParser.add_argument(
+        '--save', action='store_true',
+        help="store the results as the new baselines"
+    )
+    ThisParser.add_argument('--baselines', default=BASELINE_PATH)
+    ThisParser.add_argument('--json', dest='json_path', default=None)
+    ThisParser.add_argument('--time-tolerance', type=float, default=0.25)
+    ThisParser.add_argument('--memory-tolerance', type=float, default=0.10)
+    ThisArgs = ThisParser.parse_args(argv)
+
+    this_cases = [
+        _case_ for _case_ in BENCHMARKS.values()
+        if (ThisArgs.keyword is None or ThisArgs.keyword in _case_.name) and
+        not (ThisArgs.quick and _case_.slow)
+    ]
+    this_baselines = load_baselines(ThisArgs.baselines)
+    if this_baselines['machine'] and (
+        this_baselines['machine'] != machine_info()
+    ):
+        print(
+            "Baselines were recorded on a different machine: "
+            f"{this_baselines['machine']}\n",
+            file=sys.stderr
+        )
+
+    this_results = run(this_cases, this_baselines)
+
+    if ThisArgs.json_path is not None:
+        with open(ThisArgs.json_path, 'w') as f:
+            json.dump(
+                {'machine': machine_info(), 'benchmarks': this_results},
+                f,
+                indent=2,
+                sort_keys=True
+            )
+
+    if ThisArgs.save:
+        save_baselines(this_results, ThisArgs.baselines)
+        print(f"\nBaselines saved to {ThisArgs.baselines}")
+        return 0
+
+    this_regressions = compare(
+        this_results,
+        this_baselines,
+        ThisArgs.time_tolerance,
+        ThisArgs.memory_tolerance
+    )
+    for _name_, _metric_, _baseline_, _result_ in this_regressions:
+        this_format = _format_time if _metric_ == 'time' else _format_bytes
+        print(
+            f"REGRESSION {_name_} {_metric_}: {this_format(_baseline_)} -> "
+            f"{this_format(_result_)}",
+            file=sys.stderr
+        )
+    return 1 if this_regressions else 0
@@ -1,2 +1,41 @@
-from .gitconfig_parser import GitConfigParser
-from .github_reports import GithubReports
+"""CloudMage GitUtils
+
+The package classes are exported lazily: each class module is imported the
+first time the class is accessed, so importing the package, or using only
+GitConfigParser, never imports PyGithub, jinja2 or progress.
+"""
+import importlib
+
+__all__ = [
+    'GitConfigParser',
+    'GithubNotifier',
+    'GithubReports',
+    'ReportExporter',
+    'ReportStats'
+]
+
+_LAZY_EXPORTS = {
+    'GitConfigParser': 'gitconfig_parser',
+    'GithubNotifier': 'github_notifier',
+    'GithubReports': 'github_reports',
+    'ReportExporter': 'report_exporter',
+    'ReportStats': 'report_stats'
+}
+
+
+def __getattr__(name):
+    """ Import and cache a package class on first access """
+    if name in _LAZY_EXPORTS:
+        this_module = importlib.import_module(
+            f".{_LAZY_EXPORTS[name]}",
+            __name__
+        )
+        this_value = getattr(this_module, name)
+        globals()[name] = this_value
+        return this_value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """ List the lazily exported classes alongside the module globals """
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,19 @@
+##############################################################################
+# CloudMage : GitUtils Command Line Entry Point
+# ============================================================================
+# Run with `python -m cloudmage.gitutils`, or the installed `gitutils` script.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+import sys
+
+# Import Package Modules
+from .cli import main
+
+sys.exit(main())
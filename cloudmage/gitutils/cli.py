@@ -0,0 +1,483 @@
+##############################################################################
+# CloudMage : GitUtils Command Line Interface
+# ============================================================================
+# CloudMage GitUtils CLI
+#   - `gitutils repo-info` prints the repository url, provider and user
+#     parsed from a .git/config file.
+#   - `gitutils open-prs` runs the open pull request report.
+#   - `gitutils daemon` serves the commands over a Unix socket from a long
+#     lived process, keeping Github connections, compiled templates and
+#     parsed configs warm between requests.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+from contextlib import redirect_stdout, redirect_stderr
+import socketserver
+import argparse
+import socket
+import json
+import io
+import os
+import sys
+
+# Import Package Modules
+from .gitconfig_parser import GitConfigParser
+from .report_planner import ReportPlanner
+from .search_query import SearchQuery
+
+
+######################################
+# Command Session:                   #
+######################################
+class CommandSession(object):
+    """ CloudMage GitUtils Command Session
+
+    Objects that are worth keeping between commands. A command run from the
+    shell uses a fresh session, the daemon keeps a single session for its
+    lifetime, so repeated commands reuse the Github connection and search
+    results of a GithubReports object, the compiled report templates, and
+    the parsed .git/config of every repository that was asked about.
+    """
+
+    def __init__(self):
+        """ CommandSession Constructor
+
+        Self Attributes:
+            self.reports (dict): GithubReports objects by token and url
+            self.configs (dict): GitConfigParser results by config path
+        """
+        self.reports = {}
+        self.configs = {}
+
+    def repo_info(self, path):
+        """ Return the parsed repository info of path
+
+        Cached results are reused until the .git/config file changes.
+        """
+        this_path = os.path.realpath(path)
+        this_config = os.path.join(this_path, '.git', 'config')
+        try:
+            this_mtime = os.stat(this_config).st_mtime_ns
+        except OSError:
+            this_mtime = None
+        this_cached = self.configs.get(this_path)
+        if this_cached is not None and this_cached[0] == this_mtime:
+            return this_cached[1]
+
+        ThisParser = GitConfigParser(this_path)
+        this_info = {
+            'path': this_path,
+            'url': ThisParser.url,
+            'provider': ThisParser.provider,
+            'user': ThisParser.user
+        }
+        self.configs[this_path] = (this_mtime, this_info)
+        return this_info
+
+    def github_reports(self, auth_token, base_url=None, verbose=False):
+        """ Return the GithubReports object for a token and API url """
+        # Imported here so repo-info never pays for the report modules.
+        from .github_reports import GithubReports
+
+        this_key = (auth_token, base_url, verbose)
+        if this_key not in self.reports:
+            self.reports[this_key] = GithubReports(
+                verbose=verbose,
+                auth_token=auth_token,
+                base_url=base_url
+            )
+        return self.reports[this_key]
+
+
+######################################
+# Commands:                          #
+######################################
+def _repo_info(args, session, env):
+    """ Print the repository info of each requested path """
+    for _path_ in args.paths or [os.getcwd()]:
+        this_info = session.repo_info(_path_)
+        if args.json:
+            print(json.dumps(this_info))
+        else:
+            for _key_ in ('path', 'url', 'provider', 'user'):
+                print(f"{_key_ + ':':<10}{this_info[_key_]}")
+    return 0
+
+
+def _open_prs(args, session, env):
+    """ Run the open pull request report """
+    this_token = args.token or env.get('GITHUB_TOKEN')
+    if not this_token:
+        print(
+            "A Github token is required, pass --token or set GITHUB_TOKEN.",
+            file=sys.stderr
+        )
+        return 2
+
+    ThisReport = session.github_reports(
+        this_token,
+        args.base_url or env.get('GITHUB_API_URL'),
+        args.verbose
+    )
+    ThisReport.repo_namespace = args.namespace
+    ThisReport.is_organization = args.org
+    ThisReport.open_pr_threshold = args.threshold
+    ThisReport.notify = args.notify
+    ThisReport.stale_only = args.stale_only
+    ThisReport.staleness = args.staleness
+    ThisReport.oldest_first = args.oldest_first
+    ThisReport.enumeration = args.enumeration
+    ThisReport.lean_hydration = args.lean
+    ThisReport.mergeability = not args.no_mergeability
+    ThisReport.raw_transport = args.raw
+    ThisReport.search_query = SearchQuery(
+        draft=False if args.no_drafts else None,
+        labels=args.labels or (),
+        exclude_labels=args.exclude_labels or (),
+        repos=args.repos or (),
+        exclude_repos=args.exclude_repos or (),
+        review=args.review
+    )
+    # Daemon sessions reuse the report object, so every option is applied
+    # on each command, the PyGithub default when the flag is left out.
+    ThisReport.request_interval = args.request_interval
+
+    # The report chatter goes to stderr, stdout only carries the result.
+    with redirect_stdout(sys.stderr):
+        this_results = ThisReport.search_open_pulls()
+        if this_results is None:
+            return 1
+        if args.output is None:
+            this_written = None
+        elif args.format == 'html':
+            this_written = ThisReport.write(
+                path=os.path.dirname(os.path.abspath(args.output)),
+                output_file=os.path.basename(args.output)
+            )
+        else:
+            this_written = ThisReport.export(args.output, args.format)
+    if args.output is not None and this_written is None:
+        return 1
+
+    if args.output is None:
+        for _pr_ in this_results:
+            print(
+                f"{_pr_['repository']}#{_pr_['number']}\t"
+                f"{_pr_['age_days']}d\t{_pr_['submitter']}\t{_pr_['link']}"
+            )
+    elif args.format == 'html':
+        print(this_written)
+    else:
+        print(os.path.abspath(args.output))
+    return 0
+
+
+def _build_parser():
+    """ Return the gitutils argument parser """
+    ThisParser = argparse.ArgumentParser(
+        prog='gitutils',
+        description="CloudMage git and Github report utilities."
+    )
+    ThisParser.add_argument(
+        '--socket', default=os.environ.get('GITUTILS_SOCKET'),
+        help="run commands through the daemon listening on this Unix "
+        "socket, falling back to running them in process "
+        "[default: $GITUTILS_SOCKET]"
+    )
+    ThisCommands = ThisParser.add_subparsers(dest='command', required=True)
+
+    ThisRepoInfo = ThisCommands.add_parser(
+        'repo-info',
+        help="print the url, provider and user of a git repository"
+    )
+    ThisRepoInfo.add_argument('paths', nargs='*', metavar='PATH')
+    ThisRepoInfo.add_argument('--json', action='store_true')
+    ThisRepoInfo.set_defaults(func=_repo_info)
+
+    ThisOpenPrs = ThisCommands.add_parser(
+        'open-prs',
+        help="report the open pull requests of a Github user or organization"
+    )
+    ThisOpenPrs.add_argument('namespace')
+    ThisOpenPrs.add_argument(
+        '--org', action='store_true',
+        help="the namespace is an organization"
+    )
+    ThisOpenPrs.add_argument('--threshold', type=int, default=5)
+    ThisOpenPrs.add_argument(
+        '--notify', action='store_true',
+        help="comment on pull requests open longer than the threshold"
+    )
+    ThisOpenPrs.add_argument(
+        '--token', default=None,
+        help="Github token [default: $GITHUB_TOKEN]"
+    )
+    ThisOpenPrs.add_argument(
+        '--base-url', default=None,
+        help="Github API url [default: $GITHUB_API_URL or api.github.com]"
+    )
+    ThisOpenPrs.add_argument('--request-interval', type=float, default=None)
+    ThisOpenPrs.add_argument(
+        '--stale-only', action='store_true',
+        help="only search for pull requests old enough to exceed the "
+        "threshold"
+    )
+    ThisOpenPrs.add_argument(
+        '--staleness', default='created', choices=('created', 'activity'),
+        help="measure ages from creation, or from the last commit, comment "
+        "or review [default: created]"
+    )
+    ThisOpenPrs.add_argument(
+        '--oldest-first', action='store_true',
+        help="collect and notify the oldest pull requests first"
+    )
+    ThisOpenPrs.add_argument(
+        '--no-drafts', action='store_true',
+        help="exclude draft pull requests"
+    )
+    ThisOpenPrs.add_argument(
+        '--label', action='append', dest='labels', metavar='LABEL',
+        help="only pull requests with any of these labels, repeatable"
+    )
+    ThisOpenPrs.add_argument(
+        '--exclude-label', action='append', dest='exclude_labels',
+        metavar='LABEL'
+    )
+    ThisOpenPrs.add_argument(
+        '--repo', action='append', dest='repos', metavar='REPO',
+        help="only pull requests in these repositories, repeatable"
+    )
+    ThisOpenPrs.add_argument(
+        '--exclude-repo', action='append', dest='exclude_repos',
+        metavar='REPO'
+    )
+    ThisOpenPrs.add_argument(
+        '--review', default=None, choices=SearchQuery.review_states
+    )
+    ThisOpenPrs.add_argument(
+        '--enumeration', default='auto',
+        choices=('auto',) + ReportPlanner.strategies,
+        help="how open pull requests are enumerated [default: auto, the "
+        "fastest for the namespace and rate limit budgets]"
+    )
+    ThisOpenPrs.add_argument(
+        '--lean', action='store_true',
+        help="build pull requests from the search results instead of "
+        "fetching each pull request"
+    )
+    ThisOpenPrs.add_argument(
+        '--no-mergeability', action='store_true',
+        help="leave the mergeable fields out of the report, so lean runs "
+        "never fetch pull requests"
+    )
+    ThisOpenPrs.add_argument(
+        '--raw', action='store_true',
+        help="decode API responses into compact records instead of "
+        "PyGithub objects"
+    )
+    ThisOpenPrs.add_argument(
+        '--format', default='html',
+        choices=('html', 'csv', 'jsonl', 'parquet', 'arrow')
+    )
+    ThisOpenPrs.add_argument(
+        '--output', default=None,
+        help="write the report to this file instead of listing the pull "
+        "requests on stdout"
+    )
+    ThisOpenPrs.add_argument('--verbose', action='store_true')
+    ThisOpenPrs.set_defaults(func=_open_prs)
+
+    ThisDaemon = ThisCommands.add_parser(
+        'daemon',
+        help="serve commands over a Unix socket from a warm process"
+    )
+    ThisDaemon.add_argument('action', choices=('start', 'stop', 'status'))
+    return ThisParser
+
+
+def run_command(argv, session=None, env=None):
+    """ Parse and run a repo-info or open-prs command
+
+    Parameters:
+        argv    (list): required
+        session (obj) : optional [default=new CommandSession]
+        env     (dict): optional [default=os.environ]
+
+    Returns:
+        Exit status of the command
+    """
+    try:
+        ThisArgs = _build_parser().parse_args(argv)
+    except SystemExit as e:
+        return e.code
+    if ThisArgs.command == 'daemon':
+        print("daemon commands can not be sent to a daemon", file=sys.stderr)
+        return 2
+    return ThisArgs.func(
+        ThisArgs,
+        session or CommandSession(),
+        os.environ if env is None else env
+    )
+
+
+######################################
+# Daemon:                            #
+######################################
+class _DaemonHandler(socketserver.StreamRequestHandler):
+    """ GitUtils Daemon Request Handler
+
+    Each connection carries one JSON request line, answered with one JSON
+    response line holding the exit status and the captured output.
+    """
+
+    def handle(self):
+        """ Run one command request """
+        this_request = json.loads(self.rfile.readline())
+        this_response = {'status': 0, 'stdout': '', 'stderr': ''}
+        if this_request.get('action') == 'stop':
+            this_response['stdout'] = "gitutils daemon stopped\n"
+            self.server.stopping = True
+        elif this_request.get('action') == 'status':
+            this_response['stdout'] = (
+                f"gitutils daemon running, pid {os.getpid()}, "
+                f"{self.server.handled} commands served\n"
+            )
+        else:
+            this_stdout = io.StringIO()
+            this_stderr = io.StringIO()
+            this_cwd = os.getcwd()
+            try:
+                os.chdir(this_request.get('cwd') or this_cwd)
+                with redirect_stdout(this_stdout), \
+                        redirect_stderr(this_stderr):
+                    this_response['status'] = run_command(
+                        this_request['argv'],
+                        self.server.session,
+                        this_request.get('env', {})
+                    )
+            except Exception as e:
+                print(f"gitutils daemon error: {e!r}", file=this_stderr)
+                this_response['status'] = 1
+            finally:
+                os.chdir(this_cwd)
+            this_response['stdout'] = this_stdout.getvalue()
+            this_response['stderr'] = this_stderr.getvalue()
+            self.server.handled += 1
+        self.wfile.write(json.dumps(this_response).encode() + b'\n')
+
+
+class GitUtilsDaemon(socketserver.UnixStreamServer):
+    """ CloudMage GitUtils Daemon
+
+    Serves commands from a single long lived CommandSession over a Unix
+    socket. Requests are handled one at a time, as commands change the
+    working directory and redirect the process output while they run. The
+    socket is only accessible to the user that started the daemon.
+    """
+
+    def __init__(self, socket_path):
+        """ GitUtilsDaemon Constructor
+
+        Parameters:
+            socket_path (str): required
+        """
+        if os.path.exists(socket_path):
+            # Replace a stale socket, but never a running daemon.
+            if _send(socket_path, {'action': 'status'}) is not None:
+                raise OSError(
+                    f"A gitutils daemon is already listening on {socket_path}"
+                )
+            os.remove(socket_path)
+        this_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, _DaemonHandler)
+        finally:
+            os.umask(this_umask)
+        self.socket_path = socket_path
+        self.session = CommandSession()
+        self.handled = 0
+        self.stopping = False
+
+    def serve(self):
+        """ Handle requests until a stop request is received """
+        try:
+            while not self.stopping:
+                self.handle_request()
+        finally:
+            self.server_close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+
+def _send(socket_path, request):
+    """ Send a request to the daemon, returning None if none is listening """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as ThisSocket:
+            ThisSocket.connect(socket_path)
+            ThisSocket.sendall(json.dumps(request).encode() + b'\n')
+            with ThisSocket.makefile('rb') as ThisResponse:
+                return json.loads(ThisResponse.readline())
+    except (OSError, ValueError):
+        return None
+
+
+def _daemon(socket_path, action):
+    """ Start, stop or query the daemon """
+    if not socket_path:
+        print("daemon commands require --socket or GITUTILS_SOCKET",
+              file=sys.stderr)
+        return 2
+    if action == 'start':
+        try:
+            ThisDaemon = GitUtilsDaemon(socket_path)
+        except OSError as e:
+            print(e, file=sys.stderr)
+            return 1
+        print(f"gitutils daemon listening on {socket_path}", flush=True)
+        ThisDaemon.serve()
+        return 0
+
+    this_response = _send(socket_path, {'action': action})
+    if this_response is None:
+        print(f"No gitutils daemon is listening on {socket_path}",
+              file=sys.stderr)
+        return 1
+    sys.stdout.write(this_response['stdout'])
+    return this_response['status']
+
+
+######################################
+# Entry Point:                       #
+######################################
+def main(argv=None):
+    """ gitutils command line entry point """
+    this_argv = sys.argv[1:] if argv is None else list(argv)
+    ThisArgs, _ = _build_parser().parse_known_args(this_argv)
+    if ThisArgs.command == 'daemon':
+        return _daemon(ThisArgs.socket, ThisArgs.action)
+
+    if ThisArgs.socket:
+        this_response = _send(ThisArgs.socket, {
+            'argv': this_argv,
+            'cwd': os.getcwd(),
+            'env': {
+                _key_: os.environ[_key_]
+                for _key_ in ('GITHUB_TOKEN', 'GITHUB_API_URL')
+                if _key_ in os.environ
+            }
+        })
+        if this_response is not None:
+            sys.stdout.write(this_response['stdout'])
+            sys.stderr.write(this_response['stderr'])
+            return this_response['status']
+    return run_command(this_argv)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
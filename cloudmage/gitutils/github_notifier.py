@@ -0,0 +1,517 @@
+##############################################################################
+# CloudMage : Github Pull Request Notification Dispatcher
+# ============================================================================
+# CloudMage Github Notifier
+#   - Queue pull request reminder comments during a report run, and publish
+#     them in a separate, throttled and concurrent dispatch stage.
+#   - Skip pull requests that already carry an identical reminder from today.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Package Modules
+from .thread_requesters import ThreadRequesters
+
+# Import Base Python Modules
+from contextlib import nullcontext
+from datetime import datetime, timezone
+import threading
+import hashlib
+import inspect
+import json
+import time
+import sys
+import os
+
+
+#####################
+# Class Definition: #
+#####################
+class GithubNotifier(object):
+    """ CloudMage Github Notification Dispatcher Class
+
+    This class is designed to collect the reminder comments that a report
+    run would like to publish, and publish them after the run has finished
+    collecting its data. Comment writes are issued concurrently, spaced
+    out to at most writes_per_minute. The spacing does not track the
+    hourly content creation limit of Github, so very large dispatches can
+    still be rejected by Github. Pull requests that already received an
+    identical reminder today are skipped, using a cache of comment body
+    hashes.
+
+    Pull requests of a GithubReports run send the requests of every worker
+    through a requester of its own. The Github calls on other pull
+    requests share the single connection of their PyGithub Requester, and
+    are serialized.
+    """
+
+    def __init__(
+        self,
+        verbose=False,
+        log=None,
+        max_workers=4,
+        writes_per_minute=80,
+        cache_path=None
+    ):
+        """ GithubNotifier Class Constructor
+
+        Parameters:
+            verbose           (bool): optional [default=False]
+            log               (obj) : optional [default=None]
+            max_workers       (int) : optional [default=4]
+            writes_per_minute (int) : optional [default=80]
+            cache_path        (str) : optional [default=None]
+
+        Self Attributes:
+            self._verbose           (bool) : private
+            self._log               (obj)  : private
+            self._log_context       (str)  : private
+            self._max_workers       (int)  : private
+            self._write_interval    (float): private
+            self._cache_path        (str)  : private
+            self._cache_date        (str)  : private
+            self._comment_hashes    (dict) : private
+            self._queue             (list) : private
+            self._next_write        (float): private
+            self._lock              (obj)  : private
+            self._request_lock      (obj)  : private
+            self._stats             (dict) : private
+        Properties:
+            self.pending            (int)  : public
+            self.stats              (dict) : public
+
+        Methods:
+            self._exception_handler()
+            self.log()
+            self.comment_hash()
+            self.is_published()
+            self.enqueue()
+            self.dispatch()
+        """
+        # Check the passed value to ensure its a bool before assignment.
+        if verbose is not None and isinstance(verbose, bool):
+            self._verbose = verbose
+        else:
+            self._verbose = False
+
+        # Check to ensure that the passed log object is in fact an object,
+        # and has the proper attributes, if not don't assign.
+        if (
+            log is not None and isinstance(log, object) and
+            hasattr(log, 'debug') and hasattr(log, 'info') and
+            hasattr(log, 'warning') and hasattr(log, 'error')
+        ):
+            self._log = log
+        else:
+            self._log = None
+
+        self._log_context = "CLS->GithubNotifier"
+
+        # Concurrency and throttle settings, fall back to the defaults
+        # if the passed values are not positive ints.
+        if (
+            isinstance(max_workers, int) and
+            not isinstance(max_workers, bool) and
+            max_workers > 0
+        ):
+            self._max_workers = max_workers
+        else:
+            self._max_workers = 4
+
+        if (
+            isinstance(writes_per_minute, int) and
+            not isinstance(writes_per_minute, bool) and
+            writes_per_minute > 0
+        ):
+            self._write_interval = 60.0 / writes_per_minute
+        else:
+            self._write_interval = 60.0 / 80
+
+        # Comment hash cache, optionally persisted to disk between runs.
+        if cache_path is not None and isinstance(cache_path, str):
+            self._cache_path = cache_path
+        else:
+            self._cache_path = None
+
+        self._cache_date = self._today()
+        self._comment_hashes = {}
+        self._queue = []
+        self._next_write = 0.0
+        self._lock = threading.Lock()
+        self._request_lock = threading.Lock()
+        self._stats = {
+            'cache_hits': 0,
+            'cache_misses': 0,
+            'throttle_waits': 0,
+            'throttle_seconds': 0.0
+        }
+        self._load_cache()
+
+    ############################################
+    # Class Exception Handler:                 #
+    ############################################
+    def _exception_handler(self, caller_function, exception_object):
+        """ Class Exception Handler
+
+        Handle any exceptions that arise in a universal format
+        for easy debuging purposes.
+
+        Parameters:
+            caller_function  (str):  required
+            exception_object (obj):  required
+
+        Returns:
+            Publish properly formatted exceptions
+            to log object or stdout, stderr
+        """
+        this_exception_msg = (
+            "EXCEPTION occurred in: "
+            f"{self._log_context}.{caller_function}, on line "
+            f"{sys.exc_info()[2].tb_lineno}: -> {str(exception_object)}"
+        )
+        self.log(this_exception_msg, 'error', caller_function)
+
+    ############################################
+    # Class Logger:                            #
+    ############################################
+    def log(self, log_msg, log_type, log_id):
+        """ Class Log Handler
+
+        Provides the logging for this class. If the class caller instantiates
+        the object with the verbose setting set to true, then the class will
+        log to stdout/stderr or to a provided log object if one was passed
+        during object instantiation.
+
+        Parameters:
+            log_msg  (str):  required
+            log_type (str):  required
+            log_id   (str):  required
+
+        Returns:
+            Log Stream
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        try:
+            # Internal method variable assignments:
+            this_log_msg_caller = f"{self._log_context}.{log_id}"
+
+            # Set the log message offset based on the message type:
+            # [debug=3, info=4, warning=1, error=3]
+            this_log_msg_offset = 3
+            if log_type.lower() == 'info':
+                this_log_msg_offset = 4
+            elif log_type.lower() == 'warning':
+                this_log_msg_offset = 1
+
+            # If a valid log object was passed into the class constructor,
+            # publish the log to the log object:
+            if self._log is not None:
+                # Set the log message prefix
+                this_log_message = f"{this_log_msg_caller}: -> {log_msg}"
+                if log_type.lower() == 'error':
+                    self._log.error(this_log_message)
+                elif log_type.lower() == 'warning':
+                    self._log.warning(this_log_message)
+                elif log_type.lower() == 'info':
+                    self._log.info(this_log_message)
+                else:
+                    self._log.debug(this_log_message)
+            # If no valid log object was passed into the class constructor,
+            # write the message to stdout, stderr:
+            else:
+                this_log_message = "{}    {}{}{}: -> {}".format(
+                    datetime.now(),
+                    log_type.upper(),
+                    " " * this_log_msg_offset,
+                    this_log_msg_caller,
+                    log_msg
+                )
+                if log_type.lower() == 'error':
+                    print(this_log_message, file=sys.stderr)
+                else:
+                    if self._verbose:
+                        print(this_log_message, file=sys.stdout)
+        except Exception as e:
+            self._exception_handler(__id, e)
+
+    ############################################
+    # Comment Hash Cache:                      #
+    ############################################
+    @staticmethod
+    def _today():
+        """ Return the current UTC date as an ISO formatted string. """
+        return datetime.now(timezone.utc).date().isoformat()
+
+    @staticmethod
+    def _pull_key(pull_request):
+        """ Return the cache key used to identify a pull request.
+
+        Accepts either a pull request object or its html url string.
+        """
+        return str(getattr(pull_request, 'html_url', pull_request))
+
+    @staticmethod
+    def comment_hash(comment_body):
+        """ Comment Body Hash
+
+        Return a sha256 digest of the provided comment body. Surrounding
+        whitespace is ignored so that a reminder still matches itself after
+        Github trims the stored comment body.
+        """
+        return hashlib.sha256(
+            str(comment_body).strip().encode('utf-8')
+        ).hexdigest()
+
+    def _load_cache(self):
+        """ Load today's comment hashes from the cache file if one is set. """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        if self._cache_path is None or not os.path.exists(self._cache_path):
+            return
+
+        try:
+            with open(self._cache_path) as f:
+                this_cache = json.load(f)
+
+            # Hashes recorded on a previous day no longer count as a
+            # reminder from today, so only load a cache from today.
+            if this_cache.get('date') == self._cache_date:
+                for _key_, _hashes_ in this_cache.get('comments', {}).items():
+                    self._comment_hashes[_key_] = set(_hashes_)
+            self.log(
+                f"Loaded {len(self._comment_hashes)} cached pull request "
+                f"comment hash entries from {self._cache_path}",
+                'debug',
+                __id
+            )
+        except Exception as e:
+            self.log(
+                f"Unable to load comment hash cache: {self._cache_path}",
+                'warning',
+                __id
+            )
+            self._exception_handler(__id, e)
+
+    def _save_cache(self):
+        """ Persist the comment hash cache if a cache file is set. """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        if self._cache_path is None:
+            return
+
+        try:
+            with open(self._cache_path, 'w') as f:
+                json.dump(
+                    {
+                        'date': self._cache_date,
+                        'comments': {
+                            _key_: sorted(_hashes_)
+                            for _key_, _hashes_ in self._comment_hashes.items()
+                        }
+                    },
+                    f
+                )
+        except Exception as e:
+            self.log(
+                f"Unable to write comment hash cache: {self._cache_path}",
+                'warning',
+                __id
+            )
+            self._exception_handler(__id, e)
+
+    def _roll_cache(self):
+        """ Drop cached hashes once the UTC date has changed. """
+        this_today = self._today()
+        if this_today != self._cache_date:
+            self._cache_date = this_today
+            self._comment_hashes = {}
+
+    def _requests(self, pull_request):
+        """ Return the context the Github calls on a pull request run in
+
+        Serializes the calls, unless the pull request sends the requests
+        of each thread through a requester of its own.
+        """
+        this_requester = getattr(pull_request, 'requester', None)
+        if isinstance(this_requester, ThreadRequesters):
+            return nullcontext()
+        return self._request_lock
+
+    def _fetch_hashes(self, pull_request):
+        """ Collect the hashes of comments published on the PR today. """
+        this_hashes = set()
+        for _comment_ in pull_request.get_issue_comments():
+            this_created = _comment_.created_at
+            if this_created.tzinfo is None:
+                this_created = this_created.replace(tzinfo=timezone.utc)
+            this_created = this_created.astimezone(timezone.utc)
+            if this_created.date().isoformat() == self._cache_date:
+                this_hashes.add(self.comment_hash(_comment_.body))
+        return this_hashes
+
+    def is_published(self, pull_request, comment_body, fetch=True):
+        """ GithubNotifier Published Comment Check
+
+        Return True if an identical comment was already published on the
+        given pull request today. Cached hashes are checked first, and the
+        pull requests comments are only fetched when the cache does not yet
+        know the pull request and fetch is enabled.
+        """
+        this_key = self._pull_key(pull_request)
+        with self._lock:
+            self._roll_cache()
+            this_hashes = self._comment_hashes.get(this_key)
+            if this_hashes is not None:
+                self._stats['cache_hits'] += 1
+            elif fetch:
+                self._stats['cache_misses'] += 1
+
+        if this_hashes is None:
+            if not fetch:
+                return False
+            with self._requests(pull_request):
+                this_hashes = self._fetch_hashes(pull_request)
+            with self._lock:
+                this_hashes |= self._comment_hashes.get(this_key, set())
+                self._comment_hashes[this_key] = this_hashes
+
+        return self.comment_hash(comment_body) in this_hashes
+
+    ############################################
+    # Dispatch Queue:                          #
+    ############################################
+    @property
+    def pending(self):
+        """ pending Property Getter
+
+        Getter method for the pending property.
+        This method will return the number of queued notifications.
+        """
+        return len(self._queue)
+
+    @property
+    def stats(self):
+        """ stats Property Getter
+
+        Getter method for the stats property.
+        This method will return a copy of the comment hash cache hit and
+        miss counts, and the number and total seconds of throttle waits.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def enqueue(self, pull_request, comment_body):
+        """ GithubNotifier Queue Notification
+
+        Queue a comment to be published on the given pull request when the
+        dispatch() method is called. Queuing never performs a Github call.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self._queue.append((pull_request, comment_body))
+        self.log(
+            f"Queued notification for: {self._pull_key(pull_request)}",
+            'debug',
+            __id
+        )
+
+    def _throttle(self):
+        """ Block until the next comment write is allowed. """
+        with self._lock:
+            this_now = time.monotonic()
+            this_slot = max(this_now, self._next_write)
+            self._next_write = this_slot + self._write_interval
+            this_wait = this_slot - this_now
+            if this_wait > 0:
+                self._stats['throttle_waits'] += 1
+                self._stats['throttle_seconds'] += this_wait
+        if this_wait > 0:
+            time.sleep(this_wait)
+
+    def _publish(self, pull_request, comment_body):
+        """ Publish a single queued comment unless it is a duplicate. """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        this_key = self._pull_key(pull_request)
+
+        try:
+            if self.is_published(pull_request, comment_body):
+                self.log(
+                    f"Identical notification already published today on: "
+                    f"{this_key}, skipping.",
+                    'info',
+                    __id
+                )
+                return 'skipped'
+
+            self._throttle()
+            with self._requests(pull_request):
+                pull_request.create_issue_comment(comment_body)
+            with self._lock:
+                self._comment_hashes.setdefault(this_key, set()).add(
+                    self.comment_hash(comment_body)
+                )
+            self.log(
+                f"Notification published on: {this_key}",
+                'info',
+                __id
+            )
+            return 'published'
+        except Exception as e:
+            self.log(
+                f"Failed to publish notification on: {this_key}",
+                'error',
+                __id
+            )
+            self._exception_handler(__id, e)
+            return 'failed'
+
+    def dispatch(self):
+        """ GithubNotifier Notification Dispatcher
+
+        Publish all queued notifications concurrently, spacing the comment
+        writes to stay within the configured writes per minute. Returns a
+        dictionary with the published, skipped and failed counts.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} method called.", 'info', __id)
+
+        this_summary = {'published': 0, 'skipped': 0, 'failed': 0}
+        this_queue, self._queue = self._queue, []
+
+        # Collapse duplicate queue entries for the same pull request.
+        this_unique = {}
+        for _pull_, _body_ in this_queue:
+            this_unique.setdefault(
+                (self._pull_key(_pull_), self.comment_hash(_body_)),
+                (_pull_, _body_)
+            )
+        this_summary['skipped'] += len(this_queue) - len(this_unique)
+
+        if this_unique:
+            # concurrent.futures imports logging, so it waits until needed.
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_workers, len(this_unique))
+            ) as ThisExecutor:
+                for _result_ in ThisExecutor.map(
+                    lambda _item_: self._publish(*_item_),
+                    this_unique.values()
+                ):
+                    this_summary[_result_] += 1
+
+        self._save_cache()
+        self.log(
+            f"Notification dispatch completed: {this_summary}",
+            'info',
+            __id
+        )
+        return this_summary
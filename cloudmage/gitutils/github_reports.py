@@ -12,18 +12,117 @@
 ###############
 # Imports:    #
 ###############
-# Import Pip Installed Modules:
-# from cloudmage.jinjautils import JinjaUtils
-from github import Github
-from progress.bar import Bar
+# Pip Installed Modules (jinja2, PyGithub, progress) are imported on first
+# use, so importing the package does not pay for their import graphs.
+
+# Import Package Modules
+from .github_notifier import GithubNotifier
+from .report_exporter import ReportExporter
+from .report_stats import ReportStats
+from .page_prefetcher import PagePrefetcher
+from .raw_transport import RawPull, RawTransport
+from .report_planner import ReportPlanner
+from .report_profiler import ReportProfiler
+from .report_progress import NullProgress, TerminalProgress
+from .review_states import ReviewerStates
+from .search_partitioner import SearchPartitioner
+from .search_query import SearchQuery
+from .thread_requesters import ThreadRequesters
 
 # Import Base Python Modules
-from datetime import datetime, timezone
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+import functools
 import inspect
 import sys
+import threading
+import time
 import os
 
 
+# GraphQL search for open pull requests, one page of pull request nodes
+# holding the fields formatted in.
+_GRAPHQL_SEARCH_TEMPLATE = """
+query($query: String!, $first: Int!, $after: String) {
+  search(query: $query, type: ISSUE, first: $first, after: $after) {
+    issueCount
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {%s
+      }
+    }
+  }
+}
+"""
+
+# Pull request node fields the last activity time is read from. The last
+# few comments are read, as the reminders of the viewer are not activity.
+_GRAPHQL_ACTIVITY_FIELDS = """
+        databaseId
+        number
+        createdAt
+        repository { nameWithOwner }
+        commits(last: 1) { nodes { commit { committedDate } } }
+        comments(last: 10) { nodes { createdAt viewerDidAuthor } }
+        reviews(last: 1) { nodes { submittedAt } }"""
+
+# Pull request node fields lean hydration builds pull requests from.
+_GRAPHQL_PULL_FIELDS = """
+        title
+        body
+        url
+        state
+        isDraft
+        updatedAt
+        mergedAt
+        author { login }"""
+
+# Pull request node fields the review request times are read from.
+_GRAPHQL_REVIEW_REQUEST_FIELDS = """
+        timelineItems(itemTypes: [REVIEW_REQUESTED_EVENT], last: 20) {
+          nodes {
+            ... on ReviewRequestedEvent {
+              createdAt
+              requestedReviewer {
+                ... on User { login }
+                ... on Team { slug }
+              }
+            }
+          }
+        }"""
+
+# GraphQL open pull request count of each repository of an organization
+# or user namespace, formatted with the root field.
+_GRAPHQL_INVENTORY_QUERY = """
+query($login: String!, $first: Int!, $after: String) {
+  %s(login: $login) {
+    repositories(
+      first: $first, after: $after, ownerAffiliations: [OWNER]
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        nameWithOwner
+        pullRequests(states: OPEN) { totalCount }
+      }
+    }
+  }
+}
+"""
+
+
+######################################
+# Run Profiling Decorator:           #
+######################################
+def _profiled(method):
+    """ Profile a GithubReports run method when a profile_path is set """
+    @functools.wraps(method)
+    def profiled_method(self, *args, **kwargs):
+        if self._profile_path is None:
+            return method(self, *args, **kwargs)
+        return self._run_profiled(method, *args, **kwargs)
+    return profiled_method
+
+
 #####################
 # Class Definition: #
 #####################
@@ -35,37 +134,124 @@ class GithubReports(object):
     can be automated, and produced on a scheduled interval.
     """
 
-    def __init__(self, verbose=False, log=None, auth_token=None):
+    # Compiled report templates shared by all instances, keyed by
+    # (template directory, template name).
+    _template_cache = {}
+
+    # Github returns at most this many results per search query, larger
+    # result sets are collected in partitioned slices of the search.
+    search_result_cap = SearchPartitioner.result_cap
+
+    # Number of search slices collected concurrently.
+    search_workers = 4
+
+    # Search and listing pages fetched ahead of the page being hydrated,
+    # 0 fetches each page once the previous page was hydrated.
+    page_read_ahead = 1
+
+    # Pull requests whose mergeability Github is still computing are polled
+    # after the main scan, in batches of mergeability_batch concurrent
+    # requests, for up to mergeability_polls rounds that start
+    # mergeability_poll_interval seconds apart.
+    mergeability_batch = 20
+    mergeability_polls = 3
+    mergeability_poll_interval = 2.0
+
+    # Times search_open_pulls can measure pull request ages from.
+    staleness_modes = ('created', 'activity')
+
+    # Run statistics stage of each enumeration strategy.
+    enumeration_stages = {
+        'search': 'search_issues',
+        'list': 'list_pulls',
+        'graphql': 'graphql_search'
+    }
+
+    def __init__(
+        self,
+        verbose=False,
+        log=None,
+        auth_token=None,
+        base_url=None,
+        profile_path=None
+    ):
         """ GithubReports Class Constructor
 
         Parameters:
-            _verbose    (bool): optional [default=False]
-            _log        (obj) : optional [default=None]
-            _auth_token (str) : optional [default=None]
+            _verbose      (bool): optional [default=False]
+            _log          (obj) : optional [default=None]
+            _auth_token   (str) : optional [default=None]
+            _base_url     (str) : optional [default=None]
+            _profile_path (str) : optional [default=$GITUTILS_PROFILE]
 
         Self Attributes:
             self._verbose             (bool) : private
             self._log                 (obj)  : private
             self._log_context         (str)  : private
             self._auth_token          (str)  : private
+            self._base_url            (str)  : private
+            self._request_interval    (float): private
             self._repo_namespace      (str)  : private
             self._is_organization     (bool) : private
             self._notify              (bool) : private
             self._open_pr_threshold   (int)  : private
+            self._review_history      (bool) : private
+            self._search_query        (obj)  : private
+            self._stale_only          (bool) : private
+            self._staleness           (str)  : private
+            self._oldest_first        (bool) : private
+            self._last_activity       (dict) : private
+            self._review_requests     (dict) : private
+            self._enumeration         (str)  : private
+            self._enumeration_plan    (dict) : private
+            self._lean_hydration      (bool) : private
+            self._mergeability        (bool) : private
+            self._raw_transport       (bool) : private
             self._search_results      (obj)  : private
+            self._repository_cache    (dict) : private
+            self._repository_lock     (obj)  : private
+            self._user_cache          (dict) : private
+            self._github              (obj)  : private
+            self._github_key          (tuple): private
+            self._notifier            (obj)  : private
+            self._progress            (obj)  : private
+            self._stats               (obj)  : private
+            self._profile_path        (str)  : private
+            self._profiler            (str)  : private
         Properties:
             self.verbose             (bool) : public
             self.auth_token          (str)  : public
+            self.base_url            (str)  : public
+            self.request_interval    (float): public
             self.repo_namespace      (str)  : public
             self.is_organization     (bool) : public
             self.notify              (bool) : public
             self.open_pr_threshold   (int)  : public
+            self.review_history      (bool) : public
+            self.search_query        (obj)  : public
+            self.stale_only          (bool) : public
+            self.staleness           (str)  : public
+            self.oldest_first        (bool) : public
+            self.enumeration         (str)  : public
+            self.enumeration_plan    (dict) : public
+            self.lean_hydration      (bool) : public
+            self.mergeability        (bool) : public
+            self.raw_transport       (bool) : public
             self.template_path       (str)  : public
+            self.notifier            (obj)  : public
+            self.progress            (obj)  : public
+            self.stats               (obj)  : public
+            self.profile_path        (str)  : public
+            self.profiler            (str)  : public
 
         Methods:
             self._exception_handler()
             self.log()
             self.search_open_pulls()
+            self.notification_plan()
+            self.write()
+            self.export()
+            self.export_stats()
         """
         # Class Public Properties and Attributes ######
         # Check the passed value to ensure its a bool before assignment.
@@ -91,6 +277,27 @@ class GithubReports(object):
         else:
             self._auth_token = None
 
+        # Set the Github API url, None targets the public Github API.
+        if base_url is not None and isinstance(base_url, str):
+            self._base_url = base_url
+        else:
+            self._base_url = None
+
+        # Profile report runs to this file, the GITUTILS_PROFILE and
+        # GITUTILS_PROFILER environment variables enable profiling of
+        # existing integrations without code changes.
+        if profile_path is None:
+            profile_path = os.environ.get('GITUTILS_PROFILE') or None
+        if profile_path is not None and isinstance(profile_path, str):
+            self._profile_path = profile_path
+        else:
+            self._profile_path = None
+
+        if os.environ.get('GITUTILS_PROFILER') in ReportProfiler.profilers:
+            self._profiler = os.environ['GITUTILS_PROFILER']
+        else:
+            self._profiler = 'cprofile'
+
         self._log_context = "CLS->GitHubReports"
 
         # Class Private Properties and Attributes #
@@ -99,9 +306,33 @@ class GithubReports(object):
         self._is_organization = False           # IS_ORG
         self._notify = False                    # NOTIFY
         self._open_pr_threshold = 5             # OPEN_THRESHOLD
+        self._review_history = False            # Collect Review Timeline
+        self._search_query = SearchQuery()      # Search Filters
+        self._stale_only = False                # Skip PRs Within Threshold
+        self._staleness = 'created'             # Age Measured From
+        self._oldest_first = False              # Enumerate Oldest First
+        self._last_activity = {}                # Run Last Activity By PR
+        self._review_requests = {}              # Run Review Requests By PR
+        self._enumeration = 'auto'              # Enumeration Strategy
+        self._enumeration_plan = None           # Last Enumeration Plan
+        self._lean_hydration = False            # Hydrate From Search Results
+        self._mergeability = True               # Report Mergeable State
+        self._raw_transport = False             # Decode JSON To Records
+        self._request_interval = None           # PyGithub Default Throttle
         self._search_results = None             # Hold Search Results
+        self._repository_cache = {}             # Run Repositories By Name
+        self._repository_lock = threading.Lock()  # Repository Cache Guard
+        self._user_cache = {}                   # Run User Logins
+        self._github = None                     # Reused API Connector
+        self._github_key = None                 # API Connector Settings
+        self._notifier = GithubNotifier(        # Comment Dispatcher
+            verbose=self._verbose,
+            log=self._log
+        )
+        self._stats = ReportStats()             # Run Instrumentation
+        self._progress = None                   # Progress Sink, None=auto
         self._template_path = os.path.join(
-            os.getcwd(),
+            os.path.dirname(os.path.abspath(__file__)),
             "templates"
         )
 
@@ -292,6 +523,181 @@ class GithubReports(object):
                 __id
             )
 
+    ################################################
+    # Base_URL Setter / Getter Methods:            #
+    ################################################
+    @property
+    def base_url(self):
+        """ Base URL Property Getter
+
+        Getter method for the base_url property.
+        This method will return the base_url setting.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, base_url):
+        """ base_url Property Setter
+
+        Setter method for the base_url property.
+        This method will set the Github API url used for all calls if a
+        valid str value is provided, such as a Github Enterprise API url or
+        a local GithubStubServer url.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        if base_url is not None and isinstance(base_url, str):
+            self._base_url = base_url
+            self.log(
+                f"Updated {__id} property with value: {self._base_url}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected type str "
+                f"but received type: {type(base_url)}",
+                'error',
+                __id
+            )
+
+    # self.request_interval
+    @property
+    def request_interval(self):
+        """ request_interval Property Getter
+
+        Getter method for GithubReports _request_interval property.
+        This method returns the minimum number of seconds between two
+        Github API requests, None uses the PyGithub default.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._request_interval
+
+    @request_interval.setter
+    def request_interval(self, request_interval):
+        """ request_interval Property Setter
+
+        Setter method for GithubReports _request_interval property.
+        This method will take an int or float value of zero or more, or
+        None to restore the PyGithub default, and assign it to the
+        request_interval property. A local GithubStubServer can be queried
+        with an interval of 0.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        # if the passed value is a valid number then set the value.
+        if request_interval is None or (
+            isinstance(request_interval, (int, float)) and
+            not isinstance(request_interval, bool) and
+            request_interval >= 0
+        ):
+            self._request_interval = request_interval
+            self.log(
+                f"Updated {__id} property with value: "
+                f"{self._request_interval}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected a positive int or float "
+                f"but received type: {type(request_interval)}",
+                'error',
+                __id
+            )
+
+    # self.profile_path
+    @property
+    def profile_path(self):
+        """ profile_path Property Getter
+
+        Getter method for GithubReports _profile_path property.
+        This method returns the file that report runs are profiled to,
+        None when profiling is disabled.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._profile_path
+
+    @profile_path.setter
+    def profile_path(self, profile_path):
+        """ profile_path Property Setter
+
+        Setter method for GithubReports _profile_path property.
+        This method will take a file path string, or None to disable
+        profiling, and assign it to the profile_path property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        # if the passed value is a valid string or None then set the value.
+        if profile_path is None or isinstance(profile_path, str):
+            self._profile_path = profile_path
+            self.log(
+                f"Updated {__id} property with value: {self._profile_path}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected type str "
+                f"but received type: {type(profile_path)}",
+                'error',
+                __id
+            )
+
+    # self.profiler
+    @property
+    def profiler(self):
+        """ profiler Property Getter
+
+        Getter method for GithubReports _profiler property.
+        This method returns the profiler used when profile_path is set.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._profiler
+
+    @profiler.setter
+    def profiler(self, profiler):
+        """ profiler Property Setter
+
+        Setter method for GithubReports _profiler property.
+        This method will take one of cprofile (deterministic) or
+        pyinstrument (sampling), and assign it to the profiler property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        # if the passed value is a supported profiler then set the value.
+        if profiler in ReportProfiler.profilers:
+            self._profiler = profiler
+            self.log(
+                f"Updated {__id} property with value: {self._profiler}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected one of "
+                f"{ReportProfiler.profilers} but received: {profiler}",
+                'error',
+                __id
+            )
+
     ############################################
     # GithubReports Getters and Setters:        #
     ############################################
@@ -480,386 +886,2277 @@ class GithubReports(object):
                 __id
             )
 
-    ############################################
-    # Class Methods:                           #
-    ############################################
-    def search_open_pulls(self, auth_token=None, repo_namespace=None):
-        """ GithubReports Open Pull Request Report Collector
-
-        GithubReports method that will perform a search for all
-        open pull requests and construct a return object that will
-        contain a list of dictionaries with relevant pull request
-        data
+    # self.review_history
+    @property
+    def review_history(self):
+        """ review_history Property Getter
 
-        Search filters can be found on githubs documentation page:
-        https://help.github.com/en/github/
-        searching-for-information-on-github/searching-issues-and-pull-requests
+        Getter method for GithubReports _review_history property.
+        This method returns a bool value indicating if search_open_pulls
+        will collect the review timeline of each pull request.
         """
         # Define this methods identity for functional logging:
         __id = inspect.stack()[0][3]
-        self.log(f"{__id} method called.", 'info', __id)
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._review_history
 
-        # Check the passed auth_token, if it has a value, then
-        # set the auth_token property.
-        if auth_token is not None and isinstance(auth_token, str):
-            self._auth_token = auth_token
+    @review_history.setter
+    def review_history(self, review_history=False):
+        """ review_history Property Setter
 
-        # Check the passed repo_namespace, if it has a value, then
-        # set the repo_namespace property.
-        if repo_namespace is not None and isinstance(repo_namespace, str):
-            self._repo_namespace = repo_namespace
+        Setter method for GithubReports _review_history property.
+        This method will take a bool value, validate it
+        is a bool value, and assign it to the review_history property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
 
-        # Test to ensure required args have been provided
-        if self._auth_token is None:
+        # if the passed value is a valid bool value then set the value.
+        if (
+            review_history is not None and
+            isinstance(review_history, bool)
+        ):
+            self._review_history = review_history
             self.log(
-                "Github auth_token required to call this method! "
-                "The auth_token can be set by passing the method argument "
-                "search_open_pulls(auth_token=<token>) or by setting the "
-                "token using the property setter method "
-                "Obj.auth_token = <token> before calling the "
-                "search_open_pulls() method.",
-                'error',
+                f"Updated {__id} property with value: "
+                f"{self._review_history}",
+                'info',
                 __id
             )
-            return None
-        elif self._repo_namespace is None:
+        else:
             self.log(
-                "Github repo_namespace required to call this method! "
-                "The repo_namespace can be set by passing the method "
-                "argument search_open_pulls(repo_namespace=<namespace>) "
-                "or by setting the namespace using the property setter "
-                "method Obj.repo_namespace = <namespace> before calling the "
-                "search_open_pulls() method. If the repository is an "
-                "organization repository, then Obj.is_organization = True "
-                "must also be set or user repositories will be searched "
-                "instead of organization repositories.",
+                f"{__id} property argument expected type bool "
+                f"but received type: {type(review_history)}",
                 'error',
                 __id
             )
-            return None
 
-        this_call_message = (
-            f"Constructing search query for {self._repo_namespace} "
-            "repository namespace...\n"
-            "\tOpen Pull Request Threshold: "
-            f"{' ' * 9}{self._open_pr_threshold} days\n"
-            "\tNotifications Enabled: "
-            f"{' ' * 15}{self._notify}\n"
-            "\tRepository Namespace is Organization: "
-            f"{self._is_organization}\n"
-            "\tVerbose Mode Enabled: "
-            f"{' ' * 16}{self._verbose}\n"
-        )
-        print(this_call_message)
-        self.log(this_call_message, 'debug', __id)
+    # self.search_query
+    @property
+    def search_query(self):
+        """ search_query Property Getter
 
-        # Prep the search_results internal property to store the
-        # expected result set
-        self._search_results = []
+        Getter method for GithubReports _search_query property.
+        This method returns the SearchQuery object holding the filters
+        that search_open_pulls passes to the Github search API.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._search_query
 
-        # Instantiate the Github Object and Search for Open Pull Requests
-        try:
-            # Instantiate a Github object using the Provided Github Token.
-            ThisGithub = Github(self._auth_token, per_page=100)
+    @search_query.setter
+    def search_query(self, search_query):
+        """ search_query Property Setter
+
+        Setter method for GithubReports _search_query property.
+        This method will take a SearchQuery object, validate it is a
+        SearchQuery object, and assign it to the search_query property. The
+        namespace of the query is always replaced by the repo_namespace and
+        is_organization properties when a search runs.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        if search_query is not None and isinstance(search_query, SearchQuery):
+            self._search_query = search_query
             self.log(
-                f"Instantiated Github API Connector Object",
-                'debug',
+                f"Updated {__id} property with value: {self._search_query}",
+                'info',
                 __id
             )
-        except Exception as e:
-            ThisGithubException = (
-                "An un-expected error occurred when attempting to "
-                "instantiate a new Github API Connector object."
-            )
-            print(f"{ThisGithubException}\n")
-            self.log(ThisGithubException, 'error', __id)
-            self._exception_handler(__id, e)
-            return None
-
-        # Construct the Github Issue Query
-        try:
-            if self._is_organization:
-                ThisSearchResults = ThisGithub.search_issues(
-                    'is:unmerged',
-                    org=self._repo_namespace,
-                    state='open',
-                    type='pr'
-                )
-            else:
-                ThisSearchResults = ThisGithub.search_issues(
-                    'is:unmerged',
-                    user=self._repo_namespace,
-                    state='open',
-                    type='pr'
-                )
+        else:
             self.log(
-                f"Search Results: {ThisSearchResults.totalCount} "
-                "open PullRequests were returned!",
-                'debug',
+                f"{__id} property argument expected type SearchQuery "
+                f"but received type: {type(search_query)}",
+                'error',
                 __id
             )
 
-            print(
-                "Open PR Search returned "
-                f"{ThisSearchResults.totalCount} results"
-            )
-        except Exception as e:
-            ThisSearchResultsException = (
-                "An un-expected error occurred when attempting to "
-                "perform a Github issue search for open PRs."
-            )
-            print(f"{ThisSearchResultsException}\n")
-            self.log(ThisSearchResultsException, 'error', __id)
-            self._exception_handler(__id, e)
-            return None
+    # self.stale_only
+    @property
+    def stale_only(self):
+        """ stale_only Property Getter
 
-        # If no results were returned then exit gracefully
-        if ThisSearchResults.totalCount == 0:
-            print("Search completed. Exiting search...")
+        Getter method for GithubReports _stale_only property.
+        This method returns a bool value indicating if search_open_pulls
+        will only search for pull requests old enough to exceed the
+        open_pr_threshold.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._stale_only
+
+    @stale_only.setter
+    def stale_only(self, stale_only=False):
+        """ stale_only Property Setter
+
+        Setter method for GithubReports _stale_only property.
+        This method will take a bool value, validate it
+        is a bool value, and assign it to the stale_only property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        # if the passed value is a valid bool value then set the value.
+        if stale_only is not None and isinstance(stale_only, bool):
+            self._stale_only = stale_only
             self.log(
-                f"0 results returned, exiting search function...",
+                f"Updated {__id} property with value: {self._stale_only}",
                 'info',
                 __id
             )
-            return None
         else:
-            print("Validating Search Results...\n")
-            ThisSearchProgress = Bar(
-                'Processing',
-                max=ThisSearchResults.totalCount
+            self.log(
+                f"{__id} property argument expected type bool "
+                f"but received type: {type(stale_only)}",
+                'error',
+                __id
             )
 
-            this_open_exceeded_pr_comment = (
-                f"has been open for {self._open_pr_threshold} days or "
-                "longer. Please review the pull request, and merge or "
-                "close at the earliest convenience. This reminder "
-                "notification will be sent daily until this open pull "
-                "request has been resolved. Thank you."
-            )
+    # self.staleness
+    @property
+    def staleness(self):
+        """ staleness Property Getter
 
-            # For each returned issue, parse the desired data.
-            try:
-                for _issue_ in ThisSearchResults:
-                    # Temp item data containers
-                    this_pr_data = {}
-                    this_pr_reviewers = []
-                    this_pr_reviewer_mentions = (
-                        f"@{_issue_.user.login} "
-                    )
+        Getter method for GithubReports _staleness property.
+        This method returns what pull request ages are measured from,
+        'created' for the creation time, or 'activity' for the latest
+        commit, comment or review.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._staleness
 
-                    # Get pull request object
-                    ThisPullRequest = (
-                        _issue_.repository.get_pull(_issue_.number)
-                    )
+    @staleness.setter
+    def staleness(self, staleness='created'):
+        """ staleness Property Setter
 
-                    # If the flagged Pull Request is merged, ignore it
+        Setter method for GithubReports _staleness property.
+        This method will take a staleness mode, validate it is one of the
+        staleness_modes, and assign it to the staleness property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        # if the passed value is a known mode then set the value.
+        if staleness in self.staleness_modes:
+            self._staleness = staleness
+            self.log(
+                f"Updated {__id} property with value: {self._staleness}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected one of "
+                f"{self.staleness_modes} but received: {staleness}",
+                'error',
+                __id
+            )
+
+    # self.oldest_first
+    @property
+    def oldest_first(self):
+        """ oldest_first Property Getter
+
+        Getter method for GithubReports _oldest_first property.
+        This method returns True when open pull requests are enumerated,
+        hydrated and notified oldest first, so repository listings of
+        stale_only runs stop at the first pull request within the
+        open_pr_threshold.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._oldest_first
+
+    @oldest_first.setter
+    def oldest_first(self, oldest_first=False):
+        """ oldest_first Property Setter
+
+        Setter method for GithubReports _oldest_first property.
+        This method will take a bool value, validate that the provided value
+        is a bool value, and assign it to the oldest_first property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        # if the passed value is a valid bool value then set the value.
+        if oldest_first is not None and isinstance(oldest_first, bool):
+            self._oldest_first = oldest_first
+            self.log(
+                f"Updated {__id} property with value: {self._oldest_first}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected type bool "
+                f"but received type: {type(oldest_first)}",
+                'error',
+                __id
+            )
+
+    # self.enumeration
+    @property
+    def enumeration(self):
+        """ enumeration Property Getter
+
+        Getter method for GithubReports _enumeration property.
+        This method returns the strategy search_open_pulls uses to
+        enumerate open pull requests, 'auto' to let the report planner
+        choose the fastest of 'search', 'list' and 'graphql'.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._enumeration
+
+    @enumeration.setter
+    def enumeration(self, enumeration='auto'):
+        """ enumeration Property Setter
+
+        Setter method for GithubReports _enumeration property.
+        This method will take a strategy name, validate it is 'auto' or
+        one of the ReportPlanner strategies, and assign it to the
+        enumeration property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        this_strategies = ('auto',) + ReportPlanner.strategies
+        # if the passed value is a known strategy then set the value.
+        if enumeration in this_strategies:
+            self._enumeration = enumeration
+            self.log(
+                f"Updated {__id} property with value: {self._enumeration}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected one of "
+                f"{this_strategies} but received: {enumeration}",
+                'error',
+                __id
+            )
+
+    # self.enumeration_plan
+    @property
+    def enumeration_plan(self):
+        """ enumeration_plan Property Getter
+
+        Getter only method for GithubReports _enumeration_plan property.
+        This method returns the enumeration plan of the last
+        search_open_pulls run: the chosen strategy, its estimated requests
+        by API resource and seconds, and the open pull request count of
+        each repository when the namespace was inventoried.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._enumeration_plan
+
+    # self.lean_hydration
+    @property
+    def lean_hydration(self):
+        """ lean_hydration Property Getter
+
+        Getter method for GithubReports _lean_hydration property.
+        This method returns a bool value indicating if search_open_pulls
+        will build pull requests from the search results instead of
+        fetching each pull request.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._lean_hydration
+
+    @lean_hydration.setter
+    def lean_hydration(self, lean_hydration=False):
+        """ lean_hydration Property Setter
+
+        Setter method for GithubReports _lean_hydration property.
+        This method will take a bool value, validate it
+        is a bool value, and assign it to the lean_hydration property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        # if the passed value is a valid bool value then set the value.
+        if lean_hydration is not None and isinstance(lean_hydration, bool):
+            self._lean_hydration = lean_hydration
+            self.log(
+                f"Updated {__id} property with value: "
+                f"{self._lean_hydration}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected type bool "
+                f"but received type: {type(lean_hydration)}",
+                'error',
+                __id
+            )
+
+    # self.mergeability
+    @property
+    def mergeability(self):
+        """ mergeability Property Getter
+
+        Getter method for GithubReports _mergeability property.
+        This method returns a bool value indicating if the report includes
+        the mergeable and mergeable_state fields of each pull request,
+        which lean hydration can only read by fetching the pull request.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._mergeability
+
+    @mergeability.setter
+    def mergeability(self, mergeability=True):
+        """ mergeability Property Setter
+
+        Setter method for GithubReports _mergeability property.
+        This method will take a bool value, validate it
+        is a bool value, and assign it to the mergeability property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        # if the passed value is a valid bool value then set the value.
+        if mergeability is not None and isinstance(mergeability, bool):
+            self._mergeability = mergeability
+            self.log(
+                f"Updated {__id} property with value: {self._mergeability}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected type bool "
+                f"but received type: {type(mergeability)}",
+                'error',
+                __id
+            )
+
+    # self.raw_transport
+    @property
+    def raw_transport(self):
+        """ raw_transport Property Getter
+
+        Getter method for GithubReports _raw_transport property.
+        This method returns a bool value indicating if search_open_pulls
+        decodes the search, listing and pull request responses straight
+        into compact records instead of PyGithub objects.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._raw_transport
+
+    @raw_transport.setter
+    def raw_transport(self, raw_transport=False):
+        """ raw_transport Property Setter
+
+        Setter method for GithubReports _raw_transport property.
+        This method will take a bool value, validate it
+        is a bool value, and assign it to the raw_transport property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        # if the passed value is a valid bool value then set the value.
+        if raw_transport is not None and isinstance(raw_transport, bool):
+            self._raw_transport = raw_transport
+            self.log(
+                f"Updated {__id} property with value: {self._raw_transport}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected type bool "
+                f"but received type: {type(raw_transport)}",
+                'error',
+                __id
+            )
+
+    # self.notifier
+    @property
+    def notifier(self):
+        """ notifier Property Getter
+
+        Getter method for GithubReports _notifier property.
+        This method returns the GithubNotifier object that queues and
+        publishes pull request notification comments.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._notifier
+
+    @notifier.setter
+    def notifier(self, notifier):
+        """ notifier Property Setter
+
+        Setter method for GithubReports _notifier property.
+        This method will take a GithubNotifier object, validate it
+        is a GithubNotifier object, and assign it to the notifier property.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        # if the passed value is a valid notifier object then set the value.
+        if notifier is not None and isinstance(notifier, GithubNotifier):
+            self._notifier = notifier
+            self.log(
+                f"Updated {__id} property with value: {self._notifier}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected type GithubNotifier "
+                f"but received type: {type(notifier)}",
+                'error',
+                __id
+            )
+
+    # self.progress
+    @property
+    def progress(self):
+        """ progress Property Getter
+
+        Getter method for GithubReports _progress property.
+        This method returns the progress and event sink that report runs
+        write their progress and messages to, or None when the sink is
+        chosen automatically for each run.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._progress
+
+    @progress.setter
+    def progress(self, progress):
+        """ progress Property Setter
+
+        Setter method for GithubReports _progress property.
+        This method will take a progress sink, such as a NullProgress or
+        TerminalProgress object or any object implementing their start,
+        advance, event and finish methods, and assign it to the progress
+        property. None restores automatic selection.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property update requested.", 'info', __id)
+
+        if progress is None or all(
+            callable(getattr(progress, _method_, None))
+            for _method_ in ('start', 'advance', 'event', 'finish')
+        ):
+            self._progress = progress
+            self.log(
+                f"Updated {__id} property with value: {self._progress}",
+                'info',
+                __id
+            )
+        else:
+            self.log(
+                f"{__id} property argument expected a progress sink with "
+                "start, advance, event and finish methods but received "
+                f"type: {type(progress)}",
+                'error',
+                __id
+            )
+
+    # self.stats
+    @property
+    def stats(self):
+        """ stats Property Getter
+
+        Getter method for GithubReports _stats property.
+        This method returns the ReportStats object holding the per stage
+        timings, Github API request counts and bytes, cache hits and rate
+        limit waits of the last search_open_pulls run.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} property requested.", 'info', __id)
+        return self._stats
+
+    ############################################
+    # Class Methods:                           #
+    ############################################
+    def _progress_sink(self):
+        """ GithubReports Progress Sink Selector
+
+        Return the progress property sink if one was set. Otherwise runs on
+        a terminal, or in verbose mode, report to a TerminalProgress sink on
+        stderr, and headless runs to a NullProgress sink that does nothing.
+        """
+        if self._progress is not None:
+            return self._progress
+        try:
+            this_interactive = sys.stderr.isatty()
+        except (AttributeError, ValueError):
+            this_interactive = False
+        if this_interactive or self._verbose:
+            return TerminalProgress(verbose=self._verbose)
+        return NullProgress()
+
+    def _build_query(self):
+        """ GithubReports Search Query Builder
+
+        Return the SearchQuery of the next search run: the search_query
+        filters, in the repo_namespace. With stale_only enabled, pull
+        requests created too recently to exceed the open_pr_threshold are
+        excluded by a created: qualifier, so Github never returns them.
+        """
+        this_changes = {
+            'namespace': self._repo_namespace,
+            'is_organization': self._is_organization
+        }
+        if self._stale_only:
+            # age.days > threshold once a pull request is threshold + 1
+            # whole days old.
+            this_cutoff = self._now - timedelta(
+                days=int(self._open_pr_threshold) + 1
+            )
+            if self._search_query.created_before is not None:
+                this_cutoff = min(
+                    this_cutoff,
+                    self._search_query.created_before
+                )
+            this_changes['created_before'] = this_cutoff
+        return self._search_query.copy(**this_changes)
+
+    def _notification_message(self, mentions, link):
+        """ GithubReports Notification Message Builder
+
+        Construct the reminder comment that is published on a pull request
+        that has been open longer than the open_pr_threshold.
+
+        Parameters:
+            mentions (list): required
+            link     (str) : required
+
+        Returns:
+            Notification comment body string
+        """
+        return (
+            f"{' '.join(mentions)} {link} "
+            f"has been open for {self._open_pr_threshold} days or "
+            "longer. Please review the pull request, and merge or "
+            "close at the earliest convenience. This reminder "
+            "notification will be sent daily until this open pull "
+            "request has been resolved. Thank you."
+        )
+
+    def _run_profiled(self, method, *args, **kwargs):
+        """ GithubReports Profiled Run
+
+        Run the given report method under the configured profiler, and
+        write the profile to profile_path with the report parameters and
+        run statistics stored in the {profile_path}.meta.json sidecar file.
+        Profiling errors are logged, and never fail the report run itself.
+
+        Parameters:
+            method (func): required
+
+        Returns:
+            The report method return value
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        try:
+            ThisProfiler = ReportProfiler(
+                self._profile_path,
+                self._profiler
+            ).start()
+        except Exception as e:
+            self.log(
+                f"Unable to start the {self._profiler} profiler, running "
+                f"{method.__name__} without profiling.",
+                'error',
+                __id
+            )
+            self._exception_handler(__id, e)
+            return method(self, *args, **kwargs)
+
+        try:
+            this_result = method(self, *args, **kwargs)
+        finally:
+            ThisProfiler.stop()
+
+        try:
+            ThisProfiler.write(metadata={
+                'method': method.__name__,
+                'repo_namespace': self._repo_namespace,
+                'is_organization': self._is_organization,
+                'open_pr_threshold': self._open_pr_threshold,
+                'notify': self._notify,
+                'base_url': self._base_url,
+                'request_interval': self._request_interval,
+                'search_query': str(self._build_query()),
+                'review_history': self._review_history,
+                'stale_only': self._stale_only,
+                'staleness': self._staleness,
+                'oldest_first': self._oldest_first,
+                'enumeration': self._enumeration,
+                'enumeration_strategy': (
+                    self._enumeration_plan or {}
+                ).get('strategy'),
+                'lean_hydration': self._lean_hydration,
+                'mergeability': self._mergeability,
+                'raw_transport': self._raw_transport,
+                'search_workers': self.search_workers,
+                'page_read_ahead': self.page_read_ahead,
+                'mergeability_batch': self.mergeability_batch,
+                'mergeability_polls': self.mergeability_polls,
+                'mergeability_poll_interval': self.mergeability_poll_interval,
+                'result_count': (
+                    len(this_result) if this_result is not None else None
+                ),
+                'stats': self._stats.as_dict()
+            })
+            self.log(
+                f"Profile written to: {self._profile_path}",
+                'info',
+                __id
+            )
+        except Exception as e:
+            self.log(
+                f"Unable to write profile to: {self._profile_path}",
+                'error',
+                __id
+            )
+            self._exception_handler(__id, e)
+        return this_result
+
+    def _partitioned_search(
+        self,
+        github,
+        query,
+        total_count,
+        progress,
+        count,
+        collect,
+        key
+    ):
+        """ GithubReports Partitioned Search
+
+        Collect the results of a search that reaches the Github search
+        result cap. The query is partitioned into created: date range, or
+        repository, slices under the cap, the slices are collected
+        concurrently by search_workers threads, each sending its requests
+        through a requester of its own, and the results are merged in
+        slice order with duplicates removed by id.
+
+        Parameters:
+            github      (obj) : required Github API connector
+            query       (obj) : required SearchQuery
+            total_count (int) : required result count of the query
+            progress    (obj) : required progress sink
+            count       (func): required, returns the result count of a
+                                query
+            collect     (func): required, returns the results of a query
+            key         (func): required, returns the id of a result
+
+        Returns:
+            List of the search results
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        def repos():
+            if self._is_organization:
+                ThisOwner = github.get_organization(self._repo_namespace)
+            else:
+                ThisOwner = github.get_user(self._repo_namespace)
+            return [_repo_.name for _repo_ in ThisOwner.get_repos()]
+
+        ThisPartitioner = SearchPartitioner(
+            count,
+            repos,
+            cap=self.search_result_cap,
+            now=self._now
+        )
+        this_slices = ThisPartitioner.partition(query, total_count)
+        self._stats.count('search_slices', len(this_slices))
+        progress.event(
+            f"Search partitioned into {len(this_slices)} slices of under "
+            f"{self.search_result_cap} results"
+        )
+        self.log(
+            f"Search slices: {[str(_q_) for _q_, _ in this_slices]}",
+            'debug',
+            __id
+        )
+        for _query_ in ThisPartitioner.truncated:
+            self.log(
+                f"Search slice {_query_} still exceeds the search result "
+                "cap, pull requests beyond the cap will be missing.",
+                'warning',
+                __id
+            )
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        this_workers = max(1, min(int(self.search_workers), len(this_slices)))
+        with ThreadPoolExecutor(max_workers=this_workers) as ThisPool:
+            this_results = list(ThisPool.map(
+                collect,
+                [_query_ for _query_, _ in this_slices]
+            ))
+
+        # Adjacent date range slices share their boundary second.
+        this_merged = {}
+        for _result_ in this_results:
+            for _item_ in _result_:
+                this_merged.setdefault(key(_item_), _item_)
+        return list(this_merged.values())
+
+    @staticmethod
+    def _first_page_count(results):
+        """ Return the total_count of a search from its first page
+
+        Reading totalCount before a search is iterated sends a request of
+        its own, fetching the first page instead keeps it for iteration
+        and sets the count from the total_count of the page.
+        """
+        try:
+            results[0]
+        except IndexError:
+            pass
+        return results.totalCount
+
+    def _graphql_document(self, index=False):
+        """ Return the GraphQL pull request search of the run
+
+        Every search requests the activity fields, and with review_history
+        the review request events. Enumeration searches also request the
+        fields lean hydration builds pull requests from, the index search
+        of search and list enumeration does not.
+        """
+        this_fields = _GRAPHQL_ACTIVITY_FIELDS
+        if not index:
+            this_fields += _GRAPHQL_PULL_FIELDS
+        if self._review_history:
+            this_fields += _GRAPHQL_REVIEW_REQUEST_FIELDS
+        return _GRAPHQL_SEARCH_TEMPLATE % this_fields
+
+    def _graphql_search(
+        self, github, query, first=100, after=None, document=None
+    ):
+        """ Return a page of a GraphQL pull request search """
+        this_query = str(query)
+        if self._oldest_first:
+            this_query += ' sort:created-asc'
+        _, this_data = github.requester.graphql_query(
+            document or self._graphql_document(),
+            {'query': this_query, 'first': first, 'after': after}
+        )
+        return this_data['data']['search']
+
+    def _graphql_nodes(self, github, query, page=None, document=None):
+        """ Yield the pull request nodes of every GraphQL search page """
+        if page is None:
+            page = self._graphql_search(github, query, document=document)
+        while True:
+            yield from page['nodes']
+            if not page['pageInfo']['hasNextPage']:
+                return
+            page = self._graphql_search(
+                github,
+                query,
+                after=page['pageInfo']['endCursor'],
+                document=document
+            )
+
+    def _graphql_pulls(self, github, query, progress, document=None):
+        """ Start a GraphQL pull request search
+
+        The document sets the node fields of the search, the enumeration
+        search of the run by default.
+
+        Returns:
+            Tuple of the result count, and an iterable of the pull request
+            nodes, partitioned when the search reaches the result cap
+        """
+        this_page = self._graphql_search(github, query, document=document)
+        this_total_count = this_page['issueCount']
+        if this_total_count < self.search_result_cap:
+            return this_total_count, self._graphql_nodes(
+                github, query, this_page, document
+            )
+        this_nodes = self._partitioned_search(
+            github,
+            query,
+            this_total_count,
+            progress,
+            lambda _q_: self._graphql_search(
+                github, _q_, 1, document=document
+            )['issueCount'],
+            lambda _q_: list(
+                self._graphql_nodes(github, _q_, document=document)
+            ),
+            lambda _node_: _node_['databaseId']
+        )
+        if self._oldest_first:
+            this_nodes.sort(key=lambda _node_: _node_['createdAt'])
+        return len(this_nodes), this_nodes
+
+    @staticmethod
+    def _timestamp(value):
+        """ Parse a GraphQL timestamp into an aware datetime """
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+    def _record_activity(self, node):
+        """ Record the last activity time of a GraphQL pull request node
+
+        The latest of the creation time, and the last commit, comment and
+        review, keyed by the lower case repository full name and number.
+        Comments of the viewer, such as the reminders of earlier runs, are
+        left out, so a reminder does not make a pull request look active.
+        """
+        this_times = [node['createdAt']]
+        for _connection_, _field_ in (
+            ('commits', lambda _n_: _n_['commit']['committedDate']),
+            ('comments', lambda _n_: (
+                None if _n_.get('viewerDidAuthor') else _n_['createdAt']
+            )),
+            ('reviews', lambda _n_: _n_['submittedAt'])
+        ):
+            this_times.extend(
+                _field_(_node_) for _node_ in node[_connection_]['nodes']
+            )
+        this_key = (
+            node['repository']['nameWithOwner'].lower(),
+            node['number']
+        )
+        self._last_activity[this_key] = max(
+            self._timestamp(_time_) for _time_ in this_times if _time_
+        )
+
+    def _record_review_requests(self, node):
+        """ Record the review request events of a GraphQL pull request node
+
+        As (kind, login or slug, request time) events, keyed by the lower
+        case repository full name and number. Requests of deleted users
+        and teams have no reviewer, and are left out.
+        """
+        this_events = []
+        for _event_ in node['timelineItems']['nodes']:
+            this_reviewer = _event_.get('requestedReviewer') or {}
+            if this_reviewer.get('login'):
+                this_reviewer = ('user', this_reviewer['login'])
+            elif this_reviewer.get('slug'):
+                this_reviewer = ('team', this_reviewer['slug'])
+            else:
+                continue
+            this_events.append(
+                this_reviewer + (self._timestamp(_event_['createdAt']),)
+            )
+        self._review_requests[(
+            node['repository']['nameWithOwner'].lower(),
+            node['number']
+        )] = this_events
+
+    def _record_node(self, node):
+        """ Record the index fields of a GraphQL pull request node """
+        self._record_activity(node)
+        if self._review_history:
+            self._record_review_requests(node)
+
+    def _graphql_index(self, github, query, progress):
+        """ GithubReports GraphQL Pull Request Index
+
+        Fetch the last commit, comment and review times of every pull
+        request of the query, and with review_history its review request
+        events, with the GraphQL search, 100 pull requests per request, so
+        activity based staleness and review request times cost no request
+        per pull request. Search and list enumeration read REST pages,
+        which hold neither, so for them this is a second search over the
+        namespace, one GraphQL request per 100 open pull requests plus the
+        partition probes past the result cap, without the fields lean
+        hydration reads. GraphQL enumeration records them from its own
+        search pages and makes no extra pass.
+        """
+        _, this_nodes = self._graphql_pulls(
+            github, query, progress, self._graphql_document(index=True)
+        )
+        for _node_ in this_nodes:
+            self._record_node(_node_)
+
+    def _repository_inventory(self, github):
+        """ Return the open pull request count of each namespace repository
+
+        A single GraphQL query per 100 repositories, the counts are read
+        from the pull request connections without listing any pull request.
+        Only owned repositories are listed, the repositories of a user
+        otherwise include those the user collaborates on, and counts are
+        keyed by the full repository name.
+        """
+        this_root = 'organization' if self._is_organization else 'user'
+        this_query = _GRAPHQL_INVENTORY_QUERY % this_root
+        this_inventory = {}
+        this_after = None
+        while True:
+            _, this_data = github.requester.graphql_query(this_query, {
+                'login': self._repo_namespace,
+                'first': 100,
+                'after': this_after
+            })
+            this_repos = this_data['data'][this_root]['repositories']
+            for _repo_ in this_repos['nodes']:
+                this_inventory[_repo_['nameWithOwner']] = (
+                    _repo_['pullRequests']['totalCount']
+                )
+            if not this_repos['pageInfo']['hasNextPage']:
+                return this_inventory
+            this_after = this_repos['pageInfo']['endCursor']
+
+    def _plan_enumeration(self, github, query, progress):
+        """ GithubReports Enumeration Planner
+
+        Choose how the open pull requests of the next run are enumerated.
+        With the enumeration property set to 'auto', or 'list' which needs
+        the repository inventory, the open pull request count of each
+        repository and the remaining rate limit budgets are fetched, and a
+        ReportPlanner estimates the requests and run time of the
+        strategies. The choice and its estimated cost are logged, and runs
+        fall back to the search strategy if the namespace can not be
+        inventoried.
+
+        Returns:
+            Enumeration plan dict
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        this_plan = {
+            'strategy': self._enumeration,
+            'requests': None,
+            'seconds': None,
+            'repo_pulls': None
+        }
+        if self._enumeration in ('search', 'graphql'):
+            self.log(
+                f"Enumeration strategy set to {self._enumeration}.",
+                'info',
+                __id
+            )
+            return this_plan
+
+        try:
+            this_repo_pulls = self._repository_inventory(github)
+            this_now = datetime.now(timezone.utc)
+            this_resources = github.get_rate_limit().resources
+            this_budgets = {
+                _resource_: (
+                    _rate_.remaining,
+                    _rate_.limit,
+                    (_rate_.reset - this_now).total_seconds()
+                )
+                for _resource_, _rate_ in (
+                    ('core', this_resources.core),
+                    ('search', this_resources.search),
+                    ('graphql', this_resources.graphql)
+                )
+            }
+        except Exception as e:
+            self.log(
+                "Unable to inventory the repository namespace, open pull "
+                "requests will be enumerated with the search strategy.",
+                'warning',
+                __id
+            )
+            self._exception_handler(__id, e)
+            this_plan['strategy'] = 'search'
+            return this_plan
+
+        ThisPlanner = ReportPlanner(
+            {
+                _repo_: _count_
+                for _repo_, _count_ in this_repo_pulls.items()
+                if query.includes_repo(_repo_)
+            },
+            this_budgets,
+            result_cap=self.search_result_cap,
+            request_seconds=(
+                0.25 if self._request_interval is None
+                else self._request_interval
+            ),
+            listable=query.listable,
+            fetch_pulls=not self._lean_hydration or self._mergeability,
+            activity=self._staleness == 'activity' or self._review_history,
+            # Raw records read the review requests with a single request.
+            review_requests=1 if self._raw_transport else None
+        )
+        for _strategy_ in ReportPlanner.strategies:
+            self.log(
+                f"Enumeration estimate: {ThisPlanner.estimate(_strategy_)}",
+                'debug',
+                __id
+            )
+        if self._enumeration == 'auto':
+            this_estimate = ThisPlanner.plan()
+        else:
+            this_estimate = ThisPlanner.estimate(self._enumeration)
+            if this_estimate['seconds'] is None:
+                self.log(
+                    "The label, draft and review filters of the search "
+                    "query can not be applied to repository listings, "
+                    "open pull requests will be enumerated with the search "
+                    "strategy.",
+                    'warning',
+                    __id
+                )
+                this_estimate = ThisPlanner.estimate('search')
+        this_plan.update(this_estimate, repo_pulls=this_repo_pulls)
+
+        this_plan_message = (
+            f"Enumerating {ThisPlanner.pull_count} open pull requests in "
+            f"{len(this_repo_pulls)} repositories with the "
+            f"{this_plan['strategy']} strategy, estimated "
+            f"{sum(this_plan['requests'].values())} requests "
+            f"{this_plan['requests']} and {this_plan['seconds']:.1f} seconds"
+        )
+        progress.event(this_plan_message)
+        self.log(this_plan_message, 'info', __id)
+        return this_plan
+
+    def _poll_mergeability(self, pending, progress):
+        """ GithubReports Deferred Mergeability Polling
+
+        Github computes the mergeable and mergeable_state fields of a pull
+        request in the background, and reports them as None until the
+        computation requested by the first read completes. Instead of
+        holding up the main scan, records whose mergeability is not known
+        yet are polled here once the scan has finished.
+
+        Each round refreshes the pending pull requests in batches of
+        mergeability_batch pull requests, on min(search_workers,
+        mergeability_batch) threads that each send their requests through a
+        requester of their own, and updates the records of those whose
+        mergeability is known. Rounds are repeated, at least
+        mergeability_poll_interval seconds apart, until no record is
+        pending or mergeability_polls rounds were made.
+
+        Parameters:
+            pending  (list): required (record, pull request) pairs
+            progress (obj) : required progress sink
+
+        Returns:
+            Number of records whose mergeability is still unknown
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def poll(item):
+            this_record, ThisPullRequest = item
+            try:
+                ThisPullRequest.update()
+            except Exception as e:
+                self.log(
+                    f"Unable to poll the mergeability of: "
+                    f"{this_record['link']}: {e}",
+                    'warning',
+                    __id
+                )
+                return item
+            if ThisPullRequest.mergeable is None:
+                return item
+            this_record.update(
+                mergable=ThisPullRequest.mergeable,
+                merge_state=ThisPullRequest.mergeable_state
+            )
+            return None
+
+        this_batch = max(1, int(self.mergeability_batch))
+        for _round_ in range(max(0, int(self.mergeability_polls))):
+            if not pending:
+                break
+            if _round_ > 0:
+                time.sleep(max(0.0, float(self.mergeability_poll_interval)))
+            progress.event(
+                f"Polling the mergeability of {len(pending)} pull requests..."
+            )
+            this_polled = len(pending)
+            this_workers = max(1, min(int(self.search_workers), this_batch))
+            with ThreadPoolExecutor(max_workers=this_workers) as ThisPool:
+                pending = [
+                    _item_
+                    for _start_ in range(0, len(pending), this_batch)
+                    for _item_ in ThisPool.map(
+                        poll, pending[_start_:_start_ + this_batch]
+                    )
+                    if _item_ is not None
+                ]
+            self._stats.count('mergeability_polled', this_polled)
+
+        if pending:
+            self._stats.count('mergeability_unknown', len(pending))
+            self.log(
+                f"Mergeability of {len(pending)} pull requests was still "
+                "being computed by Github after "
+                f"{self.mergeability_polls} polls.",
+                'warning',
+                __id
+            )
+        return len(pending)
+
+    def _cached_repository(self, full_name, factory):
+        """ Return the shared repository object of the run
+
+        The pull requests of a namespace share a handful of repositories,
+        the first object built by factory for a repository full_name is
+        handed out for every later pull request of the run. Listings
+        resolve their repositories on the page prefetching thread while
+        the main thread resolves search results, so the cache is guarded
+        by a lock, held while the object is built so that a repository is
+        never fetched twice.
+        """
+        this_key = full_name.lower()
+        with self._repository_lock:
+            ThisRepository = self._repository_cache.get(this_key)
+            self._stats.cache('repositories', ThisRepository is not None)
+            if ThisRepository is None:
+                ThisRepository = factory()
+                self._repository_cache[this_key] = ThisRepository
+        return ThisRepository
+
+    def _cached_login(self, user):
+        """ Return the shared login string of a user for the run records """
+        this_login = user.login
+        ThisLogin = self._user_cache.get(this_login)
+        self._stats.cache('users', ThisLogin is not None)
+        if ThisLogin is None:
+            ThisLogin = self._user_cache[this_login] = this_login
+        return ThisLogin
+
+    def _payload_repository(self, github, payload):
+        """ Return the run repository of a search result issue payload
+
+        The repository is built partially loaded from the repository_url
+        and html_url of the payload, so neither the issue nor the
+        repository is completed with a request of its own. The raw
+        transport builds a repository record from the same fields.
+        """
+        from github.Repository import Repository
+
+        this_repo_url = payload['repository_url']
+        this_full_name = '/'.join(this_repo_url.split('/')[-2:])
+        this_attributes = {
+            'url': this_repo_url,
+            'name': this_full_name.split('/')[1],
+            'full_name': this_full_name,
+            'html_url': payload['html_url'].rsplit('/pull/', 1)[0]
+        }
+        if isinstance(github, RawTransport):
+            return self._cached_repository(
+                this_full_name,
+                lambda: github.repository(this_attributes)
+            )
+        return self._cached_repository(this_full_name, lambda: Repository(
+            github.requester,
+            {},
+            this_attributes,
+            completed=False
+        ))
+
+    def _lean_pull(self, github, issue):
+        """ GithubReports Lean Pull Request Hydration
+
+        Build a partially loaded repository and pull request from a search
+        result issue payload, without any request. Fields the payload does
+        not hold, such as mergeable and mergeable_state, are fetched by
+        PyGithub if read. The issue is not completed either, as its payload
+        is read directly.
+
+        Returns:
+            Tuple of the repository and pull request objects
+        """
+        from github.PullRequest import PullRequest
+
+        this_payload = issue._rawData
+        this_merged_at = this_payload['pull_request'].get('merged_at')
+        ThisRepository = self._payload_repository(github, this_payload)
+        this_attributes = {
+            _key_: this_payload[_key_]
+            for _key_ in (
+                'html_url', 'number', 'title', 'body', 'user', 'labels',
+                'state', 'created_at', 'updated_at', 'closed_at', 'draft'
+            )
+            if _key_ in this_payload
+        }
+        this_attributes.update(
+            url=this_payload['pull_request']['url'],
+            issue_url=this_payload['url'],
+            merged_at=this_merged_at,
+            merged=this_merged_at is not None,
+            merged_by=None
+        )
+        return ThisRepository, PullRequest(
+            github.requester,
+            {},
+            this_attributes,
+            completed=False
+        )
+
+    def _lean_node_pull(self, github, api, node):
+        """ GithubReports Lean GraphQL Pull Request Hydration
+
+        Build a partially loaded repository and pull request from the
+        fields of a GraphQL search node, without any request, as _lean_pull
+        does for search result issues. The API urls are built from the
+        repository name and number, and the mergeable and mergeable_state
+        fields are left to the deferred mergeability stage.
+
+        Returns:
+            Tuple of the repository and pull request objects, raw records
+            when api is a RawTransport
+        """
+        from github.PullRequest import PullRequest
+
+        this_repo_url = (
+            f"{github.requester.base_url}/repos/"
+            f"{node['repository']['nameWithOwner']}"
+        )
+        this_author = node.get('author')
+        this_attributes = {
+            'url': f"{this_repo_url}/pulls/{node['number']}",
+            'issue_url': f"{this_repo_url}/issues/{node['number']}",
+            'repository_url': this_repo_url,
+            'html_url': node['url'],
+            'id': node['databaseId'],
+            'number': node['number'],
+            'title': node['title'],
+            'body': node['body'],
+            'user': (
+                None if this_author is None
+                else {'login': this_author['login']}
+            ),
+            'state': node['state'].lower(),
+            'draft': node['isDraft'],
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt'],
+            'merged_at': node['mergedAt'],
+            'merged': node['mergedAt'] is not None,
+            'merged_by': None
+        }
+        ThisRepository = self._payload_repository(api, this_attributes)
+        if isinstance(api, RawTransport):
+            return ThisRepository, RawPull(api, this_attributes)
+        return ThisRepository, PullRequest(
+            github.requester,
+            {},
+            this_attributes,
+            completed=False
+        )
+
+    def _prefetched(self, pages, plan):
+        """ Return paginated results fetched ahead of their hydration
+
+        The page requests of the prefetching thread are attributed to the
+        enumeration stage of the plan, and sent through the requester of
+        that thread, as the run Github object hands each thread its own.
+        """
+        return PagePrefetcher(
+            pages,
+            read_ahead=self.page_read_ahead,
+            stats=self._stats,
+            stage=self.enumeration_stages[plan['strategy']]
+        )
+
+    def _enumerate(self, github, query, plan, progress):
+        """ GithubReports Open Pull Request Enumeration
+
+        Start enumerating the open pull requests of the query with the
+        strategy of the enumeration plan, the search API, per repository
+        listings or GraphQL search.
+
+        Returns:
+            Tuple of the open pull request count, None when it is not known
+            before enumerating, and an iterable of (source, repository,
+            pull request) items, where source holds the issue level fields
+            of the report, and the pull request is None until it is
+            fetched.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        # The raw transport serves the search, repository and pull request
+        # requests, decoding their responses into compact records. Owner
+        # repository listings and GraphQL searches only yield names.
+        ThisApi = github
+        if self._raw_transport:
+            ThisApi = RawTransport(github.requester)
+
+        if plan['strategy'] == 'list':
+            this_repos = [
+                _repo_ for _repo_, _count_ in plan['repo_pulls'].items()
+                if _count_ > 0 and query.includes_repo(_repo_)
+            ]
+            this_total_count = sum(
+                plan['repo_pulls'][_repo_] for _repo_ in this_repos
+            )
+            # The inventory counts every open pull request, so the count of
+            # a created range is not known until the listings are read.
+            if this_total_count and (
+                query.created_after is not None or
+                query.created_before is not None
+            ):
+                this_total_count = None
+
+            # Oldest first listings are sorted by creation, so a listing
+            # is done at its first pull request created after the range.
+            this_before = query.copy(created_after=None)
+
+            def listed_items(repo):
+                ThisRepository = self._cached_repository(
+                    repo,
+                    lambda: ThisApi.get_repo(repo)
+                )
+                this_order = {}
+                if self._oldest_first:
+                    this_order = {'sort': 'created', 'direction': 'asc'}
+                for _pull_ in ThisRepository.get_pulls(
+                    state='open', **this_order
+                ):
+                    if query.includes_created(_pull_.created_at):
+                        yield _pull_, ThisRepository, _pull_
+                    elif (
+                        self._oldest_first and
+                        not this_before.includes_created(_pull_.created_at)
+                    ):
+                        self._stats.count('enumeration_stopped_early')
+                        return
+
+            if self._oldest_first:
+                import heapq
+
+                # Listings are merged lazily, so pages are only fetched
+                # as the oldest pull requests of the namespace are reached.
+                this_items = heapq.merge(
+                    *[listed_items(_repo_) for _repo_ in this_repos],
+                    key=lambda _item_: _item_[2].created_at
+                )
+            else:
+                this_items = (
+                    _item_
+                    for _repo_ in this_repos
+                    for _item_ in listed_items(_repo_)
+                )
+            return this_total_count, self._prefetched(this_items, plan)
+
+        if plan['strategy'] == 'graphql':
+            this_total_count, this_nodes = self._graphql_pulls(
+                github, query, progress
+            )
+
+            def graphql_items():
+                for _node_ in this_nodes:
+                    this_name = _node_['repository']['nameWithOwner']
+                    self._record_node(_node_)
+                    if self._lean_hydration:
+                        ThisRepository, ThisPullRequest = (
+                            self._lean_node_pull(github, ThisApi, _node_)
+                        )
+                        yield ThisPullRequest, ThisRepository, ThisPullRequest
+                        continue
+                    ThisRepository = self._cached_repository(
+                        this_name,
+                        lambda: ThisApi.get_repo(this_name)
+                    )
+                    with self._stats.stage('get_pull'):
+                        ThisPullRequest = ThisRepository.get_pull(
+                            _node_['number']
+                        )
+                    yield ThisPullRequest, ThisRepository, ThisPullRequest
+
+            return this_total_count, graphql_items()
+
+        this_order = {}
+        if self._oldest_first:
+            this_order = {'sort': 'created', 'order': 'asc'}
+        ThisSearchResults = ThisApi.search_issues(str(query), **this_order)
+        this_total_count = self._first_page_count(ThisSearchResults)
+        # Github stops returning results at the search result cap, so
+        # larger searches are collected as partitioned slices.
+        if this_total_count >= self.search_result_cap:
+            ThisSearchResults = self._partitioned_search(
+                github,
+                query,
+                this_total_count,
+                progress,
+                lambda _q_: ThisApi.search_issues(str(_q_)).totalCount,
+                lambda _q_: list(
+                    ThisApi.search_issues(str(_q_), **this_order)
+                ),
+                lambda _issue_: _issue_.id
+            )
+            if self._oldest_first:
+                ThisSearchResults.sort(
+                    key=lambda _issue_: _issue_.created_at
+                )
+            this_total_count = len(ThisSearchResults)
+        else:
+            ThisSearchResults = self._prefetched(ThisSearchResults, plan)
+        if self._raw_transport:
+            # Search result records hold the pull request fields of their
+            # issue payload, lean hydration reads them in place.
+            return this_total_count, (
+                (
+                    _issue_,
+                    self._payload_repository(ThisApi, {
+                        'repository_url': _issue_.repository_url,
+                        'html_url': _issue_.html_url
+                    }),
+                    _issue_ if self._lean_hydration else None
+                )
+                for _issue_ in ThisSearchResults
+            )
+        if self._lean_hydration:
+            return this_total_count, (
+                (_issue_,) + self._lean_pull(github, _issue_)
+                for _issue_ in ThisSearchResults
+            )
+        return this_total_count, (
+            (
+                _issue_,
+                self._payload_repository(github, _issue_._rawData),
+                None
+            )
+            for _issue_ in ThisSearchResults
+        )
+
+    @_profiled
+    def search_open_pulls(self, auth_token=None, repo_namespace=None):
+        """ GithubReports Open Pull Request Report Collector
+
+        GithubReports method that will perform a search for all
+        open pull requests and construct a return object that will
+        contain a list of dictionaries with relevant pull request
+        data
+
+        Search filters can be found on githubs documentation page:
+        https://help.github.com/en/github/
+        searching-for-information-on-github/searching-issues-and-pull-requests
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} method called.", 'info', __id)
+
+        # Check the passed auth_token, if it has a value, then
+        # set the auth_token property.
+        if auth_token is not None and isinstance(auth_token, str):
+            self._auth_token = auth_token
+
+        # Check the passed repo_namespace, if it has a value, then
+        # set the repo_namespace property.
+        if repo_namespace is not None and isinstance(repo_namespace, str):
+            self._repo_namespace = repo_namespace
+
+        # Test to ensure required args have been provided
+        if self._auth_token is None:
+            self.log(
+                "Github auth_token required to call this method! "
+                "The auth_token can be set by passing the method argument "
+                "search_open_pulls(auth_token=<token>) or by setting the "
+                "token using the property setter method "
+                "Obj.auth_token = <token> before calling the "
+                "search_open_pulls() method.",
+                'error',
+                __id
+            )
+            return None
+        elif self._repo_namespace is None:
+            self.log(
+                "Github repo_namespace required to call this method! "
+                "The repo_namespace can be set by passing the method "
+                "argument search_open_pulls(repo_namespace=<namespace>) "
+                "or by setting the namespace using the property setter "
+                "method Obj.repo_namespace = <namespace> before calling the "
+                "search_open_pulls() method. If the repository is an "
+                "organization repository, then Obj.is_organization = True "
+                "must also be set or user repositories will be searched "
+                "instead of organization repositories.",
+                'error',
+                __id
+            )
+            return None
+
+        this_call_message = (
+            f"Constructing search query for {self._repo_namespace} "
+            "repository namespace...\n"
+            "\tOpen Pull Request Threshold: "
+            f"{' ' * 9}{self._open_pr_threshold} days\n"
+            "\tNotifications Enabled: "
+            f"{' ' * 15}{self._notify}\n"
+            "\tRepository Namespace is Organization: "
+            f"{self._is_organization}\n"
+            "\tVerbose Mode Enabled: "
+            f"{' ' * 16}{self._verbose}\n"
+        )
+        ThisProgress = self._progress_sink()
+        ThisProgress.event(this_call_message)
+        self.log(this_call_message, 'debug', __id)
+
+        # Prep the search_results internal property to store the
+        # expected result set, and start a fresh set of run statistics.
+        self._search_results = []
+        self._stats.start()
+        # Repositories and users are shared by the pull requests of a run,
+        # and dropped between runs so no stale object outlives its run.
+        self._repository_cache = {}
+        self._user_cache = {}
+        self._last_activity = {}
+        self._review_requests = {}
+        # Ages are measured from the start of each run, as one object can be
+        # reused for many runs by long lived processes.
+        self._now = datetime.now(timezone.utc)
+
+        # Instantiate the Github Object and Search for Open Pull Requests
+        try:
+            from github import Github
+
+            # Instantiate a Github object using the Provided Github Token,
+            # reusing the previous run's object, and its open connection,
+            # while the token and API settings are unchanged.
+            this_github_args = {'per_page': 100}
+            if self._base_url is not None:
+                this_github_args['base_url'] = self._base_url
+            if self._request_interval is not None:
+                this_github_args['seconds_between_requests'] = (
+                    self._request_interval
+                )
+            this_github_key = (
+                self._auth_token,
+                tuple(sorted(this_github_args.items()))
+            )
+            if self._github is None or self._github_key != this_github_key:
+                self._github = self._stats.instrument(Github(
+                    self._auth_token,
+                    retry=self._stats.retry(),
+                    **this_github_args
+                ))
+                # Prefetching, search slice, mergeability and notification
+                # workers share the run objects, every thread sends their
+                # requests through a requester of its own.
+                self._github._Github__requester = ThreadRequesters(
+                    self._github.requester,
+                    prepare=self._stats.instrument_requester
+                )
+                self._github_key = this_github_key
+                self.log(
+                    f"Instantiated Github API Connector Object",
+                    'debug',
+                    __id
+                )
+            ThisGithub = self._github
+        except Exception as e:
+            ThisGithubException = (
+                "An un-expected error occurred when attempting to "
+                "instantiate a new Github API Connector object."
+            )
+            ThisProgress.event(f"{ThisGithubException}\n")
+            ThisProgress.finish()
+            self.log(ThisGithubException, 'error', __id)
+            self._exception_handler(__id, e)
+            return None
+
+        # Construct the Github Issue Query
+        try:
+            ThisQuery = self._build_query()
+            self.log(f"Search query: {ThisQuery}", 'debug', __id)
+            with self._stats.stage('plan'):
+                self._enumeration_plan = self._plan_enumeration(
+                    ThisGithub,
+                    ThisQuery,
+                    ThisProgress
+                )
+            this_stage = self.enumeration_stages[
+                self._enumeration_plan['strategy']
+            ]
+            with self._stats.stage(this_stage):
+                this_total_count, ThisSearchResults = (
+                    self._enumerate(
+                        ThisGithub,
+                        ThisQuery,
+                        self._enumeration_plan,
+                        ThisProgress
+                    )
+                )
+            # Activity staleness needs the last activity of every pull
+            # request, and the review history its review request times,
+            # which GraphQL enumeration records as it goes.
+            if (
+                (self._staleness == 'activity' or self._review_history) and
+                self._enumeration_plan['strategy'] != 'graphql' and
+                this_total_count != 0
+            ):
+                with self._stats.stage('graphql_index'):
+                    self._graphql_index(ThisGithub, ThisQuery, ThisProgress)
+            this_count_message = (
+                this_total_count if this_total_count is not None
+                else 'an unknown number of'
+            )
+            self.log(
+                f"Search Results: {this_count_message} "
+                "open PullRequests were returned!",
+                'debug',
+                __id
+            )
+            ThisProgress.event(
+                f"Open PR Search returned {this_count_message} results"
+            )
+        except Exception as e:
+            ThisSearchResultsException = (
+                "An un-expected error occurred when attempting to "
+                "perform a Github issue search for open PRs."
+            )
+            ThisProgress.event(f"{ThisSearchResultsException}\n")
+            ThisProgress.finish()
+            self.log(ThisSearchResultsException, 'error', __id)
+            self._exception_handler(__id, e)
+            return None
+
+        # If no results were returned then exit gracefully
+        if this_total_count == 0:
+            ThisProgress.event("Search completed. Exiting search...")
+            ThisProgress.finish()
+            self.log(
+                f"0 results returned, exiting search function...",
+                'info',
+                __id
+            )
+            return None
+        else:
+            ThisProgress.event("Validating Search Results...\n")
+            # An unknown count draws an indeterminate progress counter.
+            ThisProgress.start(this_total_count, 'Processing')
+            this_enumerated = 0
+            this_mergeability_pending = []
+            # Listings hold the pull-request-simple payload, without the
+            # merged, merged_by and mergeability fields PyGithub would
+            # complete each listed pull request for.
+            this_listed = self._enumeration_plan['strategy'] == 'list'
+
+            # For each returned issue, parse the desired data.
+            try:
+                for (
+                    _issue_, ThisRepository, ThisPullRequest
+                ) in self._stats.timed_iter(this_stage, ThisSearchResults):
+                    this_enumerated += 1
+                    # Temp item data containers
+                    this_pr_data = {}
+                    this_submitter = self._cached_login(_issue_.user)
+                    ThisReviewers = ReviewerStates(
+                        this_submitter,
+                        history=self._review_history,
+                        organization=ThisRepository.full_name.split('/')[0]
+                    )
+
+                    # Get pull request object
+                    if ThisPullRequest is None:
+                        with self._stats.stage('get_pull'):
+                            ThisPullRequest = (
+                                ThisRepository.get_pull(_issue_.number)
+                            )
+
+                    # If the flagged Pull Request is merged, ignore it
+                    this_merged_at = ThisPullRequest.merged_at
+                    if this_listed:
+                        this_merged = this_merged_at is not None
+                        this_merged_by = None
+                    else:
+                        this_merged = ThisPullRequest.merged
+                        this_merged_by = ThisPullRequest.merged_by
                     if (
-                        ThisPullRequest.merged or
-                        ThisPullRequest.merged_at is not None or
-                        ThisPullRequest.merged_by is not None
+                        this_merged or
+                        this_merged_at is not None or
+                        this_merged_by is not None
                     ):
+                        ThisProgress.advance()  # pragma: no cover
                         continue  # pragma: no cover
 
-                    # Get designated pull request reviewers
-                    ThisPullRequestedReviewers = (
-                        ThisPullRequest.get_review_requests()
-                    )
-                    # Users
-                    for _user_ in ThisPullRequestedReviewers[0]:
-                        this_pr_reviewers.append(_user_.login)
-                        this_pr_reviewer_mentions += (
-                            f"@{_user_.login} "
+                    # Set the pull request age, from its creation or from
+                    # its last activity, falling back to its update time
+                    # for a pull request the activity index missed.
+                    this_last_activity = ThisPullRequest.created_at
+                    if self._staleness == 'activity':
+                        this_last_activity = self._last_activity.get(
+                            (
+                                ThisRepository.full_name.lower(),
+                                ThisPullRequest.number
+                            ),
+                            ThisPullRequest.updated_at
                         )
-                    # Teams
-                    for _user_ in ThisPullRequestedReviewers[1]:
-                        this_pr_reviewers.append(_user_.name)
-                        this_pr_reviewer_mentions += (
-                            f"@{_user_.name} "
+                    this_pr_age = self._now - this_last_activity
+
+                    # Pull requests active within the threshold are not
+                    # hydrated when only stale pull requests are reported.
+                    if (
+                        self._stale_only and
+                        int(this_pr_age.days) <= int(self._open_pr_threshold)
+                    ):
+                        ThisProgress.advance()
+                        continue
+
+                    # Review request events, with their times, read from
+                    # the GraphQL search pages for the review history.
+                    this_request_events = None
+                    if self._review_history:
+                        this_request_events = self._review_requests.get((
+                            ThisRepository.full_name.lower(),
+                            ThisPullRequest.number
+                        ))
+                    this_record_requests = this_request_events is None
+
+                    # Get designated pull request reviewers
+                    with self._stats.stage('get_review_requests'):
+                        ThisPullRequestedReviewers = (
+                            ThisPullRequest.get_review_requests()
                         )
+                        # Users
+                        for _user_ in ThisPullRequestedReviewers[0]:
+                            ThisReviewers.request_user(
+                                self._cached_login(_user_),
+                                record=this_record_requests
+                            )
+                        # Teams
+                        for _team_ in ThisPullRequestedReviewers[1]:
+                            ThisReviewers.request_team(
+                                _team_.slug,
+                                _team_.name,
+                                record=this_record_requests
+                            )
+                    for _kind_, _reviewer_, _at_ in (
+                        this_request_events or ()
+                    ):
+                        ThisReviewers.requested(_reviewer_, _kind_, _at_)
 
                     # Get pull request reviews
-                    ThisPullReviews = ThisPullRequest.get_reviews()
-                    if ThisPullReviews.totalCount > 0:
+                    with self._stats.stage('get_reviews'):
+                        # Materialized once, so the review count is the
+                        # length of the list instead of a totalCount request.
+                        ThisPullReviews = list(ThisPullRequest.get_reviews())
+                        # Reviews are listed oldest first, so the latest
+                        # state of each reviewer wins.
                         for _review_ in ThisPullReviews:
-                            this_pr_reviewer_status = (
-                                f"{_review_.user.login}: {_review_.state}"
-                            )
-                            if (
-                                _review_.user.login not in
-                                this_pr_reviewer_mentions
-                            ):
-                                this_pr_reviewer_mentions += (
-                                    f"@{_review_.user.login} "
-                                )  # pragma: no cover
-                            if _review_.user.login in this_pr_reviewers:
-                                this_index = this_pr_reviewers.index(
-                                    _review_.user.login
+                            if _review_.user is not None:
+                                ThisReviewers.review(
+                                    self._cached_login(_review_.user),
+                                    _review_.state,
+                                    _review_.submitted_at
                                 )
-                                this_pr_reviewers[this_index] = (
-                                    this_pr_reviewer_status
-                                )
-                            else:
-                                this_pr_reviewers.append(
-                                    this_pr_reviewer_status
-                                )  # pragma: no cover
-
-                    # Set the pull request age, and update
-                    # the var_pr_dataset object
-                    this_pr_age = (
-                        self._now - ThisPullRequest.created_at
-                    )
+                    this_pr_mentions = ThisReviewers.mentions
 
                     # Construct a PR message to get published if notify
-                    this_pr_comment_msg = (
-                        f"{this_pr_reviewer_mentions}"
-                        f"{_issue_.html_url} "
-                        f"{this_open_exceeded_pr_comment}"
+                    this_pr_comment_msg = self._notification_message(
+                        this_pr_mentions,
+                        _issue_.html_url
                     )
 
-                    # If send_notifications true,
-                    # create a mention comment on the PR
+                    # If send_notifications true, queue a mention
+                    # comment on the PR for the dispatch stage
                     if (
                         int(this_pr_age.days) >
                         int(self._open_pr_threshold)
                     ):
-                        if self._verbose:
-                            print(
-                                f"{_issue_.html_url} "
-                                "Exceeded the Open Days Limit!\n"
-                            )
-                            print(
-                                "Constructing PullRequest "
-                                "Notification Comment:"
-                            )
-                            print(f"\n{this_pr_comment_msg}\n")
+                        ThisProgress.event(
+                            f"{_issue_.html_url} "
+                            "Exceeded the Open Days Limit!\n\n"
+                            "Constructing PullRequest Notification Comment:"
+                            f"\n\n{this_pr_comment_msg}\n",
+                            'detail'
+                        )
                         if self._notify:
-                            ThisPullRequest.create_issue_comment(
+                            self._notifier.enqueue(
+                                ThisPullRequest,
                                 this_pr_comment_msg
                             )  # pragma: no cover
-                            if self._verbose:
-                                print(
-                                    "Comment published successfully!\n"
-                                )  # pragma: no cover
+                            ThisProgress.event(
+                                "Comment queued for publishing!\n",
+                                'detail'
+                            )  # pragma: no cover
                         else:
-                            if self._verbose:  # pragma: no cover
-                                print(
-                                    "Notifications currently disabled: "
-                                    "The constructed notification comment "
-                                    "was not published to the pull request.\n"
-                                )  # pragma: no cover
+                            ThisProgress.event(
+                                "Notifications currently disabled: "
+                                "The constructed notification comment "
+                                "was not published to the pull request.\n",
+                                'detail'
+                            )  # pragma: no cover
                     else:
-                        if self._verbose:
-                            print(
-                                f"{_issue_.html_url} "
-                                "Within the Open Days Limit.\n"
-                            )
+                        ThisProgress.event(
+                            f"{_issue_.html_url} "
+                            "Within the Open Days Limit.\n",
+                            'detail'
+                        )
+
+                    # Mergeability is only held by the pull request
+                    # payload, lean hydration leaves it to the deferred
+                    # mergeability stage.
+                    this_mergeable = this_merge_state = None
+                    if not self._lean_hydration:
+                        # Reading them fetches a listed pull request.
+                        with (
+                            self._stats.stage('get_pull') if this_listed
+                            else nullcontext()
+                        ):
+                            this_mergeable = ThisPullRequest.mergeable
+                            this_merge_state = ThisPullRequest.mergeable_state
 
                     # Construct Required DataPoint Dictionary
                     # to render the report:
-                    this_pr_data.update(
-                        id=_issue_.id,
-                        repository=_issue_.repository.name,
-                        repository_url=_issue_.repository.html_url,
-                        number=_issue_.number,
-                        submitter=_issue_.user.login,
-                        reviewers=this_pr_reviewers,
-                        link=_issue_.html_url,
-                        title=_issue_.title,
-                        body=_issue_.body,
-                        created=ThisPullRequest.created_at,
-                        age=this_pr_age,
-                        age_days=int(this_pr_age.days),
-                        state=ThisPullRequest.state,
-                        is_merged=ThisPullRequest.merged,
-                        merged=ThisPullRequest.merged_at,
-                        mergable=ThisPullRequest.mergeable,
-                        merge_state=ThisPullRequest.mergeable_state,
-                        merged_by=ThisPullRequest.merged_by,
-                        review_count=ThisPullReviews.totalCount,
-                        days_open_threshold=int(self._open_pr_threshold)
-                    )
+                    with self._stats.stage('build_record'):
+                        this_pr_data.update(
+                            id=_issue_.id,
+                            repository=ThisRepository.name,
+                            repository_url=ThisRepository.html_url,
+                            number=_issue_.number,
+                            submitter=this_submitter,
+                            reviewers=ThisReviewers.reviewers,
+                            link=_issue_.html_url,
+                            title=_issue_.title,
+                            body=_issue_.body,
+                            created=ThisPullRequest.created_at,
+                            age=this_pr_age,
+                            age_days=int(this_pr_age.days),
+                            state=ThisPullRequest.state,
+                            is_merged=this_merged,
+                            merged=this_merged_at,
+                            mergable=this_mergeable,
+                            merge_state=this_merge_state,
+                            merged_by=this_merged_by,
+                            review_count=len(ThisPullReviews),
+                            days_open_threshold=int(self._open_pr_threshold),
+                            mentions=this_pr_mentions
+                        )
+                        if self._staleness == 'activity':
+                            this_pr_data.update(
+                                last_activity=this_last_activity
+                            )
+                        # The review timeline is built from the reviews
+                        # and review requests fetched above, and the
+                        # review request events of the GraphQL pages.
+                        if self._review_history:
+                            this_pr_data.update(
+                                review_timeline=ThisReviewers.timeline,
+                                review_requested_at=(
+                                    ThisReviewers.requested_at()
+                                ),
+                                first_review_at=(
+                                    ThisReviewers.first_review_at()
+                                ),
+                                approved_at=ThisReviewers.approved_at()
+                            )
+
+                    # Mergeability Github is still computing is polled
+                    # once the scan is done, instead of waiting on it here.
+                    if self._mergeability and this_mergeable is None:
+                        this_mergeability_pending.append(
+                            (this_pr_data, ThisPullRequest)
+                        )
 
                     # Add the storage object to the OpenPullRequests list
                     self._search_results.append(this_pr_data)
-                    ThisSearchProgress.next()
+                    self._stats.count('pull_requests_collected')
+                    ThisProgress.advance()
+
+                if this_mergeability_pending:
+                    with self._stats.stage('poll_mergeability'):
+                        self._poll_mergeability(
+                            this_mergeability_pending,
+                            ThisProgress
+                        )
 
-                ThisSearchProgress.finish()
+                # Publish the queued notification comments now that the
+                # collection loop no longer has to wait on them.
+                if self._notify and self._notifier.pending > 0:
+                    this_notifier_stats = self._notifier.stats
+                    with self._stats.stage('dispatch_comments'):
+                        this_dispatch = self._notifier.dispatch()
+                    self._record_dispatch(this_notifier_stats, this_dispatch)
+                    # Run summaries are printed to stdout, whichever
+                    # progress sink reports the progress of the run.
+                    print(
+                        f"{this_dispatch['published']} notification comments "
+                        f"published, {this_dispatch['skipped']} skipped as "
+                        "already published today, "
+                        f"{this_dispatch['failed']} failed.\n"
+                    )
 
                 if self._verbose:
-                    print("Printing Collected Open Pull Request DataSet: ")
+                    ThisProgress.event(
+                        "Printing Collected Open Pull Request DataSet: ",
+                        'detail'
+                    )
                     for _pr_ in self._search_results:
-                        print(f"\n{_pr_}\n")
+                        ThisProgress.event(f"\n{_pr_}\n", 'detail')
 
+                if this_total_count is None:
+                    this_total_count = this_enumerated
+                ThisProgress.finish()
                 print(
-                    f"{len(self._search_results)} / "
-                    f"{ThisSearchResults.totalCount} "
+                    f"{len(self._search_results)} / {this_total_count} "
                     "of the returned search results were verified as open "
                     "pull requests.\n"
                 )
+                self._stats.finish()
+                self.log(
+                    f"Run statistics: {self._stats.as_dict()}",
+                    'debug',
+                    __id
+                )
                 return self._search_results
             except Exception as e:  # pragma: no cover
                 ThisParseSearchException = (
                     "An unexpected error occurred parsing "
                     "the PullRequest response dataset:\n"
                 )  # pragma: no cover
-                print(f"{ThisParseSearchException}\n")  # pragma: no cover
+                ThisProgress.event(
+                    f"{ThisParseSearchException}\n"
+                )  # pragma: no cover
+                ThisProgress.finish()  # pragma: no cover
                 self.log(
                     ThisParseSearchException, 'error', __id
                 )  # pragma: no cover
                 self._exception_handler(__id, e)  # pragma: no cover
                 return None  # pragma: no cover
 
-    # def write(self, path=None):
-    #     """ GithubReports Report Writer
-
-    #     GithubReports method that will take the data that was collected
-    #     about the open pull requests and pass it to an HTML template via
-    #     Jinja, which will allow us to spit out a nicely html formatted
-    #     Open PR report Template.
-    #     """
-    #     # Define this methods identity for functional logging:
-    #     __id = inspect.stack()[0][3]
-    #     self.log(f"{__id} method called.", 'info', __id)
-
-    #     # Set Jinja Template and Output Paths
-    #     this_jinja_template_path = os.path.join(os.getcwd(), 'templates')
-    #     this_jinja_output_path = os.path.join(os.getcwd(), 'reports')
-    #     this_jinja_output_file = "OpenPRs.html"
-
-    #     # If a custom path was set then set it
-    #     if (
-    #         path is not None and
-    #         isinstance(path, str) and
-    #         os.path.exists(path)
-    #     ):
-    #         this_jinja_output_path = path
-
-    #     # Construct the full path to the output file
-    #     this_report = os.path.join(
-    #         this_jinja_template_path,
-    #         this_jinja_output_file
-    #     )
-
-    #     # Instantiate JinjaUtils Object and Load the Open PR Report Template.
-    #     # We don't need error checking as the JinjaUtils
-    #     # module already handles it in the module the same way this one does.
-    #     ThisJinja = JinjaUtils(verbose=self._verbose)
-
-    #     # Set Jinja env
-    #     ThisJinja.template_directory = this_jinja_template_path
-    #     ThisJinja.load = 'Github_Open_PR_Report.j2'
-
-    #     # Render the template
-    #     print(f"Jinja is Rendering: {this_report}...")
-    #     ThisJinja.render(
-    #         RepoNamespace=self.repo_namespace,
-    #         OpenPullRequests=self._search_results
-    #     )
-
-    #     # Write the template.
-    #     print(f"Jinja is Writing File: {this_report}...")
-    #     ThisJinja.write(
-    #         output_directory=this_jinja_output_path,
-    #         output_file=this_jinja_output_file,
-    #         backup=False
-    #     )
+    def _record_dispatch(self, notifier_stats, dispatch_summary):
+        """ GithubReports Dispatch Statistics Recorder
+
+        Record the comment hash cache hits and misses, write throttle waits,
+        and published, skipped and failed comment counts of a notifier
+        dispatch into the run statistics.
+
+        Parameters:
+            notifier_stats   (dict): required, notifier stats before dispatch
+            dispatch_summary (dict): required
+        """
+        this_after = self._notifier.stats
+        self._stats.cache(
+            'comment_hashes',
+            True,
+            this_after['cache_hits'] - notifier_stats['cache_hits']
+        )
+        self._stats.cache(
+            'comment_hashes',
+            False,
+            this_after['cache_misses'] - notifier_stats['cache_misses']
+        )
+        self._stats.rate_limit_wait(
+            this_after['throttle_seconds'] -
+            notifier_stats['throttle_seconds'],
+            'write_throttle',
+            this_after['throttle_waits'] - notifier_stats['throttle_waits']
+        )
+        for _result_, _count_ in dispatch_summary.items():
+            self._stats.count(f"comments_{_result_}", _count_)
+
+    def notification_plan(self, search_results=None):
+        """ GithubReports Notification Plan
+
+        GithubReports method that will construct the list of notification
+        comments that a search_open_pulls run with notify enabled would
+        publish, without making any Github calls. The plan is computed from
+        the provided search results, or from the results cached by the last
+        search_open_pulls run. Each plan entry is flagged as pending, or as
+        already published today according to the notifier comment cache.
+
+        Parameters:
+            search_results (list): optional [default=None]
+
+        Returns:
+            List of dictionaries describing each notification target
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} method called.", 'info', __id)
+
+        # Fall back to the results cached by the last search run.
+        if search_results is None:
+            search_results = self._search_results
+
+        if search_results is None:
+            self.log(
+                "No search results available to plan notifications from! "
+                "Run search_open_pulls() with notify disabled, or pass "
+                "previously collected results using "
+                "notification_plan(search_results=<results>).",
+                'error',
+                __id
+            )
+            return None
+
+        this_plan = []
+        for _pr_ in search_results:
+            if int(_pr_['age_days']) <= int(self._open_pr_threshold):
+                continue
+
+            this_mentions = _pr_.get('mentions')
+            if this_mentions is None:
+                this_mentions = [f"@{_pr_['submitter']}"]
+            this_message = self._notification_message(
+                this_mentions,
+                _pr_['link']
+            )
+            this_plan.append({
+                'id': _pr_['id'],
+                'repository': _pr_['repository'],
+                'number': _pr_['number'],
+                'link': _pr_['link'],
+                'age_days': _pr_['age_days'],
+                'mentions': list(this_mentions),
+                'message': this_message,
+                'pending': not self._notifier.is_published(
+                    _pr_['link'],
+                    this_message,
+                    fetch=False
+                )
+            })
+
+        self.log(
+            f"Notification plan contains {len(this_plan)} targets, "
+            f"{sum(_t_['pending'] for _t_ in this_plan)} pending.",
+            'info',
+            __id
+        )
+        return this_plan
+
+    def _load_template(self, template_name):
+        """ GithubReports Template Loader
+
+        Load and compile the requested report template from the
+        template_path directory. Compiled templates are cached on the class
+        and only recompiled when the template file is modified, so repeated
+        report writes never pay the template compilation cost twice.
+
+        Parameters:
+            template_name (str): required
+
+        Returns:
+            Compiled Jinja Template object
+        """
+        this_template_file = os.path.join(self._template_path, template_name)
+        this_template_mtime = os.path.getmtime(this_template_file)
+        this_cache_key = (self._template_path, template_name)
+
+        this_cached = GithubReports._template_cache.get(this_cache_key)
+        if this_cached is not None and this_cached[0] == this_template_mtime:
+            self._stats.cache('template', True)
+            return this_cached[1]
+        self._stats.cache('template', False)
+
+        from jinja2 import Environment, FileSystemLoader
+        ThisJinjaEnv = Environment(
+            loader=FileSystemLoader(self._template_path),
+            trim_blocks=True,
+            lstrip_blocks=True
+        )
+        ThisTemplate = ThisJinjaEnv.get_template(template_name)
+        GithubReports._template_cache[this_cache_key] = (
+            this_template_mtime,
+            ThisTemplate
+        )
+        return ThisTemplate
+
+    def write(
+        self,
+        path=None,
+        search_results=None,
+        output_file="OpenPRs.html"
+    ):
+        """ GithubReports Report Writer
+
+        GithubReports method that will take the data that was collected
+        about the open pull requests and pass it to an HTML template via
+        Jinja, which will allow us to spit out a nicely html formatted
+        Open PR report Template.
+
+        The report is streamed to the output file as it renders, so the
+        search results can be any iterable, including a generator, and are
+        never held in memory as a whole by the renderer.
+
+        Parameters:
+            path           (str) : optional [default=<cwd>/reports]
+            search_results (iter): optional [default=cached results]
+            output_file    (str) : optional [default=OpenPRs.html]
+
+        Returns:
+            Path to the written report file
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} method called.", 'info', __id)
+
+        # Fall back to the results cached by the last search run.
+        if search_results is None:
+            search_results = self._search_results
+
+        if search_results is None:
+            self.log(
+                "No search results available to write a report from! "
+                "Run search_open_pulls() before calling write(), or pass "
+                "previously collected results using "
+                "write(search_results=<results>).",
+                'error',
+                __id
+            )
+            return None
+
+        # Set the output path, if a custom path was set then use it.
+        if (
+            path is not None and
+            isinstance(path, str) and
+            os.path.exists(path)
+        ):
+            this_output_path = path
+        else:
+            this_output_path = os.path.join(os.getcwd(), 'reports')
+            os.makedirs(this_output_path, exist_ok=True)
+
+        # Construct the full path to the output file
+        this_report = os.path.join(this_output_path, output_file)
+
+        try:
+            ThisTemplate = self._load_template('Github_Open_PR_Report.j2')
+
+            # Render the template straight into the output file.
+            ThisProgress = self._progress_sink()
+            ThisProgress.event(f"Jinja is Rendering: {this_report}...")
+            ThisProgress.finish()
+            ThisReportStream = ThisTemplate.stream(
+                RepoNamespace=self._repo_namespace,
+                OpenPullRequests=search_results,
+                Now=datetime.now(timezone.utc)
+            )
+            ThisReportStream.enable_buffering(size=64)
+            with open(this_report, 'w') as ThisReportFile:
+                ThisReportStream.dump(ThisReportFile)
+
+            self.log(f"Report written to: {this_report}", 'info', __id)
+            return this_report
+        except Exception as e:
+            ThisWriteException = (
+                "An un-expected error occurred when attempting to "
+                f"render and write the report file: {this_report}"
+            )
+            ThisProgress = self._progress_sink()
+            ThisProgress.event(f"{ThisWriteException}\n")
+            ThisProgress.finish()
+            self.log(ThisWriteException, 'error', __id)
+            self._exception_handler(__id, e)
+            return None
+
+    def export(
+        self,
+        path,
+        export_format='csv',
+        search_results=None,
+        chunk_size=1000
+    ):
+        """ GithubReports Data Set Exporter
+
+        GithubReports method that will export the collected open pull
+        request data set to a CSV, JSONL, Parquet or Arrow file with typed
+        columns, writing chunk_size rows at a time.
+
+        Parameters:
+            path           (str) : required
+            export_format  (str) : optional [default=csv]
+            search_results (iter): optional [default=cached results]
+            chunk_size     (int) : optional [default=1000]
+
+        Returns:
+            Number of exported rows
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} method called.", 'info', __id)
+
+        # Fall back to the results cached by the last search run.
+        if search_results is None:
+            search_results = self._search_results
+
+        if search_results is None:
+            self.log(
+                "No search results available to export! "
+                "Run search_open_pulls() before calling export(), or pass "
+                "previously collected results using "
+                "export(search_results=<results>).",
+                'error',
+                __id
+            )
+            return None
+
+        ThisExporter = ReportExporter(
+            verbose=self._verbose,
+            log=self._log,
+            chunk_size=chunk_size
+        )
+        return ThisExporter.export(search_results, path, export_format)
+
+    def export_stats(self, path, export_format='prometheus'):
+        """ GithubReports Run Statistics Exporter
+
+        GithubReports method that will write the statistics of the last
+        search_open_pulls run to a Prometheus text exposition file, suitable
+        for the node_exporter textfile collector, or to an OpenTelemetry
+        OTLP JSON metrics file.
+
+        Parameters:
+            path          (str): required
+            export_format (str): optional [default=prometheus]
+
+        Returns:
+            Path of the written statistics file
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} method called.", 'info', __id)
+
+        if export_format not in ReportStats.export_formats:
+            self.log(
+                f"export_format expected one of {ReportStats.export_formats} "
+                f"but received: {export_format}",
+                'error',
+                __id
+            )
+            return None
+
+        try:
+            self._stats.export(path, export_format)
+            self.log(f"Run statistics written to: {path}", 'info', __id)
+            return path
+        except Exception as e:
+            self.log(
+                f"Unable to write run statistics to: {path}",
+                'error',
+                __id
+            )
+            self._exception_handler(__id, e)
+            return None
@@ -0,0 +1,1629 @@
+##############################################################################
+# CloudMage : Github API Stand-In Server
+# ============================================================================
+# CloudMage Github Stub Server
+#   - Serve a synthetic Github REST API and GraphQL subset from a local
+#     HTTP server, so report runs can be tested and benchmarked offline.
+#   - Synthetic organizations and users with configurable pull request,
+#     review and reviewer counts, injected latency and rate limit headers.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse, parse_qs, urlencode
+import threading
+import argparse
+import inspect
+import random
+import base64
+import shlex
+import json
+import time
+import math
+import zlib
+import sys
+import re
+
+
+#####################
+# Request Handler:  #
+#####################
+class _GithubStubHandler(BaseHTTPRequestHandler):
+    """ Github Stub Server HTTP Request Handler
+
+    Thin request handler that hands every request to the GithubStubServer
+    object that owns the HTTP server.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        """ Handle a GET request """
+        self.server.stub._handle(self, 'GET')
+
+    def do_POST(self):
+        """ Handle a POST request """
+        self.server.stub._handle(self, 'POST')
+
+    def log_message(self, format, *args):
+        """ Route the http.server access log to the stub debug log """
+        self.server.stub.log(format % args, 'debug', 'log_message')
+
+
+#####################
+# Class Definition: #
+#####################
+class GithubStubServer(object):
+    """ CloudMage Github Stub Server Class
+
+    This class is designed to stand in for the Github API during tests and
+    benchmarks. It generates a deterministic set of synthetic repositories,
+    open pull requests, review requests and reviews for each configured
+    namespace, and serves them over a local HTTP server using the same
+    payloads, pagination Link headers, search result cap and rate limit
+    headers as the Github REST API. A GraphQL subset is served on /graphql.
+
+    The GraphQL endpoint does not parse queries. The root fields search,
+    repository, organization, user and rateLimit are matched by name, their
+    arguments must be passed as variables, and every node is returned with
+    the full set of fields that the stub knows about. Like Github, the
+    repositories of a user include the repositories the user collaborates
+    on, every organization repository, unless ownerAffiliations is OWNER.
+    """
+
+    def __init__(
+        self,
+        verbose=False,
+        log=None,
+        orgs=('StubOrg',),
+        users=(),
+        repo_count=5,
+        pr_count=100,
+        review_count=2,
+        reviewer_count=2,
+        team_reviewer_count=1,
+        comment_count=0,
+        draft_ratio=0.0,
+        max_age_days=60,
+        latency=0.0,
+        rate_limit=5000,
+        search_rate_limit=30,
+        graphql_rate_limit=5000,
+        enforce_rate_limit=False,
+        search_cap=1000,
+        merge_delay=0.0,
+        seed=0,
+        host='127.0.0.1',
+        port=0
+    ):
+        """ GithubStubServer Class Constructor
+
+        Parameters:
+            verbose             (bool) : optional [default=False]
+            log                 (obj)  : optional [default=None]
+            orgs                (tuple): optional [default=('StubOrg',)]
+            users               (tuple): optional [default=()]
+            repo_count          (int)  : optional [default=5]
+            pr_count            (int)  : optional [default=100]
+            review_count        (int)  : optional [default=2]
+            reviewer_count      (int)  : optional [default=2]
+            team_reviewer_count (int)  : optional [default=1]
+            comment_count       (int)  : optional [default=0]
+            draft_ratio         (float): optional [default=0.0]
+            max_age_days        (int)  : optional [default=60]
+            latency             (float): optional [default=0.0]
+            rate_limit          (int)  : optional [default=5000]
+            search_rate_limit   (int)  : optional [default=30]
+            graphql_rate_limit  (int)  : optional [default=5000]
+            enforce_rate_limit  (bool) : optional [default=False]
+            search_cap          (int)  : optional [default=1000]
+            merge_delay         (float): optional [default=0.0] seconds
+                                         pending mergeability takes to
+                                         compute, None never computes it
+            seed                (int)  : optional [default=0]
+            host                (str)  : optional [default=127.0.0.1]
+            port                (int)  : optional [default=0 (any free port)]
+
+        Self Attributes:
+            self._verbose        (bool) : private
+            self._log            (obj)  : private
+            self._log_context    (str)  : private
+            self._config         (dict) : private
+            self._now            (obj)  : private
+            self._owners         (dict) : private
+            self._repos          (dict) : private
+            self._pulls          (dict) : private
+            self._pull_list      (list) : private
+            self._rate           (dict) : private
+            self._stats          (dict) : private
+            self._lock           (obj)  : private
+            self._httpd          (obj)  : private
+            self._thread         (obj)  : private
+        Properties:
+            self.base_url        (str)  : public
+            self.stats           (dict) : public
+            self.latency         (float): public
+
+        Methods:
+            self._exception_handler()
+            self.log()
+            self.start()
+            self.stop()
+            self.reset_stats()
+            self.pull_requests()
+        """
+        # Check the passed value to ensure its a bool before assignment.
+        if verbose is not None and isinstance(verbose, bool):
+            self._verbose = verbose
+        else:
+            self._verbose = False
+
+        # Check to ensure that the passed log object is in fact an object,
+        # and has the proper attributes, if not don't assign.
+        if (
+            log is not None and isinstance(log, object) and
+            hasattr(log, 'debug') and hasattr(log, 'info') and
+            hasattr(log, 'warning') and hasattr(log, 'error')
+        ):
+            self._log = log
+        else:
+            self._log = None
+
+        self._log_context = "CLS->GithubStubServer"
+
+        self._config = {
+            'repo_count': max(1, int(repo_count)),
+            'pr_count': max(0, int(pr_count)),
+            'review_count': max(0, int(review_count)),
+            'reviewer_count': max(0, int(reviewer_count)),
+            'team_reviewer_count': max(0, int(team_reviewer_count)),
+            'comment_count': max(0, int(comment_count)),
+            'draft_ratio': float(draft_ratio),
+            'max_age_days': max(1, int(max_age_days)),
+            'rate_limit': {
+                'core': int(rate_limit),
+                'search': int(search_rate_limit),
+                'graphql': int(graphql_rate_limit),
+            },
+            'enforce_rate_limit': bool(enforce_rate_limit),
+            'search_cap': max(1, int(search_cap)),
+            'merge_delay': (
+                None if merge_delay is None else max(0.0, float(merge_delay))
+            ),
+            'seed': seed,
+            'host': host,
+            'port': int(port),
+        }
+        self._latency = float(latency)
+
+        self._now = datetime.now(timezone.utc).replace(microsecond=0)
+        self._owners = {}
+        self._repos = {}
+        self._pulls = {}
+        self._pull_list = []
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+        self._next_id = 1000
+        self.reset_stats()
+
+        for _org_ in orgs:
+            self._generate_namespace(_org_, 'Organization')
+        for _user_ in users:
+            self._generate_namespace(_user_, 'User')
+
+    ############################################
+    # Class Exception Handler:                 #
+    ############################################
+    def _exception_handler(self, caller_function, exception_object):
+        """ Class Exception Handler
+
+        Handle any exceptions that arise in a universal format
+        for easy debuging purposes.
+
+        Parameters:
+            caller_function  (str):  required
+            exception_object (obj):  required
+
+        Returns:
+            Publish properly formatted exceptions
+            to log object or stdout, stderr
+        """
+        this_exception_msg = (
+            "EXCEPTION occurred in: "
+            f"{self._log_context}.{caller_function}, on line "
+            f"{sys.exc_info()[2].tb_lineno}: -> {str(exception_object)}"
+        )
+        self.log(this_exception_msg, 'error', caller_function)
+
+    ############################################
+    # Class Logger:                            #
+    ############################################
+    def log(self, log_msg, log_type, log_id):
+        """ Class Log Handler
+
+        Provides the logging for this class. If the class caller instantiates
+        the object with the verbose setting set to true, then the class will
+        log to stdout/stderr or to a provided log object if one was passed
+        during object instantiation.
+
+        Parameters:
+            log_msg  (str):  required
+            log_type (str):  required
+            log_id   (str):  required
+
+        Returns:
+            Log Stream
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        try:
+            # Internal method variable assignments:
+            this_log_msg_caller = f"{self._log_context}.{log_id}"
+
+            # Set the log message offset based on the message type:
+            # [debug=3, info=4, warning=1, error=3]
+            this_log_msg_offset = 3
+            if log_type.lower() == 'info':
+                this_log_msg_offset = 4
+            elif log_type.lower() == 'warning':
+                this_log_msg_offset = 1
+
+            # If a valid log object was passed into the class constructor,
+            # publish the log to the log object:
+            if self._log is not None:
+                # Set the log message prefix
+                this_log_message = f"{this_log_msg_caller}: -> {log_msg}"
+                if log_type.lower() == 'error':
+                    self._log.error(this_log_message)
+                elif log_type.lower() == 'warning':
+                    self._log.warning(this_log_message)
+                elif log_type.lower() == 'info':
+                    self._log.info(this_log_message)
+                else:
+                    self._log.debug(this_log_message)
+            # If no valid log object was passed into the class constructor,
+            # write the message to stdout, stderr:
+            else:
+                this_log_message = "{}    {}{}{}: -> {}".format(
+                    datetime.now(),
+                    log_type.upper(),
+                    " " * this_log_msg_offset,
+                    this_log_msg_caller,
+                    log_msg
+                )
+                if log_type.lower() == 'error':
+                    print(this_log_message, file=sys.stderr)
+                else:
+                    if self._verbose:
+                        print(this_log_message, file=sys.stdout)
+        except Exception as e:
+            self._exception_handler(__id, e)
+
+
+    ############################################
+    # Server Lifecycle:                        #
+    ############################################
+    def __enter__(self):
+        """ Start the stub server when used as a context manager """
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ Stop the stub server when leaving the context manager """
+        self.stop()
+
+    def start(self):
+        """ GithubStubServer Start
+
+        Start serving the synthetic API from a background thread, and
+        return the server object so calls can be chained.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        if self._httpd is not None:
+            return self
+
+        self._httpd = ThreadingHTTPServer(
+            (self._config['host'], self._config['port']),
+            _GithubStubHandler
+        )
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            name="GithubStubServer",
+            daemon=True
+        )
+        self._thread.start()
+        self.log(
+            f"Serving synthetic Github API on {self.base_url}",
+            'info',
+            __id
+        )
+        return self
+
+    def stop(self):
+        """ GithubStubServer Stop
+
+        Shut down the background HTTP server if it is running.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        if self._httpd is None:
+            return
+
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = None
+        self._thread = None
+        self.log("Stopped synthetic Github API server", 'info', __id)
+
+    ############################################
+    # Server Properties:                       #
+    ############################################
+    @property
+    def base_url(self):
+        """ base_url Property Getter
+
+        Getter method for the base_url property.
+        This method will return the url that the stub API is served on.
+        """
+        if self._httpd is None:
+            return None
+        this_host, this_port = self._httpd.server_address[:2]
+        return f"http://{this_host}:{this_port}"
+
+    @property
+    def latency(self):
+        """ latency Property Getter
+
+        Getter method for the latency property.
+        This method will return the injected per request latency.
+        """
+        return self._latency
+
+    @latency.setter
+    def latency(self, latency):
+        """ latency Property Setter
+
+        Setter method for the latency property.
+        This method will set the injected per request latency in seconds.
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        if (
+            isinstance(latency, (int, float)) and
+            not isinstance(latency, bool) and
+            latency >= 0
+        ):
+            self._latency = float(latency)
+        else:
+            self.log(
+                f"{__id} property argument expected a positive number "
+                f"but received type: {type(latency)}",
+                'error',
+                __id
+            )
+
+    @property
+    def stats(self):
+        """ stats Property Getter
+
+        Getter method for the stats property. This method will return the
+        number of requests served per endpoint, bytes sent, and the number
+        of requests rejected by the enforced rate limit.
+        """
+        with self._lock:
+            return {
+                'requests': self._stats['requests'],
+                'bytes_sent': self._stats['bytes_sent'],
+                'rate_limited': self._stats['rate_limited'],
+                'endpoints': dict(self._stats['endpoints']),
+            }
+
+    def reset_stats(self):
+        """ Reset the request counters and rate limit budgets """
+        with self._lock:
+            self._stats = {
+                'requests': 0,
+                'bytes_sent': 0,
+                'rate_limited': 0,
+                'endpoints': {},
+            }
+            self._rate = {}
+
+    def pull_requests(self, namespace=None):
+        """ GithubStubServer Pull Request Records
+
+        Return the synthetic pull request records, optionally limited to a
+        single namespace. Useful to compute expected results in tests.
+        """
+        return [
+            _pull_ for _pull_ in self._pull_list
+            if namespace is None or
+            _pull_['owner'].lower() == namespace.lower()
+        ]
+
+    ############################################
+    # Synthetic Data Generation:               #
+    ############################################
+    @staticmethod
+    def _timestamp(value):
+        """ Format a datetime the way the Github API does """
+        if value is None:
+            return None
+        return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def _new_id(self):
+        """ Return the next synthetic object id """
+        self._next_id += 1
+        return self._next_id
+
+    def _generate_namespace(self, namespace, owner_type):
+        """ Generate the repositories and pull requests of a namespace """
+        this_config = self._config
+        this_rng = random.Random(f"{this_config['seed']}:{namespace}")
+
+        self._owners[namespace.lower()] = {
+            'login': namespace,
+            'id': self._new_id(),
+            'type': owner_type,
+        }
+        this_repos = []
+        for _index_ in range(this_config['repo_count']):
+            this_repo = {
+                'id': self._new_id(),
+                'name': f"repo-{_index_}",
+                'full_name': f"{namespace}/repo-{_index_}",
+                'owner': namespace,
+                'created_at': self._now - timedelta(days=365),
+                'pulls': [],
+            }
+            self._repos[this_repo['full_name'].lower()] = this_repo
+            this_repos.append(this_repo)
+
+        this_user_pool = [
+            f"reviewer-{_k_}"
+            for _k_ in range(max(10, this_config['reviewer_count'] * 3))
+        ]
+        this_team_pool = [
+            f"team-{_k_}"
+            for _k_ in range(max(3, this_config['team_reviewer_count'] * 2))
+        ]
+        this_max_age = this_config['max_age_days'] * 86400
+
+        for _index_ in range(this_config['pr_count']):
+            this_repo = this_repos[_index_ % len(this_repos)]
+            this_created = self._now - timedelta(
+                seconds=this_rng.randint(3600, this_max_age)
+            )
+            this_open_for = (self._now - this_created).total_seconds()
+
+            def after_created(this_rng=this_rng):
+                """ Return a random moment between creation and now """
+                return this_created + timedelta(
+                    seconds=int(this_rng.uniform(60, this_open_for))
+                )
+
+            this_requested_users = this_rng.sample(
+                this_user_pool,
+                min(this_config['reviewer_count'], len(this_user_pool))
+            )
+            this_requested_teams = this_rng.sample(
+                this_team_pool,
+                min(this_config['team_reviewer_count'], len(this_team_pool))
+            )
+            this_reviews = sorted(
+                (
+                    {
+                        'id': self._new_id(),
+                        'user': this_rng.choice(
+                            this_requested_users + this_user_pool[:1]
+                        ),
+                        'state': this_rng.choice([
+                            'APPROVED', 'CHANGES_REQUESTED', 'COMMENTED'
+                        ]),
+                        'submitted_at': after_created(),
+                    }
+                    for _k_ in range(this_config['review_count'])
+                ),
+                key=lambda _review_: _review_['submitted_at']
+            )
+            this_comments = sorted(
+                (
+                    {
+                        'id': self._new_id(),
+                        'user': this_rng.choice(this_user_pool),
+                        'body': f"Synthetic comment {_k_}",
+                        'created_at': after_created(),
+                    }
+                    for _k_ in range(this_config['comment_count'])
+                ),
+                key=lambda _comment_: _comment_['created_at']
+            )
+            this_last_commit = after_created()
+            this_mergeable = this_rng.choice([True, True, True, False, None])
+
+            this_pull = {
+                'id': self._new_id(),
+                'number': len(this_repo['pulls']) + 1,
+                'owner': namespace,
+                'repo': this_repo['full_name'],
+                'title': f"Synthetic pull request {_index_}",
+                'body': f"Synthetic pull request body {_index_}",
+                'user': f"author-{this_rng.randint(0, 19)}",
+                'created_at': this_created,
+                'review_requested_at': this_created + timedelta(minutes=5),
+                'last_commit_at': this_last_commit,
+                'draft': this_rng.random() < this_config['draft_ratio'],
+                'labels': [
+                    this_rng.choice(['bug', 'enhancement', 'documentation'])
+                ],
+                'requested_users': this_requested_users,
+                'requested_teams': this_requested_teams,
+                'reviews': this_reviews,
+                'comments': this_comments,
+                'mergeable': this_mergeable,
+                'mergeable_state': {
+                    True: 'clean', False: 'dirty', None: 'unknown'
+                }[this_mergeable],
+            }
+            this_repo['pulls'].append(this_pull)
+            self._pulls[
+                (this_repo['full_name'].lower(), this_pull['number'])
+            ] = this_pull
+            self._pull_list.append(this_pull)
+
+    @staticmethod
+    def _updated_at(pull):
+        """ Return the latest activity timestamp of a pull request """
+        return max(
+            [pull['created_at'], pull['last_commit_at']] +
+            [_r_['submitted_at'] for _r_ in pull['reviews']] +
+            [_c_['created_at'] for _c_ in pull['comments']]
+        )
+
+    ############################################
+    # REST Payloads:                           #
+    ############################################
+    def _user_json(self, login, user_type='User'):
+        """ Construct a user payload """
+        return {
+            'login': login,
+            'id': zlib.crc32(login.encode()) % 10000000,
+            'node_id': base64.b64encode(f"U_{login}".encode()).decode(),
+            'avatar_url': f"https://avatars.githubusercontent.com/{login}",
+            'url': f"{self.base_url}/users/{login}",
+            'html_url': f"https://github.com/{login}",
+            'type': user_type,
+            'site_admin': False,
+        }
+
+    def _team_json(self, namespace, slug):
+        """ Construct a team payload """
+        return {
+            'id': zlib.crc32(f"{namespace}/{slug}".encode()) % 10000000,
+            'name': slug,
+            'slug': slug,
+            'url': f"{self.base_url}/orgs/{namespace}/teams/{slug}",
+            'html_url': f"https://github.com/orgs/{namespace}/teams/{slug}",
+            'privacy': 'closed',
+            'permission': 'pull',
+        }
+
+    def _repo_json(self, repo):
+        """ Construct a repository payload """
+        this_owner = self._owners[repo['owner'].lower()]
+        this_api = f"{self.base_url}/repos/{repo['full_name']}"
+        return {
+            'id': repo['id'],
+            'node_id': base64.b64encode(f"R_{repo['id']}".encode()).decode(),
+            'name': repo['name'],
+            'full_name': repo['full_name'],
+            'private': False,
+            'owner': self._user_json(this_owner['login'], this_owner['type']),
+            'html_url': f"https://github.com/{repo['full_name']}",
+            'url': this_api,
+            'pulls_url': f"{this_api}/pulls{{/number}}",
+            'issues_url': f"{this_api}/issues{{/number}}",
+            'description': f"Synthetic repository {repo['name']}",
+            'fork': False,
+            'created_at': self._timestamp(repo['created_at']),
+            'updated_at': self._timestamp(self._now),
+            'pushed_at': self._timestamp(self._now),
+            'default_branch': 'main',
+            'open_issues_count': len(repo['pulls']),
+            'archived': False,
+            'disabled': False,
+        }
+
+    def _issue_json(self, pull):
+        """ Construct an issue payload for a pull request """
+        this_api = f"{self.base_url}/repos/{pull['repo']}"
+        this_html = f"https://github.com/{pull['repo']}/pull/{pull['number']}"
+        return {
+            'url': f"{this_api}/issues/{pull['number']}",
+            'repository_url': this_api,
+            'comments_url': f"{this_api}/issues/{pull['number']}/comments",
+            'html_url': this_html,
+            'id': pull['id'],
+            'node_id': base64.b64encode(f"I_{pull['id']}".encode()).decode(),
+            'number': pull['number'],
+            'title': pull['title'],
+            'user': self._user_json(pull['user']),
+            'labels': [
+                {'name': _label_, 'color': 'ededed'}
+                for _label_ in pull['labels']
+            ],
+            'state': 'open',
+            'locked': False,
+            'comments': len(pull['comments']),
+            'created_at': self._timestamp(pull['created_at']),
+            'updated_at': self._timestamp(self._updated_at(pull)),
+            'closed_at': None,
+            'draft': pull['draft'],
+            'body': pull['body'],
+            'pull_request': {
+                'url': f"{this_api}/pulls/{pull['number']}",
+                'html_url': this_html,
+                'merged_at': None,
+            },
+        }
+
+    # Fields of the full pull request payload that the pull-request-simple
+    # payload of pull request listings leaves out.
+    _detail_fields = (
+        'merged', 'merged_by', 'mergeable', 'mergeable_state', 'comments',
+        'review_comments', 'commits'
+    )
+
+    def _simple_pull_json(self, pull):
+        """ Construct a pull request listing payload """
+        this_payload = self._pull_json(pull)
+        for _field_ in self._detail_fields:
+            del this_payload[_field_]
+        return this_payload
+
+    def _pull_json(self, pull):
+        """ Construct a pull request payload """
+        this_api = f"{self.base_url}/repos/{pull['repo']}"
+        this_repo = self._repos[pull['repo'].lower()]
+        return {
+            'url': f"{this_api}/pulls/{pull['number']}",
+            'id': pull['id'],
+            'node_id': base64.b64encode(f"PR_{pull['id']}".encode()).decode(),
+            'html_url': (
+                f"https://github.com/{pull['repo']}/pull/{pull['number']}"
+            ),
+            'issue_url': f"{this_api}/issues/{pull['number']}",
+            'number': pull['number'],
+            'state': 'open',
+            'locked': False,
+            'title': pull['title'],
+            'user': self._user_json(pull['user']),
+            'body': pull['body'],
+            'labels': [
+                {'name': _label_, 'color': 'ededed'}
+                for _label_ in pull['labels']
+            ],
+            'created_at': self._timestamp(pull['created_at']),
+            'updated_at': self._timestamp(self._updated_at(pull)),
+            'closed_at': None,
+            'merged_at': None,
+            'merged': False,
+            'merged_by': None,
+            'mergeable': pull['mergeable'],
+            'mergeable_state': pull['mergeable_state'],
+            'draft': pull['draft'],
+            'requested_reviewers': [
+                self._user_json(_login_) for _login_ in pull['requested_users']
+            ],
+            'requested_teams': [
+                self._team_json(pull['owner'], _slug_)
+                for _slug_ in pull['requested_teams']
+            ],
+            'comments': len(pull['comments']),
+            'review_comments': 0,
+            'commits': 1,
+            'head': {'ref': f"feature-{pull['number']}", 'sha': 'f' * 40},
+            'base': {'ref': 'main', 'repo': self._repo_json(this_repo)},
+        }
+
+    def _review_json(self, pull, review):
+        """ Construct a pull request review payload """
+        this_html = f"https://github.com/{pull['repo']}/pull/{pull['number']}"
+        return {
+            'id': review['id'],
+            'user': self._user_json(review['user']),
+            'body': '',
+            'state': review['state'],
+            'html_url': f"{this_html}#pullrequestreview-{review['id']}",
+            'pull_request_url': (
+                f"{self.base_url}/repos/{pull['repo']}/pulls/{pull['number']}"
+            ),
+            'submitted_at': self._timestamp(review['submitted_at']),
+            'commit_id': 'f' * 40,
+        }
+
+    def _comment_json(self, pull, comment):
+        """ Construct an issue comment payload """
+        this_api = f"{self.base_url}/repos/{pull['repo']}"
+        return {
+            'id': comment['id'],
+            'url': f"{this_api}/issues/comments/{comment['id']}",
+            'html_url': (
+                f"https://github.com/{pull['repo']}/pull/{pull['number']}"
+                f"#issuecomment-{comment['id']}"
+            ),
+            'issue_url': f"{this_api}/issues/{pull['number']}",
+            'user': self._user_json(comment['user']),
+            'body': comment['body'],
+            'created_at': self._timestamp(comment['created_at']),
+            'updated_at': self._timestamp(comment['created_at']),
+        }
+
+    ############################################
+    # Search Query Filtering:                  #
+    ############################################
+    @staticmethod
+    def _parse_date(value, upper=False):
+        """ Parse a search qualifier date, rounding date only values up
+        to the end of the day when used as an upper bound.
+        """
+        this_date_only = len(value) == 10
+        this_value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if this_value.tzinfo is None:
+            this_value = this_value.replace(tzinfo=timezone.utc)
+        if this_date_only and upper:
+            this_value += timedelta(days=1)
+        return this_value
+
+    def _date_filter(self, field, value):
+        """ Return a predicate for a created: or updated: qualifier """
+        def value_of(pull):
+            """ Return the timestamp being filtered on """
+            if field == 'updated':
+                return self._updated_at(pull)
+            return pull['created_at']
+
+        if '..' in value:
+            this_low, this_high = value.split('..', 1)
+            this_low = None if this_low == '*' else self._parse_date(this_low)
+            this_high = (
+                None if this_high == '*'
+                else self._parse_date(this_high, upper=True)
+            )
+            return lambda _p_: (
+                (this_low is None or value_of(_p_) >= this_low) and
+                (this_high is None or value_of(_p_) < this_high)
+            )
+        for _op_ in ('<=', '>=', '<', '>'):
+            if value.startswith(_op_):
+                this_date = value[len(_op_):]
+                if _op_ == '<=':
+                    this_bound = self._parse_date(this_date, upper=True)
+                    return lambda _p_: value_of(_p_) < this_bound
+                if _op_ == '>=':
+                    this_bound = self._parse_date(this_date)
+                    return lambda _p_: value_of(_p_) >= this_bound
+                if _op_ == '<':
+                    this_bound = self._parse_date(this_date)
+                    return lambda _p_: value_of(_p_) < this_bound
+                this_bound = self._parse_date(this_date, upper=True)
+                return lambda _p_: value_of(_p_) >= this_bound
+        this_low = self._parse_date(value)
+        this_high = self._parse_date(value, upper=True)
+        return lambda _p_: this_low <= value_of(_p_) < this_high
+
+    @staticmethod
+    def _review_decision(pull):
+        """ Return the review decision derived from the reviews """
+        this_latest = {}
+        for _review_ in pull['reviews']:
+            if _review_['state'] != 'COMMENTED':
+                this_latest[_review_['user']] = _review_['state']
+        if 'CHANGES_REQUESTED' in this_latest.values():
+            return 'changes_requested'
+        if 'APPROVED' in this_latest.values():
+            return 'approved'
+        return 'required'
+
+    def _search(self, query):
+        """ Return the pull requests matching a search query string, and
+        the sort qualifier found in the query, if any.
+        """
+        try:
+            this_terms = shlex.split(query)
+        except ValueError:
+            this_terms = query.split()
+
+        this_filters = []
+        this_sort = None
+        for _term_ in this_terms:
+            this_negate = _term_.startswith('-')
+            this_key, _, this_value = _term_.lstrip('-').partition(':')
+            this_key = this_key.lower()
+            this_filter = None
+
+            if not this_value:
+                continue
+            if this_key in ('org', 'user'):
+                this_filter = (
+                    lambda _p_, _v_=this_value.lower():
+                    _p_['owner'].lower() == _v_
+                )
+            elif this_key == 'repo':
+                this_filter = (
+                    lambda _p_, _v_=this_value.lower():
+                    _p_['repo'].lower() == _v_
+                )
+            elif this_key in ('is', 'type', 'state'):
+                # Only open, unmerged pull requests are generated.
+                if this_value.lower() in (
+                    'issue', 'closed', 'merged'
+                ):
+                    this_filter = (lambda _p_: False)
+            elif this_key == 'draft':
+                this_filter = (
+                    lambda _p_, _v_=this_value.lower() == 'true':
+                    _p_['draft'] == _v_
+                )
+            elif this_key == 'label':
+                # label:a,b matches pull requests with any of the labels.
+                this_filter = (
+                    lambda _p_, _v_=set(this_value.split(',')):
+                    not _v_.isdisjoint(_p_['labels'])
+                )
+            elif this_key == 'review':
+                this_filter = (
+                    lambda _p_, _v_=this_value.lower():
+                    (
+                        not _p_['reviews'] if _v_ == 'none'
+                        else self._review_decision(_p_) == _v_
+                    )
+                )
+            elif this_key in ('created', 'updated'):
+                this_filter = self._date_filter(this_key, this_value)
+            elif this_key == 'sort':
+                this_sort = this_value.lower()
+
+            if this_filter is not None:
+                if this_negate:
+                    this_filter = (
+                        lambda _p_, _f_=this_filter: not _f_(_p_)
+                    )
+                this_filters.append(this_filter)
+
+        return (
+            [
+                _pull_ for _pull_ in self._pull_list
+                if all(_f_(_pull_) for _f_ in this_filters)
+            ],
+            this_sort
+        )
+
+    def _sorted(self, pulls, sort, order):
+        """ Sort pull requests by a search sort field and order """
+        if sort is None:
+            return pulls
+        this_field, _, this_order = sort.partition('-')
+        this_order = this_order or order or 'desc'
+        if this_field == 'updated':
+            this_key = self._updated_at
+        elif this_field == 'comments':
+            this_key = (lambda _p_: len(_p_['comments']))
+        else:
+            this_key = (lambda _p_: _p_['created_at'])
+        return sorted(pulls, key=this_key, reverse=(this_order == 'desc'))
+
+    ############################################
+    # Request Handling:                        #
+    ############################################
+    def _rate_headers(self, resource):
+        """ Consume one request from a rate limit budget and return the
+        rate limit headers, and whether the request is allowed.
+        """
+        this_now = time.time()
+        this_window = 60 if resource == 'search' else 3600
+        this_limit = self._config['rate_limit'][resource]
+        with self._lock:
+            this_state = self._rate.get(resource)
+            if this_state is None or this_now >= this_state['reset']:
+                this_state = {'used': 0, 'reset': int(this_now) + this_window}
+                self._rate[resource] = this_state
+            this_state['used'] += 1
+            this_allowed = (
+                not self._config['enforce_rate_limit'] or
+                this_state['used'] <= this_limit
+            )
+            if not this_allowed:
+                this_state['used'] = this_limit
+                self._stats['rate_limited'] += 1
+            this_headers = {
+                'X-RateLimit-Limit': str(this_limit),
+                'X-RateLimit-Remaining': str(
+                    max(0, this_limit - this_state['used'])
+                ),
+                'X-RateLimit-Reset': str(this_state['reset']),
+                'X-RateLimit-Used': str(this_state['used']),
+                'X-RateLimit-Resource': resource,
+            }
+        return this_headers, this_allowed
+
+    def _link_header(self, path, params, page, last_page):
+        """ Construct a pagination Link header """
+        this_links = []
+
+        def page_url(this_page):
+            """ Return the url of a result page """
+            this_params = dict(params)
+            this_params['page'] = this_page
+            return f"{self.base_url}{path}?{urlencode(this_params)}"
+
+        if page < last_page:
+            this_links.append(f'<{page_url(page + 1)}>; rel="next"')
+            this_links.append(f'<{page_url(last_page)}>; rel="last"')
+        if page > 1:
+            this_links.append(f'<{page_url(1)}>; rel="first"')
+            this_links.append(f'<{page_url(page - 1)}>; rel="prev"')
+        return ', '.join(this_links)
+
+    def _paginate(self, items, path, params, cap=None):
+        """ Return a page of items, the Link header, and an error status
+        if the requested page is beyond the search result cap.
+        """
+        this_per_page = min(max(int(params.get('per_page', 30)), 1), 100)
+        this_page = max(int(params.get('page', 1)), 1)
+        this_available = len(items) if cap is None else min(len(items), cap)
+        this_last_page = max(1, math.ceil(this_available / this_per_page))
+
+        if cap is not None and (this_page - 1) * this_per_page >= cap:
+            return None, '', 422
+
+        this_start = (this_page - 1) * this_per_page
+        this_end = min(this_start + this_per_page, this_available)
+        return (
+            items[this_start:this_end],
+            self._link_header(path, params, this_page, this_last_page),
+            200
+        )
+
+    def _send(self, handler, status, payload, headers):
+        """ Write a JSON response """
+        this_body = json.dumps(payload).encode('utf-8')
+        handler.send_response(status)
+        handler.send_header('Content-Type', 'application/json; charset=utf-8')
+        handler.send_header('Content-Length', str(len(this_body)))
+        for _name_, _value_ in headers.items():
+            if _value_:
+                handler.send_header(_name_, _value_)
+        handler.end_headers()
+        handler.wfile.write(this_body)
+        with self._lock:
+            self._stats['bytes_sent'] += len(this_body)
+
+    _routes = [
+        ('GET', r'/rate_limit', '_get_rate_limit'),
+        ('GET', r'/search/issues', '_get_search_issues'),
+        ('GET', r'/(orgs|users)/(?P<owner>[^/]+)', '_get_owner'),
+        ('GET', r'/(orgs|users)/(?P<owner>[^/]+)/repos', '_get_owner_repos'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)', '_get_repo'),
+        ('GET', r'/repos/(?P<repo>[^/]+/[^/]+)/pulls', '_get_pulls'),
+        (
+            'GET',
+            r'/repos/(?P<repo>[^/]+/[^/]+)/pulls/(?P<number>\d+)',
+            '_get_pull'
+        ),
+        (
+            'GET',
+            r'/repos/(?P<repo>[^/]+/[^/]+)/pulls/(?P<number>\d+)'
+            r'/requested_reviewers',
+            '_get_requested_reviewers'
+        ),
+        (
+            'GET',
+            r'/repos/(?P<repo>[^/]+/[^/]+)/pulls/(?P<number>\d+)/reviews',
+            '_get_reviews'
+        ),
+        (
+            'GET',
+            r'/repos/(?P<repo>[^/]+/[^/]+)/issues/(?P<number>\d+)',
+            '_get_issue'
+        ),
+        (
+            'GET',
+            r'/repos/(?P<repo>[^/]+/[^/]+)/issues/(?P<number>\d+)/comments',
+            '_get_comments'
+        ),
+        (
+            'POST',
+            r'/repos/(?P<repo>[^/]+/[^/]+)/issues/(?P<number>\d+)/comments',
+            '_post_comment'
+        ),
+        ('POST', r'/graphql', '_post_graphql'),
+    ]
+
+    def _handle(self, handler, method):
+        """ Route a request to its endpoint method and send the response """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+
+        this_url = urlparse(handler.path)
+        this_path = this_url.path
+        # Accept Github Enterprise style /api/v3 prefixed paths.
+        if this_path.startswith('/api/v3'):
+            this_path = this_path[len('/api/v3'):]
+        this_path = this_path.rstrip('/') or '/'
+        this_params = {
+            _k_: _v_[-1] for _k_, _v_ in parse_qs(this_url.query).items()
+        }
+        this_body = None
+        this_length = int(handler.headers.get('Content-Length') or 0)
+        if this_length:
+            this_body = json.loads(handler.rfile.read(this_length) or b'null')
+
+        if self._latency:
+            time.sleep(self._latency)
+
+        for _method_, _pattern_, _endpoint_ in self._routes:
+            this_match = re.fullmatch(_pattern_, this_path)
+            if _method_ == method and this_match:
+                break
+        else:
+            self._send(
+                handler,
+                404,
+                {'message': 'Not Found'},
+                {}
+            )
+            return
+
+        this_endpoint_name = f"{method} " + re.sub(
+            r'\(\?P<(\w+)>[^)]*\)|\((\w+)\|\w+\)',
+            lambda _m_: f"{{{_m_.group(1) or _m_.group(2)}}}",
+            _pattern_
+        )
+        with self._lock:
+            self._stats['requests'] += 1
+            self._stats['endpoints'][this_endpoint_name] = (
+                self._stats['endpoints'].get(this_endpoint_name, 0) + 1
+            )
+
+        if _endpoint_ == '_get_rate_limit':
+            this_headers, this_allowed = {}, True
+        else:
+            this_resource = 'core'
+            if this_path.startswith('/search'):
+                this_resource = 'search'
+            elif this_path == '/graphql':
+                this_resource = 'graphql'
+            this_headers, this_allowed = self._rate_headers(this_resource)
+
+        if not this_allowed:
+            self._send(
+                handler,
+                403,
+                {'message': 'API rate limit exceeded'},
+                this_headers
+            )
+            return
+
+        try:
+            this_status, this_payload, this_extra = getattr(self, _endpoint_)(
+                this_path,
+                this_params,
+                this_body,
+                **this_match.groupdict()
+            )
+        except Exception as e:
+            self._exception_handler(__id, e)
+            this_status, this_payload, this_extra = (
+                500, {'message': str(e)}, {}
+            )
+        this_headers.update(this_extra)
+        self._send(handler, this_status, this_payload, this_headers)
+
+    def _not_found(self):
+        """ Return a Github style 404 response """
+        return 404, {'message': 'Not Found'}, {}
+
+    ############################################
+    # REST Endpoints:                          #
+    ############################################
+    def _get_rate_limit(self, path, params, body):
+        """ GET /rate_limit """
+        this_now = time.time()
+        this_resources = {}
+        with self._lock:
+            for _resource_, _limit_ in self._config['rate_limit'].items():
+                this_state = self._rate.get(_resource_)
+                this_used = 0
+                this_reset = int(this_now) + (
+                    60 if _resource_ == 'search' else 3600
+                )
+                if this_state is not None and this_now < this_state['reset']:
+                    this_used = this_state['used']
+                    this_reset = this_state['reset']
+                this_resources[_resource_] = {
+                    'limit': _limit_,
+                    'used': this_used,
+                    'remaining': max(0, _limit_ - this_used),
+                    'reset': this_reset,
+                }
+        return 200, {
+            'resources': this_resources,
+            'rate': this_resources['core'],
+        }, {}
+
+    def _get_search_issues(self, path, params, body):
+        """ GET /search/issues """
+        this_pulls, this_sort = self._search(params.get('q', ''))
+        this_pulls = self._sorted(
+            this_pulls,
+            params.get('sort', this_sort),
+            params.get('order')
+        )
+        this_page, this_link, this_status = self._paginate(
+            this_pulls, path, params, cap=self._config['search_cap']
+        )
+        if this_status != 200:
+            return this_status, {
+                'message': (
+                    f"Only the first {self._config['search_cap']} search "
+                    "results are available"
+                )
+            }, {}
+        return 200, {
+            'total_count': len(this_pulls),
+            'incomplete_results': False,
+            'items': [self._issue_json(_pull_) for _pull_ in this_page],
+        }, {'Link': this_link}
+
+    def _get_owner(self, path, params, body, owner):
+        """ GET /orgs/{owner} and /users/{owner} """
+        this_owner = self._owners.get(owner.lower())
+        if this_owner is None:
+            return self._not_found()
+        this_payload = self._user_json(this_owner['login'], this_owner['type'])
+        this_payload['public_repos'] = self._config['repo_count']
+        return 200, this_payload, {}
+
+    def _get_owner_repos(self, path, params, body, owner):
+        """ GET /orgs/{owner}/repos and /users/{owner}/repos """
+        if owner.lower() not in self._owners:
+            return self._not_found()
+        this_repos = [
+            _repo_ for _repo_ in self._repos.values()
+            if _repo_['owner'].lower() == owner.lower()
+        ]
+        this_page, this_link, _ = self._paginate(this_repos, path, params)
+        return 200, [self._repo_json(_r_) for _r_ in this_page], {
+            'Link': this_link
+        }
+
+    def _get_repo(self, path, params, body, repo):
+        """ GET /repos/{owner}/{repo} """
+        this_repo = self._repos.get(repo.lower())
+        if this_repo is None:
+            return self._not_found()
+        return 200, self._repo_json(this_repo), {}
+
+    def _get_pulls(self, path, params, body, repo):
+        """ GET /repos/{owner}/{repo}/pulls """
+        this_repo = self._repos.get(repo.lower())
+        if this_repo is None:
+            return self._not_found()
+        this_pulls = this_repo['pulls']
+        if params.get('state', 'open') == 'closed':
+            this_pulls = []
+        this_sort = params.get('sort', 'created')
+        this_pulls = self._sorted(
+            this_pulls,
+            this_sort if this_sort != 'popularity' else 'comments',
+            params.get('direction', 'desc')
+        )
+        this_page, this_link, _ = self._paginate(this_pulls, path, params)
+        return 200, [self._simple_pull_json(_p_) for _p_ in this_page], {
+            'Link': this_link
+        }
+
+    def _find_pull(self, repo, number):
+        """ Return the synthetic pull request record or None """
+        return self._pulls.get((repo.lower(), int(number)))
+
+    def _get_pull(self, path, params, body, repo, number):
+        """ GET /repos/{owner}/{repo}/pulls/{number} """
+        this_pull = self._find_pull(repo, number)
+        if this_pull is None:
+            return self._not_found()
+        self._compute_mergeability(this_pull)
+        return 200, self._pull_json(this_pull), {}
+
+    def _compute_mergeability(self, pull):
+        """ Advance the background mergeability computation of a pull
+
+        As on Github, the first request for a pull request whose
+        mergeability is not known starts computing it, and requests made
+        merge_delay seconds later receive the computed state.
+        """
+        this_delay = self._config['merge_delay']
+        if this_delay is None or pull['mergeable'] is not None:
+            return
+        with self._lock:
+            if 'merge_started' not in pull:
+                pull['merge_started'] = time.monotonic()
+            elif time.monotonic() - pull['merge_started'] >= this_delay:
+                pull.update(mergeable=True, mergeable_state='clean')
+
+    def _get_issue(self, path, params, body, repo, number):
+        """ GET /repos/{owner}/{repo}/issues/{number} """
+        this_pull = self._find_pull(repo, number)
+        if this_pull is None:
+            return self._not_found()
+        return 200, self._issue_json(this_pull), {}
+
+    def _get_requested_reviewers(self, path, params, body, repo, number):
+        """ GET /repos/{owner}/{repo}/pulls/{number}/requested_reviewers """
+        this_pull = self._find_pull(repo, number)
+        if this_pull is None:
+            return self._not_found()
+        return 200, {
+            'users': [
+                self._user_json(_login_)
+                for _login_ in this_pull['requested_users']
+            ],
+            'teams': [
+                self._team_json(this_pull['owner'], _slug_)
+                for _slug_ in this_pull['requested_teams']
+            ],
+        }, {}
+
+    def _get_reviews(self, path, params, body, repo, number):
+        """ GET /repos/{owner}/{repo}/pulls/{number}/reviews """
+        this_pull = self._find_pull(repo, number)
+        if this_pull is None:
+            return self._not_found()
+        this_page, this_link, _ = self._paginate(
+            this_pull['reviews'], path, params
+        )
+        return 200, [
+            self._review_json(this_pull, _review_) for _review_ in this_page
+        ], {'Link': this_link}
+
+    def _get_comments(self, path, params, body, repo, number):
+        """ GET /repos/{owner}/{repo}/issues/{number}/comments """
+        this_pull = self._find_pull(repo, number)
+        if this_pull is None:
+            return self._not_found()
+        this_page, this_link, _ = self._paginate(
+            this_pull['comments'], path, params
+        )
+        return 200, [
+            self._comment_json(this_pull, _c_) for _c_ in this_page
+        ], {'Link': this_link}
+
+    def _post_comment(self, path, params, body, repo, number):
+        """ POST /repos/{owner}/{repo}/issues/{number}/comments """
+        this_pull = self._find_pull(repo, number)
+        if this_pull is None:
+            return self._not_found()
+        if not isinstance(body, dict) or not body.get('body'):
+            return 422, {'message': 'Validation Failed'}, {}
+        this_comment = {
+            'id': self._new_id(),
+            'user': 'stub-bot',
+            'body': body['body'],
+            'created_at': datetime.now(timezone.utc).replace(microsecond=0),
+        }
+        with self._lock:
+            this_pull['comments'].append(this_comment)
+        return 201, self._comment_json(this_pull, this_comment), {}
+
+    ############################################
+    # GraphQL Subset:                          #
+    ############################################
+    @staticmethod
+    def _cursor(offset):
+        """ Encode a connection cursor """
+        return base64.b64encode(f"cursor:{offset}".encode()).decode()
+
+    @staticmethod
+    def _offset(cursor):
+        """ Decode a connection cursor into an offset """
+        if not cursor:
+            return 0
+        return int(base64.b64decode(cursor).decode().split(':', 1)[1])
+
+    def _connection(self, items, variables, serializer, cap=None):
+        """ Construct a paginated GraphQL connection """
+        this_first = min(int(variables.get('first') or 100), 100)
+        this_offset = self._offset(variables.get('after'))
+        this_available = len(items) if cap is None else min(len(items), cap)
+        this_end = min(this_offset + this_first, this_available)
+        return {
+            'totalCount': len(items),
+            'pageInfo': {
+                'hasNextPage': this_end < this_available,
+                'endCursor': self._cursor(this_end) if this_end else None,
+            },
+            'nodes': [serializer(_i_) for _i_ in items[this_offset:this_end]],
+        }
+
+    def _reviewer_node(self, pull, reviewer, is_team):
+        """ Construct a GraphQL requested reviewer node """
+        if is_team:
+            return {'__typename': 'Team', 'name': reviewer, 'slug': reviewer}
+        return {'__typename': 'User', 'login': reviewer}
+
+    def _pull_node(self, pull):
+        """ Construct a GraphQL PullRequest node with every known field """
+        this_requested = (
+            [
+                self._reviewer_node(pull, _login_, False)
+                for _login_ in pull['requested_users']
+            ] +
+            [
+                self._reviewer_node(pull, _slug_, True)
+                for _slug_ in pull['requested_teams']
+            ]
+        )
+        # Reviewers that have since reviewed were requested before their
+        # first review.
+        this_events = [
+            (_reviewer_, pull['review_requested_at'])
+            for _reviewer_ in this_requested
+        ]
+        this_reviewed = {}
+        for _review_ in pull['reviews']:
+            if _review_['user'] not in pull['requested_users']:
+                this_reviewed.setdefault(
+                    _review_['user'],
+                    min(pull['review_requested_at'], _review_['submitted_at'])
+                )
+        this_events.extend(
+            (self._reviewer_node(pull, _login_, False), _at_)
+            for _login_, _at_ in this_reviewed.items()
+        )
+        this_events.sort(key=lambda _event_: _event_[1])
+        this_repo = self._repos[pull['repo'].lower()]
+        return {
+            '__typename': 'PullRequest',
+            'id': base64.b64encode(f"PR_{pull['id']}".encode()).decode(),
+            'databaseId': pull['id'],
+            'number': pull['number'],
+            'title': pull['title'],
+            'body': pull['body'],
+            'url': f"https://github.com/{pull['repo']}/pull/{pull['number']}",
+            'state': 'OPEN',
+            'isDraft': pull['draft'],
+            'merged': False,
+            'mergedAt': None,
+            'mergedBy': None,
+            'closed': False,
+            'mergeable': {
+                True: 'MERGEABLE', False: 'CONFLICTING', None: 'UNKNOWN'
+            }[pull['mergeable']],
+            'createdAt': self._timestamp(pull['created_at']),
+            'updatedAt': self._timestamp(self._updated_at(pull)),
+            'author': {'login': pull['user']},
+            'repository': {
+                'name': this_repo['name'],
+                'nameWithOwner': this_repo['full_name'],
+                'url': f"https://github.com/{this_repo['full_name']}",
+            },
+            'labels': {
+                'totalCount': len(pull['labels']),
+                'nodes': [{'name': _label_} for _label_ in pull['labels']],
+            },
+            'reviewRequests': {
+                'totalCount': len(this_requested),
+                'nodes': [
+                    {'requestedReviewer': _reviewer_}
+                    for _reviewer_ in this_requested
+                ],
+            },
+            'reviews': {
+                'totalCount': len(pull['reviews']),
+                'nodes': [
+                    {
+                        'author': {'login': _review_['user']},
+                        'state': _review_['state'],
+                        'submittedAt': self._timestamp(
+                            _review_['submitted_at']
+                        ),
+                    }
+                    for _review_ in pull['reviews']
+                ],
+            },
+            'timelineItems': {
+                'totalCount': len(this_events),
+                'nodes': [
+                    {
+                        '__typename': 'ReviewRequestedEvent',
+                        'createdAt': self._timestamp(_at_),
+                        'requestedReviewer': _reviewer_,
+                    }
+                    for _reviewer_, _at_ in this_events
+                ],
+            },
+            'commits': {
+                'totalCount': 1,
+                'nodes': [
+                    {
+                        'commit': {
+                            'committedDate': self._timestamp(
+                                pull['last_commit_at']
+                            ),
+                        }
+                    }
+                ],
+            },
+            'comments': {
+                'totalCount': len(pull['comments']),
+                'nodes': [
+                    {
+                        'createdAt': self._timestamp(_comment_['created_at']),
+                        'author': {'login': _comment_['user']},
+                        'viewerDidAuthor': _comment_['user'] == 'stub-bot',
+                    }
+                    for _comment_ in pull['comments'][-10:]
+                ],
+            },
+        }
+
+    def _repository_node(self, repo, variables):
+        """ Construct a GraphQL Repository node """
+        return {
+            'name': repo['name'],
+            'nameWithOwner': repo['full_name'],
+            'url': f"https://github.com/{repo['full_name']}",
+            'pullRequests': self._connection(
+                repo['pulls'], variables, self._pull_node
+            ),
+        }
+
+    def _post_graphql(self, path, params, body):
+        """ POST /graphql """
+        if not isinstance(body, dict) or 'query' not in body:
+            return 400, {'message': 'Problems parsing JSON'}, {}
+
+        this_query = body['query']
+        this_variables = body.get('variables') or {}
+        this_data = {}
+
+        if re.search(r'\brateLimit\b', this_query):
+            this_state = self._rate.get('graphql', {})
+            this_limit = self._config['rate_limit']['graphql']
+            this_data['rateLimit'] = {
+                'limit': this_limit,
+                'cost': 1,
+                'remaining': max(0, this_limit - this_state.get('used', 0)),
+                'resetAt': self._timestamp(
+                    datetime.fromtimestamp(
+                        this_state.get('reset', time.time() + 3600),
+                        timezone.utc
+                    )
+                ),
+            }
+
+        if re.search(r'\bsearch\s*\(', this_query):
+            this_pulls, this_sort = self._search(
+                this_variables.get('query', '')
+            )
+            this_pulls = self._sorted(this_pulls, this_sort, None)
+            this_connection = self._connection(
+                this_pulls, this_variables, self._pull_node,
+                cap=self._config['search_cap']
+            )
+            this_connection['issueCount'] = this_connection.pop('totalCount')
+            this_data['search'] = this_connection
+
+        if re.search(r'\brepository\s*\(', this_query):
+            this_repo = self._repos.get(
+                f"{this_variables.get('owner')}/"
+                f"{this_variables.get('name')}".lower()
+            )
+            this_data['repository'] = (
+                None if this_repo is None
+                else self._repository_node(this_repo, this_variables)
+            )
+
+        for _root_ in ('organization', 'user'):
+            if re.search(rf'\b{_root_}\s*\(', this_query):
+                this_login = str(this_variables.get('login', '')).lower()
+                if this_login not in self._owners:
+                    this_data[_root_] = None
+                    continue
+                # Users collaborate on the organization repositories, which
+                # are listed unless the affiliations are limited to OWNER.
+                this_owned = re.search(
+                    r'ownerAffiliations\s*:\s*\[?\s*OWNER\s*\]?[\s,)]',
+                    this_query
+                )
+                this_repos = [
+                    _repo_ for _repo_ in self._repos.values()
+                    if _repo_['owner'].lower() == this_login or (
+                        _root_ == 'user' and this_owned is None and
+                        self._owners[_repo_['owner'].lower()]['type'] ==
+                        'Organization'
+                    )
+                ]
+                this_data[_root_] = {
+                    'login': self._owners[this_login]['login'],
+                    'repositories': self._connection(
+                        this_repos,
+                        this_variables,
+                        lambda _repo_: {
+                            'name': _repo_['name'],
+                            'nameWithOwner': _repo_['full_name'],
+                            'pullRequests': {
+                                'totalCount': len(_repo_['pulls'])
+                            },
+                        }
+                    ),
+                }
+
+        return 200, {'data': this_data}, {}
+
+
+#####################
+# Command Line:     #
+#####################
+def main(argv=None):
+    """ Serve a synthetic Github API until interrupted """
+    ThisParser = argparse.ArgumentParser(
+        description="Serve a synthetic Github API for offline testing."
+    )
+    ThisParser.add_argument('--org', action='append', dest='orgs')
+    ThisParser.add_argument('--user', action='append', dest='users')
+    ThisParser.add_argument('--repos', type=int, default=5)
+    ThisParser.add_argument('--prs', type=int, default=100)
+    ThisParser.add_argument('--reviews', type=int, default=2)
+    ThisParser.add_argument('--reviewers', type=int, default=2)
+    ThisParser.add_argument('--latency', type=float, default=0.0)
+    ThisParser.add_argument('--enforce-rate-limit', action='store_true')
+    ThisParser.add_argument('--seed', type=int, default=0)
+    ThisParser.add_argument('--host', default='127.0.0.1')
+    ThisParser.add_argument('--port', type=int, default=8000)
+    ThisParser.add_argument('--verbose', action='store_true')
+    ThisArgs = ThisParser.parse_args(argv)
+
+    ThisServer = GithubStubServer(
+        verbose=ThisArgs.verbose,
+        orgs=tuple(ThisArgs.orgs or ('StubOrg',)),
+        users=tuple(ThisArgs.users or ()),
+        repo_count=ThisArgs.repos,
+        pr_count=ThisArgs.prs,
+        review_count=ThisArgs.reviews,
+        reviewer_count=ThisArgs.reviewers,
+        latency=ThisArgs.latency,
+        enforce_rate_limit=ThisArgs.enforce_rate_limit,
+        seed=ThisArgs.seed,
+        host=ThisArgs.host,
+        port=ThisArgs.port
+    ).start()
+    print(
+        f"Synthetic Github API listening on {ThisServer.base_url}",
+        flush=True
+    )
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        ThisServer.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+##############################################################################
+# CloudMage : Github Paginated Result Prefetcher
+# ============================================================================
+# CloudMage Page Prefetcher
+#   - Pipeline paginated Github API results, fetching the next page in a
+#     background thread while the items of the current page are processed.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+from contextlib import nullcontext
+import threading
+import queue
+
+
+#####################
+# Class Definition: #
+#####################
+class PagePrefetcher(object):
+    """ CloudMage Page Prefetcher Class
+
+    This class is designed to overlap the page requests of paginated Github
+    API results with the processing of their items. A background thread
+    iterates the results, so the request for page N+1 is sent as soon as
+    the items of page N were handed over, instead of once they were all
+    processed. Items are handed over in order through a queue holding the
+    page being processed and at most read_ahead pages beyond it, so
+    prefetching never runs far ahead of processing.
+
+    Errors raised while fetching are raised again by the iteration, and
+    the thread stops once the iteration is closed early. A read_ahead of
+    0 iterates the results directly, without a thread. Generators passed
+    as results run on the thread, so any state they share with the main
+    thread has to be guarded. The page requests are sent from the thread,
+    so results must not share a PyGithub Requester with the main thread,
+    as in the results of a Github object whose requester was replaced by
+    ThreadRequesters.
+    """
+
+    # Time the thread waits on a full queue before checking if the
+    # iteration was closed, in seconds.
+    poll_interval = 0.1
+
+    def __init__(
+        self,
+        iterable,
+        read_ahead=1,
+        page_size=100,
+        stats=None,
+        stage=None
+    ):
+        """ PagePrefetcher Class Constructor
+
+        Parameters:
+            iterable   (iter) : required paginated results
+            read_ahead (int)  : optional [default=1] pages fetched ahead
+            page_size  (int)  : optional [default=100] items per page
+            stats      (obj)  : optional [default=None] ReportStats the
+                                page requests are recorded in
+            stage      (str)  : optional [default=None] stage the page
+                                requests are attributed to
+        """
+        self._iterable = iterable
+        self._read_ahead = max(0, int(read_ahead))
+        self._page_size = max(1, int(page_size))
+        self._stats = stats
+        self._stage = stage
+
+    def _attribution(self):
+        """ Return the context attributing the thread requests to stage """
+        if self._stats is None or self._stage is None:
+            return nullcontext()
+        return self._stats.thread_stage(self._stage)
+
+    def __iter__(self):
+        """ Iterate the results, fetched ahead by a background thread """
+        if self._read_ahead == 0:
+            yield from self._iterable
+            return
+
+        this_queue = queue.Queue(
+            maxsize=(self._read_ahead + 1) * self._page_size
+        )
+        this_closed = threading.Event()
+
+        def put(entry):
+            while not this_closed.is_set():
+                try:
+                    this_queue.put(entry, timeout=self.poll_interval)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                with self._attribution():
+                    for _item_ in self._iterable:
+                        if not put((True, _item_)):
+                            return
+            except Exception as e:
+                put((False, e))
+                return
+            put((False, None))
+
+        threading.Thread(
+            target=produce,
+            name='gitutils-page-prefetcher',
+            daemon=True
+        ).start()
+        try:
+            while True:
+                this_is_item, this_value = this_queue.get()
+                if this_is_item:
+                    yield this_value
+                elif this_value is None:
+                    return
+                else:
+                    raise this_value
+        finally:
+            this_closed.set()
@@ -0,0 +1,369 @@
+##############################################################################
+# CloudMage : Github Raw JSON Transport
+# ============================================================================
+# CloudMage Raw Transport
+#   - Send the requests of the open pull request report through the PyGithub
+#     requester, and decode their JSON responses straight into compact
+#     records instead of PyGithub objects.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+from datetime import datetime
+
+
+def _timestamp(value):
+    """ Parse a Github API timestamp, None for a missing timestamp """
+    if value is None:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _user(payload):
+    """ Decode a user payload, None for a missing user """
+    if payload is None:
+        return None
+    return RawUser(payload['login'])
+
+
+def _next_link(headers):
+    """ Return the next page url of a Link response header, or None """
+    for _link_ in str(headers.get('link') or '').split(', '):
+        this_url, _, this_rel = _link_.partition('; ')
+        if this_rel == 'rel="next"':
+            return this_url[1:-1]
+    return None
+
+
+#######################
+# Record Definitions: #
+#######################
+class RawUser(object):
+    """ Github user record, holding the login of the user """
+
+    __slots__ = ('login',)
+
+    def __init__(self, login):
+        self.login = login
+
+
+class RawTeam(object):
+    """ Github team record, holding the slug and name of the team """
+
+    __slots__ = ('slug', 'name')
+
+    def __init__(self, slug, name):
+        self.slug = slug
+        self.name = name
+
+
+class RawReview(object):
+    """ Pull request review record """
+
+    __slots__ = ('user', 'state', 'submitted_at')
+
+    def __init__(self, payload):
+        self.user = _user(payload.get('user'))
+        self.state = payload.get('state')
+        self.submitted_at = _timestamp(payload.get('submitted_at'))
+
+
+class RawComment(object):
+    """ Issue comment record """
+
+    __slots__ = ('body', 'created_at')
+
+    def __init__(self, payload):
+        self.body = payload.get('body')
+        self.created_at = _timestamp(payload.get('created_at'))
+
+
+class RawPull(object):
+    """ Pull request record
+
+    Decoded from a pull request payload, or from the issue payload of a
+    search result, which holds every field of the report but the
+    mergeable and mergeable_state fields, left None until update() fetches
+    the pull request. The id of a search result record is the one of its
+    issue, as read from PyGithub Issue objects, until it is updated.
+    """
+
+    __slots__ = (
+        '_transport', 'id', 'number', 'title', 'body', 'url', 'issue_url',
+        'html_url', 'repository_url', 'user', 'state', 'draft',
+        'created_at', 'updated_at', 'merged', 'merged_at', 'merged_by',
+        'mergeable', 'mergeable_state'
+    )
+
+    def __init__(self, transport, payload):
+        self._transport = transport
+        self.mergeable = self.mergeable_state = None
+        self._decode(payload)
+
+    def _decode(self, payload):
+        """ Set the record fields from a pull request or issue payload """
+        this_pull = payload.get('pull_request')
+        if this_pull is not None:
+            # Search result issue payload.
+            self.url = this_pull['url']
+            self.issue_url = payload['url']
+            self.merged_at = _timestamp(this_pull.get('merged_at'))
+            self.merged = self.merged_at is not None
+            self.merged_by = None
+        else:
+            self.url = payload['url']
+            self.issue_url = payload.get('issue_url')
+            self.merged_at = _timestamp(payload.get('merged_at'))
+            self.merged = bool(payload.get('merged', self.merged_at))
+            self.merged_by = _user(payload.get('merged_by'))
+            if 'mergeable' in payload:
+                self.mergeable = payload['mergeable']
+                self.mergeable_state = payload.get('mergeable_state')
+        if self.issue_url is None:
+            self.issue_url = self.url.replace('/pulls/', '/issues/')
+        self.repository_url = self.url.rsplit('/pulls/', 1)[0]
+        self.id = payload['id']
+        self.number = payload['number']
+        self.title = payload.get('title')
+        self.body = payload.get('body')
+        self.html_url = payload['html_url']
+        self.user = _user(payload.get('user'))
+        self.state = payload.get('state')
+        self.draft = payload.get('draft')
+        self.created_at = _timestamp(payload.get('created_at'))
+        self.updated_at = _timestamp(payload.get('updated_at'))
+
+    @property
+    def requester(self):
+        """ requester Property Getter
+
+        Getter method for the requester property.
+        This method will return the requester of the record's transport.
+        """
+        return self._transport.requester
+
+    def update(self):
+        """ Fetch the pull request, refreshing its mergeability """
+        self._decode(self._transport.get(self.url))
+
+    def get_review_requests(self):
+        """ Return the (users, teams) requested to review the pull request
+
+        Both lists are decoded from a single requested_reviewers response.
+        """
+        this_payload = self._transport.get(f"{self.url}/requested_reviewers")
+        return (
+            [_user(_u_) for _u_ in this_payload.get('users', [])],
+            [
+                RawTeam(_t_['slug'], _t_.get('name'))
+                for _t_ in this_payload.get('teams', [])
+            ]
+        )
+
+    def get_reviews(self):
+        """ Return the reviews of the pull request, oldest first """
+        return RawPages(
+            self._transport, f"{self.url}/reviews", decode=RawReview
+        )
+
+    def get_issue_comments(self):
+        """ Return the issue comments of the pull request """
+        return RawPages(
+            self._transport, f"{self.issue_url}/comments", decode=RawComment
+        )
+
+    def create_issue_comment(self, body):
+        """ Publish an issue comment on the pull request """
+        return RawComment(self._transport.request(
+            'POST', f"{self.issue_url}/comments", input={'body': body}
+        ))
+
+
+class RawRepository(object):
+    """ Repository record, built from the url and names of a repository """
+
+    __slots__ = ('_transport', 'url', 'name', 'full_name', 'html_url')
+
+    def __init__(self, transport, payload):
+        self._transport = transport
+        self.url = payload['url']
+        self.name = payload['name']
+        self.full_name = payload['full_name']
+        self.html_url = payload['html_url']
+
+    def get_pull(self, number):
+        """ Fetch a pull request of the repository """
+        return RawPull(
+            self._transport, self._transport.get(f"{self.url}/pulls/{number}")
+        )
+
+    def get_pulls(self, state='open', sort=None, direction=None):
+        """ Return the pull request listing of the repository """
+        this_parameters = {'state': state}
+        if sort is not None:
+            this_parameters['sort'] = sort
+        if direction is not None:
+            this_parameters['direction'] = direction
+        return RawPages(
+            self._transport,
+            f"{self.url}/pulls",
+            this_parameters,
+            decode=lambda _payload_: RawPull(self._transport, _payload_)
+        )
+
+
+#####################
+# Class Definition: #
+#####################
+class RawPages(object):
+    """ CloudMage Raw Paginated Results Class
+
+    This class is designed to iterate paginated Github API results as
+    records, following the Link headers of the responses. Pages are
+    fetched as the iteration reaches them and kept, so results can be
+    iterated again, indexed, and counted by totalCount, which reads the
+    total_count of a search response. As PyGithub PaginatedList objects,
+    totalCount fetches a single result page when no page was fetched yet.
+    """
+
+    def __init__(self, transport, url, parameters=None, decode=None):
+        """ RawPages Class Constructor
+
+        Parameters:
+            transport  (obj)  : required RawTransport
+            url        (str)  : required url of the first page
+            parameters (dict) : optional [default=None] query parameters
+            decode     (func) : optional [default=None] returns the record
+                                of a result payload
+        """
+        self._transport = transport
+        self._next_url = url
+        self._parameters = dict(parameters or {})
+        self._decode = decode or (lambda _payload_: _payload_)
+        self._elements = []
+        self._total_count = None
+        self._fetched = False
+
+    def _fetch_page(self):
+        """ Fetch the next page, returning its records """
+        this_parameters = None
+        if not self._fetched:
+            # Later page urls of the Link header hold the parameters.
+            this_parameters = dict(
+                self._parameters, per_page=self._transport.per_page
+            )
+            self._fetched = True
+        this_headers, this_data = self._transport.request(
+            'GET', self._next_url, this_parameters, headers=True
+        )
+        self._next_url = _next_link(this_headers)
+        if isinstance(this_data, dict):
+            self._total_count = this_data.get('total_count')
+            this_data = this_data.get('items', [])
+        this_page = [self._decode(_payload_) for _payload_ in this_data]
+        self._elements.extend(this_page)
+        return this_page
+
+    @property
+    def totalCount(self):
+        """ totalCount Property Getter
+
+        Getter method for the totalCount property.
+        This method will return the total_count of a search response, or
+        the number of results of a listing, once they are all fetched.
+        """
+        if not self._fetched and '/search/' in self._next_url:
+            # A single result is enough to read the total_count.
+            return self._transport.get(
+                self._next_url, dict(self._parameters, per_page=1)
+            ).get('total_count')
+        if self._total_count is not None:
+            return self._total_count
+        while self._next_url is not None:
+            self._fetch_page()
+        return len(self._elements)
+
+    def __getitem__(self, index):
+        """ Return a record, fetching the pages up to its index """
+        while len(self._elements) <= index and self._next_url is not None:
+            self._fetch_page()
+        return self._elements[index]
+
+    def __iter__(self):
+        """ Iterate the records, fetching pages as they are reached """
+        yield from list(self._elements)
+        while self._next_url is not None:
+            yield from self._fetch_page()
+
+
+class RawTransport(object):
+    """ CloudMage Raw Transport Class
+
+    This class is designed to collect the open pull request report without
+    the PyGithub object graph. Requests are sent through the requester of
+    a Github object, so its authentication, throttling, retries and run
+    statistics instrumentation still apply, but responses are decoded
+    straight into compact records holding only the fields the report
+    reads, instead of Issue, PullRequest, NamedUser, Team and Review
+    objects with their lazily completed attributes.
+
+    The transport offers the search_issues and get_repo calls of the
+    Github object the report makes, and the records offer the attributes
+    and methods the report, the mergeability polling and the notifier
+    read, so every stage runs on either.
+    """
+
+    def __init__(self, requester, per_page=100):
+        """ RawTransport Class Constructor
+
+        Parameters:
+            requester (obj) : required PyGithub Requester
+            per_page  (int) : optional [default=100] results per page
+        """
+        self.requester = requester
+        self.per_page = max(1, int(per_page))
+
+    def request(self, verb, url, parameters=None, input=None, headers=False):
+        """ Send a request, returning its decoded JSON response
+
+        Returns:
+            Response data, or a tuple of the response headers and data
+            when headers is True
+        """
+        this_headers, this_data = self.requester.requestJsonAndCheck(
+            verb, url, parameters=parameters, input=input
+        )
+        if headers:
+            return this_headers, this_data
+        return this_data
+
+    def get(self, url, parameters=None):
+        """ Send a GET request, returning its decoded JSON response """
+        return self.request('GET', url, parameters)
+
+    def search_issues(self, query, sort=None, order=None):
+        """ Return the issue search results of a query as RawPull records """
+        this_parameters = {'q': query}
+        if sort is not None:
+            this_parameters['sort'] = sort
+        if order is not None:
+            this_parameters['order'] = order
+        return RawPages(
+            self,
+            '/search/issues',
+            this_parameters,
+            decode=lambda _payload_: RawPull(self, _payload_)
+        )
+
+    def repository(self, payload):
+        """ Return the repository record of a repository payload """
+        return RawRepository(self, payload)
+
+    def get_repo(self, full_name):
+        """ Fetch a repository by its full name """
+        return RawRepository(self, self.get(f"/repos/{full_name}"))
@@ -0,0 +1,408 @@
+##############################################################################
+# CloudMage : Github Open Pull Request Report Exporter
+# ============================================================================
+# CloudMage Report Exporter
+#   - Export the collected open pull request data set to CSV, JSONL,
+#     Parquet or Arrow files with typed columns.
+#   - Rows are written in fixed size chunks so large result sets never
+#     need to be converted or held in memory as a whole.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+import inspect
+import json
+import csv
+import sys
+
+
+###############
+# Schema:     #
+###############
+# Ordered export columns and their logical types. Every export format
+# writes exactly these columns, in this order.
+REPORT_SCHEMA = [
+    ('id', 'int'),
+    ('repository', 'str'),
+    ('repository_url', 'str'),
+    ('number', 'int'),
+    ('submitter', 'str'),
+    ('reviewers', 'list'),
+    ('mentions', 'list'),
+    ('link', 'str'),
+    ('title', 'str'),
+    ('body', 'str'),
+    ('created', 'timestamp'),
+    ('age', 'duration'),
+    ('age_days', 'int'),
+    ('state', 'str'),
+    ('is_merged', 'bool'),
+    ('merged', 'timestamp'),
+    ('mergable', 'bool'),
+    ('merge_state', 'str'),
+    ('merged_by', 'str'),
+    ('review_count', 'int'),
+    ('days_open_threshold', 'int'),
+    ('review_requested_at', 'timestamp'),
+    ('first_review_at', 'timestamp'),
+    ('approved_at', 'timestamp'),
+    ('last_activity', 'timestamp'),
+]
+
+
+#####################
+# Class Definition: #
+#####################
+class ReportExporter(object):
+    """ CloudMage Report Exporter Class
+
+    This class is designed to export the open pull request data set that is
+    returned by GithubReports.search_open_pulls() into formats that can be
+    loaded directly into a data warehouse. Timestamps are written as UTC,
+    ages as seconds, and counts as integers, so no Python side conversion
+    pass is needed before ingestion.
+    """
+
+    # Supported export formats.
+    formats = ('csv', 'jsonl', 'parquet', 'arrow')
+
+    def __init__(self, verbose=False, log=None, chunk_size=1000):
+        """ ReportExporter Class Constructor
+
+        Parameters:
+            verbose    (bool): optional [default=False]
+            log        (obj) : optional [default=None]
+            chunk_size (int) : optional [default=1000]
+
+        Self Attributes:
+            self._verbose     (bool) : private
+            self._log         (obj)  : private
+            self._log_context (str)  : private
+            self._chunk_size  (int)  : private
+
+        Methods:
+            self._exception_handler()
+            self.log()
+            self.export()
+        """
+        # Check the passed value to ensure its a bool before assignment.
+        if verbose is not None and isinstance(verbose, bool):
+            self._verbose = verbose
+        else:
+            self._verbose = False
+
+        # Check to ensure that the passed log object is in fact an object,
+        # and has the proper attributes, if not don't assign.
+        if (
+            log is not None and isinstance(log, object) and
+            hasattr(log, 'debug') and hasattr(log, 'info') and
+            hasattr(log, 'warning') and hasattr(log, 'error')
+        ):
+            self._log = log
+        else:
+            self._log = None
+
+        # Number of rows converted and written per chunk.
+        if (
+            isinstance(chunk_size, int) and
+            not isinstance(chunk_size, bool) and
+            chunk_size > 0
+        ):
+            self._chunk_size = chunk_size
+        else:
+            self._chunk_size = 1000
+
+        self._log_context = "CLS->ReportExporter"
+
+    ############################################
+    # Class Exception Handler:                 #
+    ############################################
+    def _exception_handler(self, caller_function, exception_object):
+        """ Class Exception Handler
+
+        Handle any exceptions that arise in a universal format
+        for easy debuging purposes.
+
+        Parameters:
+            caller_function  (str):  required
+            exception_object (obj):  required
+
+        Returns:
+            Publish properly formatted exceptions
+            to log object or stdout, stderr
+        """
+        this_exception_msg = (
+            "EXCEPTION occurred in: "
+            f"{self._log_context}.{caller_function}, on line "
+            f"{sys.exc_info()[2].tb_lineno}: -> {str(exception_object)}"
+        )
+        self.log(this_exception_msg, 'error', caller_function)
+
+    ############################################
+    # Class Logger:                            #
+    ############################################
+    def log(self, log_msg, log_type, log_id):
+        """ Class Log Handler
+
+        Provides the logging for this class. If the class caller instantiates
+        the object with the verbose setting set to true, then the class will
+        log to stdout/stderr or to a provided log object if one was passed
+        during object instantiation.
+
+        Parameters:
+            log_msg  (str):  required
+            log_type (str):  required
+            log_id   (str):  required
+
+        Returns:
+            Log Stream
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        try:
+            # Internal method variable assignments:
+            this_log_msg_caller = f"{self._log_context}.{log_id}"
+
+            # Set the log message offset based on the message type:
+            # [debug=3, info=4, warning=1, error=3]
+            this_log_msg_offset = 3
+            if log_type.lower() == 'info':
+                this_log_msg_offset = 4
+            elif log_type.lower() == 'warning':
+                this_log_msg_offset = 1
+
+            # If a valid log object was passed into the class constructor,
+            # publish the log to the log object:
+            if self._log is not None:
+                # Set the log message prefix
+                this_log_message = f"{this_log_msg_caller}: -> {log_msg}"
+                if log_type.lower() == 'error':
+                    self._log.error(this_log_message)
+                elif log_type.lower() == 'warning':
+                    self._log.warning(this_log_message)
+                elif log_type.lower() == 'info':
+                    self._log.info(this_log_message)
+                else:
+                    self._log.debug(this_log_message)
+            # If no valid log object was passed into the class constructor,
+            # write the message to stdout, stderr:
+            else:
+                this_log_message = "{}    {}{}{}: -> {}".format(
+                    datetime.now(),
+                    log_type.upper(),
+                    " " * this_log_msg_offset,
+                    this_log_msg_caller,
+                    log_msg
+                )
+                if log_type.lower() == 'error':
+                    print(this_log_message, file=sys.stderr)
+                else:
+                    if self._verbose:
+                        print(this_log_message, file=sys.stdout)
+        except Exception as e:
+            self._exception_handler(__id, e)
+
+    ############################################
+    # Value Conversion:                        #
+    ############################################
+    @staticmethod
+    def _timestamp(value):
+        """ Return the value as a UTC aware datetime or None. """
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
+    @classmethod
+    def _convert(cls, value, value_type):
+        """ Convert a single data set value to its export column type. """
+        if value is None:
+            return [] if value_type == 'list' else None
+        if value_type == 'timestamp':
+            return cls._timestamp(value)
+        if value_type == 'duration':
+            if isinstance(value, timedelta):
+                return value.total_seconds()
+            return float(value)
+        if value_type == 'int':
+            return int(value)
+        if value_type == 'bool':
+            return bool(value)
+        if value_type == 'list':
+            return [str(_item_) for _item_ in value]
+        # Users and other PyGithub objects are exported by login or name.
+        return str(getattr(value, 'login', value))
+
+    def _rows(self, search_results):
+        """ Yield each data set entry converted to an export row. """
+        for _pr_ in search_results:
+            yield {
+                _name_: self._convert(_pr_.get(_name_), _type_)
+                for _name_, _type_ in REPORT_SCHEMA
+            }
+
+    def _chunks(self, search_results):
+        """ Yield lists of export rows, chunk_size rows at a time. """
+        this_rows = self._rows(search_results)
+        while True:
+            this_chunk = list(islice(this_rows, self._chunk_size))
+            if not this_chunk:
+                return
+            yield this_chunk
+
+    ############################################
+    # Format Writers:                          #
+    ############################################
+    @staticmethod
+    def _text_value(value):
+        """ Render an export row value for the text based formats. """
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    def _write_csv(self, search_results, path):
+        """ Write the export rows to a CSV file. """
+        this_count = 0
+        with open(path, 'w', newline='') as ThisFile:
+            ThisWriter = csv.writer(ThisFile)
+            ThisWriter.writerow([_name_ for _name_, _type_ in REPORT_SCHEMA])
+            for _chunk_ in self._chunks(search_results):
+                this_lines = []
+                for _row_ in _chunk_:
+                    this_line = []
+                    for _name_, _type_ in REPORT_SCHEMA:
+                        this_value = self._text_value(_row_[_name_])
+                        if _type_ == 'list':
+                            this_value = json.dumps(this_value)
+                        elif _type_ == 'bool' and this_value is not None:
+                            this_value = str(this_value).lower()
+                        this_line.append(this_value)
+                    this_lines.append(this_line)
+                ThisWriter.writerows(this_lines)
+                this_count += len(_chunk_)
+        return this_count
+
+    def _write_jsonl(self, search_results, path):
+        """ Write the export rows to a JSON lines file. """
+        this_count = 0
+        with open(path, 'w') as ThisFile:
+            for _chunk_ in self._chunks(search_results):
+                ThisFile.write(''.join(
+                    json.dumps(
+                        {
+                            _name_: self._text_value(_value_)
+                            for _name_, _value_ in _row_.items()
+                        }
+                    ) + '\n'
+                    for _row_ in _chunk_
+                ))
+                this_count += len(_chunk_)
+        return this_count
+
+    @staticmethod
+    def _arrow_schema(pa):
+        """ Construct the pyarrow schema matching REPORT_SCHEMA. """
+        this_types = {
+            'int': pa.int64(),
+            'str': pa.string(),
+            'bool': pa.bool_(),
+            'list': pa.list_(pa.string()),
+            'timestamp': pa.timestamp('us', tz='UTC'),
+            'duration': pa.float64(),
+        }
+        return pa.schema([
+            (_name_, this_types[_type_]) for _name_, _type_ in REPORT_SCHEMA
+        ])
+
+    def _write_columnar(self, search_results, path, export_format):
+        """ Write the export rows to a Parquet or Arrow IPC file. """
+        # pyarrow is an optional dependency, only required for the
+        # columnar export formats.
+        import pyarrow as pa
+
+        this_schema = self._arrow_schema(pa)
+        if export_format == 'parquet':
+            import pyarrow.parquet as pq
+            ThisWriter = pq.ParquetWriter(path, this_schema)
+        else:
+            ThisWriter = pa.ipc.new_file(path, this_schema)
+
+        this_count = 0
+        try:
+            for _chunk_ in self._chunks(search_results):
+                ThisWriter.write_table(
+                    pa.Table.from_pylist(_chunk_, schema=this_schema)
+                )
+                this_count += len(_chunk_)
+        finally:
+            ThisWriter.close()
+        return this_count
+
+    ############################################
+    # Class Methods:                           #
+    ############################################
+    def export(self, search_results, path, export_format='csv'):
+        """ ReportExporter Data Set Export
+
+        Write the provided open pull request data set to the given path in
+        the requested format, one of csv, jsonl, parquet or arrow. The
+        search results may be any iterable, and are converted and written
+        chunk_size rows at a time.
+
+        Parameters:
+            search_results (iter): required
+            path           (str) : required
+            export_format  (str) : optional [default=csv]
+
+        Returns:
+            Number of exported rows
+        """
+        # Define this methods identity for functional logging:
+        __id = inspect.stack()[0][3]
+        self.log(f"{__id} method called.", 'info', __id)
+
+        if export_format not in self.formats:
+            self.log(
+                f"{__id} export_format expected one of {self.formats} "
+                f"but received: {export_format}",
+                'error',
+                __id
+            )
+            return None
+
+        try:
+            if export_format == 'csv':
+                this_count = self._write_csv(search_results, path)
+            elif export_format == 'jsonl':
+                this_count = self._write_jsonl(search_results, path)
+            else:
+                this_count = self._write_columnar(
+                    search_results,
+                    path,
+                    export_format
+                )
+            self.log(
+                f"Exported {this_count} rows to {export_format} file: {path}",
+                'info',
+                __id
+            )
+            return this_count
+        except Exception as e:
+            self.log(
+                f"An un-expected error occurred when attempting to export "
+                f"the data set to {export_format} file: {path}",
+                'error',
+                __id
+            )
+            self._exception_handler(__id, e)
+            return None
@@ -0,0 +1,204 @@
+##############################################################################
+# CloudMage : Github Open Pull Request Report Planner
+# ============================================================================
+# CloudMage Report Planner
+#   - Estimate the Github API requests and run time of each way of
+#     enumerating the open pull requests of a namespace, and choose the
+#     strategy that finishes the report first.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+import math
+
+
+#####################
+# Class Definition: #
+#####################
+class ReportPlanner(object):
+    """ CloudMage Report Planner Class
+
+    This class is designed to choose how search_open_pulls enumerates the
+    open pull requests of a namespace:
+
+        search  : issue search API pages, limited to 30 requests a minute
+        list    : GET /repos/{owner}/{repo}/pulls?state=open pages for each
+                  repository with open pull requests, on the core budget
+        graphql : GraphQL search pages, on the GraphQL budget
+
+    The cost of a strategy is the number of requests it sends to each API
+    resource, the enumeration pages and repository lookups plus the pull
+    request hydration requests. Listings and GraphQL search results fetch
+    each repository once. Its run time is estimated as the request
+    count times request_seconds, plus a wait for the rate limit reset of
+    each resource whose remaining budget the requests exceed.
+    Searches reaching the result cap also pay for their partition probes,
+    and with activity staleness or review history, search and list
+    enumeration pay for the GraphQL search pages that fetch the last
+    activity times and review request events.
+    The fastest strategy wins, ties going to the strategy sending the fewest
+    requests, and then to the earlier strategy in the strategies tuple.
+    """
+
+    strategies = ('search', 'list', 'graphql')
+
+    # API resource whose rate limit each enumeration strategy spends.
+    resources = {'search': 'search', 'list': 'core', 'graphql': 'graphql'}
+
+    # Length of the rate limit window of each resource, in seconds.
+    windows = {'core': 3600, 'search': 60, 'graphql': 3600}
+
+    # Requests made to hydrate each pull request besides fetching it: one
+    # for its reviews, and review_requests for its review requests, which
+    # PyGithub reads with two requests to the requested_reviewers endpoint.
+    hydration_requests = 1
+    review_requests = 2
+
+    def __init__(
+        self,
+        repo_pulls,
+        budgets,
+        per_page=100,
+        result_cap=1000,
+        request_seconds=0.25,
+        listable=True,
+        fetch_pulls=True,
+        activity=False,
+        review_requests=None
+    ):
+        """ ReportPlanner Class Constructor
+
+        Parameters:
+            repo_pulls      (dict) : required, open pull request count by
+                                     repository name
+            budgets         (dict) : required, (remaining, limit, seconds
+                                     until reset) by API resource
+            per_page        (int)  : optional [default=100]
+            result_cap      (int)  : optional [default=1000]
+            request_seconds (float): optional [default=0.25]
+            listable        (bool) : optional [default=True] the search
+                                     filters can be applied to listings
+            fetch_pulls     (bool) : optional [default=True] search results
+                                     and listed pull requests are hydrated
+                                     by fetching each pull request
+            activity        (bool) : optional [default=False] last activity
+                                     times or review request events are
+                                     fetched with GraphQL search pages
+            review_requests (int)  : optional [default=review_requests]
+                                     requests reading the review requests
+                                     of a pull request
+        """
+        self._repo_pulls = dict(repo_pulls)
+        self._budgets = dict(budgets)
+        self._per_page = max(1, int(per_page))
+        self._result_cap = max(1, int(result_cap))
+        self._request_seconds = float(request_seconds)
+        self._listable = bool(listable)
+        self._fetch_pulls = bool(fetch_pulls)
+        self._activity = bool(activity)
+        if review_requests is None:
+            review_requests = self.review_requests
+        self._review_requests = max(0, int(review_requests))
+
+    @property
+    def pull_count(self):
+        """ pull_count Property Getter
+
+        Getter method for the pull_count property.
+        This method will return the estimated number of open pull requests.
+        """
+        return sum(self._repo_pulls.values())
+
+    def _search_pages(self):
+        """ Return the search pages and probes of a partitioned search """
+        this_pulls = self.pull_count
+        this_pages = max(1, math.ceil(this_pulls / self._per_page))
+        if this_pulls >= self._result_cap:
+            # The first page, a count probe and a partial last page for
+            # each slice of the partition.
+            this_slices = math.ceil(this_pulls / self._result_cap) + 1
+            this_pages += 2 * this_slices
+        return this_pages
+
+    def _wait(self, resource, requests):
+        """ Return the rate limit wait of sending requests to a resource """
+        if resource not in self._budgets:
+            return 0.0
+        this_remaining, this_limit, this_reset = self._budgets[resource]
+        if requests <= this_remaining:
+            return 0.0
+        this_windows = (requests - this_remaining - 1) // max(1, this_limit)
+        return (
+            max(0.0, float(this_reset)) +
+            this_windows * self.windows.get(resource, 3600)
+        )
+
+    def estimate(self, strategy):
+        """ Return the estimated cost of an enumeration strategy
+
+        Returns:
+            dict of strategy, requests by API resource, and seconds, with
+            seconds None when the strategy can not run the search
+        """
+        if strategy not in self.strategies:
+            raise ValueError(
+                f"strategy expected one of {self.strategies} but received: "
+                f"{strategy}"
+            )
+        this_counts = [_c_ for _c_ in self._repo_pulls.values() if _c_ > 0]
+        if strategy == 'list':
+            this_pages = sum(
+                math.ceil(_count_ / self._per_page) for _count_ in this_counts
+            )
+        else:
+            this_pages = self._search_pages()
+
+        # Listings hold the pull-request-simple payload, without the merge
+        # fields, so listed pull requests are fetched as search results are,
+        # and so are GraphQL search results.
+        this_hydration = (
+            self.hydration_requests + self._review_requests +
+            self._fetch_pulls
+        )
+        this_requests = {
+            'core': (
+                this_hydration * self.pull_count +
+                (len(this_counts) if strategy != 'search' else 0)
+            )
+        }
+        this_resource = self.resources[strategy]
+        this_requests[this_resource] = (
+            this_requests.get(this_resource, 0) + this_pages
+        )
+        if self._activity and strategy != 'graphql':
+            this_requests['graphql'] = self._search_pages()
+
+        this_seconds = None
+        if strategy != 'list' or self._listable:
+            this_seconds = (
+                sum(this_requests.values()) * self._request_seconds +
+                sum(
+                    self._wait(_resource_, _count_)
+                    for _resource_, _count_ in this_requests.items()
+                )
+            )
+        return {
+            'strategy': strategy,
+            'requests': this_requests,
+            'seconds': this_seconds
+        }
+
+    def plan(self):
+        """ Return the estimate of the fastest enumeration strategy """
+        this_estimates = [
+            self.estimate(_strategy_) for _strategy_ in self.strategies
+        ]
+        return min(
+            (_e_ for _e_ in this_estimates if _e_['seconds'] is not None),
+            key=lambda _e_: (_e_['seconds'], sum(_e_['requests'].values()))
+        )
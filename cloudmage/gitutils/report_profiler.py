@@ -0,0 +1,176 @@
+##############################################################################
+# CloudMage : Github Report Run Profiler
+# ============================================================================
+# CloudMage Report Profiler
+#   - Capture a deterministic (cProfile) or sampling (pyinstrument) profile
+#     of a report run and write it to a file.
+#   - Store the run parameters as metadata alongside the profile.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+from datetime import datetime, timezone
+import platform
+import cProfile
+import json
+import time
+import sys
+
+
+#####################
+# Class Definition: #
+#####################
+class ReportProfiler(object):
+    """ CloudMage Report Profiler Class
+
+    This class is designed to profile a single report run. The cprofile
+    profiler writes a pstats file that can be opened with pstats, snakeviz
+    or converted with flameprof/gprof2dot. The pyinstrument profiler, which
+    requires the optional pyinstrument package, samples the call stack and
+    writes an interactive HTML flame graph when the path ends in .html, or a
+    speedscope JSON profile otherwise. In both cases the run metadata is
+    written to a {path}.meta.json file next to the profile.
+
+    Only the thread that starts the profiler is profiled, so concurrent
+    comment writes show up as time spent waiting on the dispatcher.
+    """
+
+    profilers = ('cprofile', 'pyinstrument')
+
+    # Command line options whose values are replaced in the argv metadata,
+    # so credentials are never written next to the profile.
+    redacted_options = ('--token',)
+
+    def __init__(self, path, profiler='cprofile', interval=0.001):
+        """ ReportProfiler Class Constructor
+
+        Parameters:
+            path     (str)  : required
+            profiler (str)  : optional [default=cprofile]
+            interval (float): optional [default=0.001] pyinstrument only
+
+        Self Attributes:
+            self._path       (str)  : private
+            self._profiler   (str)  : private
+            self._interval   (float): private
+            self._profile    (obj)  : private
+            self._started    (float): private
+            self._started_at (str)  : private
+            self._elapsed    (float): private
+
+        Methods:
+            self.start()
+            self.stop()
+            self.write()
+        """
+        if profiler not in self.profilers:
+            raise ValueError(
+                f"profiler expected one of {self.profilers} but received: "
+                f"{profiler}"
+            )
+        self._path = path
+        self._profiler = profiler
+        self._interval = interval
+        self._profile = None
+        self._started = None
+        self._started_at = None
+        self._elapsed = None
+
+    @property
+    def metadata_path(self):
+        """ metadata_path Property Getter
+
+        Getter method for the metadata_path property.
+        This method will return the path of the metadata sidecar file.
+        """
+        return f"{self._path}.meta.json"
+
+    def start(self):
+        """ Start profiling the calling thread """
+        if self._profiler == 'pyinstrument':
+            # Optional dependency, only imported when it is requested.
+            from pyinstrument import Profiler
+            self._profile = Profiler(interval=self._interval)
+        else:
+            self._profile = cProfile.Profile()
+        self._started_at = datetime.now(timezone.utc).isoformat()
+        self._started = time.monotonic()
+        if self._profiler == 'pyinstrument':
+            self._profile.start()
+        else:
+            self._profile.enable()
+        return self
+
+    def stop(self):
+        """ Stop profiling """
+        if self._profiler == 'pyinstrument':
+            self._profile.stop()
+        else:
+            self._profile.disable()
+        self._elapsed = time.monotonic() - self._started
+        return self
+
+    def write(self, metadata=None):
+        """ Write the profile and its metadata sidecar file
+
+        Parameters:
+            metadata (dict): optional [default=None]
+
+        Returns:
+            Path of the written profile
+        """
+        if self._profiler == 'pyinstrument':
+            if self._path.lower().endswith(('.html', '.htm')):
+                this_output = self._profile.output_html()
+            else:
+                from pyinstrument.renderers import SpeedscopeRenderer
+                this_output = self._profile.output(SpeedscopeRenderer())
+            with open(self._path, 'w') as f:
+                f.write(this_output)
+        else:
+            self._profile.dump_stats(self._path)
+
+        this_metadata = {
+            'profiler': self._profiler,
+            'profile': self._path,
+            'started_at': self._started_at,
+            'elapsed': self._elapsed,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'argv': self._redacted_argv(sys.argv)
+        }
+        this_metadata.update(metadata or {})
+        with open(self.metadata_path, 'w') as f:
+            json.dump(this_metadata, f, indent=2, default=str)
+        return self._path
+
+    @classmethod
+    def _redacted_argv(cls, argv):
+        """ Return argv with the values of the redacted_options replaced """
+        this_argv = []
+        this_redact_next = False
+        for _arg_ in argv:
+            this_option = _arg_.split('=', 1)[0]
+            if this_redact_next:
+                _arg_ = '***'
+            elif this_option in cls.redacted_options and '=' in _arg_:
+                _arg_ = f"{this_option}=***"
+            this_redact_next = (
+                not this_redact_next and _arg_ in cls.redacted_options
+            )
+            this_argv.append(_arg_)
+        return this_argv
+
+    def __enter__(self):
+        """ Start profiling on entering the context """
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """ Stop profiling on leaving the context """
+        self.stop()
+        return False
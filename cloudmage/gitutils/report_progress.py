@@ -0,0 +1,152 @@
+##############################################################################
+# CloudMage : Github Report Progress Reporting
+# ============================================================================
+# CloudMage Report Progress
+#   - Progress and event sinks for report runs: a no-op sink for headless
+#     runs, and a terminal sink that coalesces progress updates and messages
+#     to a fixed refresh rate.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+import time
+import sys
+
+
+#####################
+# Class Definition: #
+#####################
+class NullProgress(object):
+    """ CloudMage Null Progress Sink
+
+    The progress and event sink interface used by report runs. start() is
+    called once the number of items is known, or with a total of None when
+    it is not, advance() as items complete, event() for each message and
+    finish() at the end of the run. This sink ignores all of them, so
+    headless runs spend no time on progress output.
+
+    Event levels are 'info' for run level messages, and 'detail' for per
+    item messages that are only of interest in verbose mode.
+    """
+
+    def start(self, total=None, label=''):
+        """ Begin tracking a run of total items """
+
+    def advance(self, count=1):
+        """ Record count completed items """
+
+    def event(self, message, level='info'):
+        """ Report a message """
+
+    def finish(self):
+        """ End the run, writing anything still pending """
+
+
+class TerminalProgress(NullProgress):
+    """ CloudMage Terminal Progress Sink
+
+    Draws a progress bar on a terminal, and writes messages above it. The
+    bar is redrawn, and pending messages are written, at most refresh_rate
+    times per second no matter how fast items complete, so report runs are
+    not held back by a slow terminal or pipe. Per item 'detail' messages
+    are only written in verbose mode, and the bar is only drawn when the
+    stream is a terminal.
+    """
+
+    def __init__(self, stream=None, refresh_rate=10, verbose=False):
+        """ TerminalProgress Class Constructor
+
+        Parameters:
+            stream       (obj)  : optional [default=sys.stderr at start]
+            refresh_rate (float): optional [default=10] updates per second
+            verbose      (bool) : optional [default=False]
+
+        Self Attributes:
+            self._stream   (obj)  : private
+            self._interval (float): private
+            self._verbose  (bool) : private
+            self._bar      (obj)  : private
+            self._done     (int)  : private
+            self._drawn    (int)  : private
+            self._pending  (list) : private
+            self._next     (float): private
+        """
+        self._stream = stream
+        self._interval = 1.0 / refresh_rate if refresh_rate else 0.0
+        self._verbose = verbose
+        self._bar = None
+        self._done = 0
+        self._drawn = 0
+        self._pending = []
+        self._next = 0.0
+
+    @property
+    def stream(self):
+        """ stream Property Getter
+
+        Getter method for the stream property.
+        This method will return the stream progress is written to.
+        """
+        return self._stream if self._stream is not None else sys.stderr
+
+    def start(self, total=None, label=''):
+        """ Begin tracking a run of total items """
+        from progress.bar import Bar
+        from progress.counter import Counter
+
+        self._flush()
+        self._done = 0
+        self._drawn = 0
+        if total is None:
+            self._bar = Counter(f"{label} ", file=self.stream)
+        else:
+            self._bar = Bar(label, max=total, file=self.stream)
+        self._next = time.monotonic() + self._interval
+
+    def advance(self, count=1):
+        """ Record count completed items """
+        self._done += count
+        self._tick()
+
+    def event(self, message, level='info'):
+        """ Queue a message for the next refresh """
+        if level == 'detail' and not self._verbose:
+            return
+        self._pending.append(message)
+        self._tick()
+
+    def finish(self):
+        """ Draw the final state and write all pending messages """
+        self._flush()
+        if self._bar is not None:
+            self._bar.finish()
+            self._bar = None
+
+    def _tick(self):
+        """ Refresh the output if the refresh interval has passed """
+        this_now = time.monotonic()
+        if this_now >= self._next:
+            self._next = this_now + self._interval
+            self._flush()
+
+    def _flush(self):
+        """ Write pending messages, then redraw the bar """
+        if self._pending:
+            if self._bar is not None and self._bar.is_tty():
+                # Clear the bar line, it is redrawn below the messages.
+                self.stream.write('\r\x1b[K')
+            self.stream.write(''.join(
+                f"{_message_}\n" for _message_ in self._pending
+            ))
+            self._pending = []
+            if self._bar is not None:
+                self._bar.update()
+        if self._bar is not None and self._done != self._drawn:
+            self._bar.next(self._done - self._drawn)
+            self._drawn = self._done
+        self.stream.flush()
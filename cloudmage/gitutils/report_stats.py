@@ -0,0 +1,549 @@
+##############################################################################
+# CloudMage : Github Report Run Statistics
+# ============================================================================
+# CloudMage Report Stats
+#   - Collect per-stage wall time, Github API request counts, bytes, cache
+#     hits and rate limit waits for a report run.
+#   - Export the collected statistics as Prometheus text or OpenTelemetry
+#     (OTLP JSON) metrics.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+from contextlib import contextmanager
+from urllib.parse import urlparse
+import functools
+import threading
+import json
+import time
+import re
+
+
+######################################
+# Endpoint Normalization:            #
+######################################
+# Root path segments of the Github API, used to strip the /api/v3 style
+# prefix of Github Enterprise urls before an endpoint is labeled.
+_API_ROOTS = (
+    'repos', 'search', 'orgs', 'users', 'user', 'rate_limit', 'graphql',
+    'teams', 'issues', 'notifications', 'gists'
+)
+
+_ENDPOINT_PATTERNS = (
+    (re.compile(r'^/repos/[^/]+/[^/]+'), '/repos/{repo}'),
+    (re.compile(r'^/(orgs|users)/[^/]+'), r'/\1/{owner}'),
+    (re.compile(r'/\d+(?=/|$)'), '/{number}')
+)
+
+
+def endpoint_label(verb, url):
+    """ Return a low cardinality label such as GET /repos/{repo}/pulls """
+    this_segments = urlparse(url).path.split('/')
+    for _index_, _segment_ in enumerate(this_segments):
+        if _segment_ in _API_ROOTS:
+            this_segments = [''] + this_segments[_index_:]
+            break
+    this_path = '/'.join(this_segments) or '/'
+    for _pattern_, _replacement_ in _ENDPOINT_PATTERNS:
+        this_path = _pattern_.sub(_replacement_, this_path)
+    return f"{verb.upper()} {this_path}"
+
+
+######################################
+# Instrumented Retry:                #
+######################################
+@functools.lru_cache(maxsize=None)
+def _instrumented_retry():
+    """ Build the GithubRetry subclass on first use
+
+    PyGithub is only imported once a report run asks for a retry policy.
+    """
+    from github import GithubRetry
+
+    class InstrumentedRetry(GithubRetry):
+        """ GithubRetry that records the time spent waiting before retries
+
+        PyGithub retries rate limited (403/429) and failed (5xx) requests
+        through urllib3, sleeping until the rate limit resets, for the
+        Retry-After period, or for the retry backoff.
+        """
+
+        stats = None
+
+        def new(self, **kwargs):
+            """ Carry the stats object over to the next retry state """
+            this_retry = super().new(**kwargs)
+            this_retry.stats = self.stats
+            return this_retry
+
+        def sleep(self, response=None):
+            """ Sleep before the next retry, recording the wait """
+            this_start = time.monotonic()
+            try:
+                super().sleep(response)
+            finally:
+                if self.stats is not None:
+                    self.stats.rate_limit_wait(
+                        time.monotonic() - this_start,
+                        'retry'
+                    )
+
+    return InstrumentedRetry
+
+
+#####################
+# Class Definition: #
+#####################
+class ReportStats(object):
+    """ CloudMage Report Stats Class
+
+    This class is designed to collect the statistics of a single report
+    run: the wall time and call count of each named stage, the count, bytes,
+    time and errors of every Github API request by endpoint and by the stage
+    that issued it, cache hits and misses, rate limit waits, the last seen
+    rate limit remaining per API resource, and free form event counters.
+    Statistics are returned as a dictionary by as_dict(), or rendered as
+    Prometheus text exposition or OTLP JSON metrics.
+    """
+
+    export_formats = ('prometheus', 'otlp')
+
+    def __init__(self):
+        """ ReportStats Class Constructor
+
+        Self Attributes:
+            self._lock         (obj)  : private
+            self._thread_stage (obj)  : private
+            self._stage_stack  (list) : private
+            self._started      (float): private
+            self._finished     (float): private
+            self._started_ns   (int)  : private
+            self._stages       (dict) : private
+            self._endpoints    (dict) : private
+            self._caches       (dict) : private
+            self._waits        (dict) : private
+            self._rate_limits  (dict) : private
+            self._counters     (dict) : private
+
+        Methods:
+            self.reset()
+            self.start()
+            self.finish()
+            self.stage()
+            self.thread_stage()
+            self.timed_iter()
+            self.request()
+            self.cache()
+            self.rate_limit_wait()
+            self.count()
+            self.instrument()
+            self.instrument_requester()
+            self.retry()
+            self.as_dict()
+            self.to_prometheus()
+            self.to_opentelemetry()
+            self.export()
+        """
+        self._lock = threading.Lock()
+        self._thread_stage = threading.local()
+        self.reset()
+
+    def reset(self):
+        """ Clear all collected statistics """
+        with self._lock:
+            self._stage_stack = []
+            self._started = None
+            self._finished = None
+            self._started_ns = time.time_ns()
+            self._stages = {}
+            self._endpoints = {}
+            self._caches = {}
+            self._waits = {}
+            self._rate_limits = {}
+            self._counters = {}
+
+    def start(self):
+        """ Reset the statistics and mark the start of a run """
+        self.reset()
+        self._started = time.monotonic()
+
+    def finish(self):
+        """ Mark the end of a run """
+        self._finished = time.monotonic()
+
+    @property
+    def elapsed(self):
+        """ elapsed Property Getter
+
+        Getter method for the elapsed property.
+        This method will return the run wall time in seconds.
+        """
+        if self._started is None:
+            return 0.0
+        if self._finished is None:
+            return time.monotonic() - self._started
+        return self._finished - self._started
+
+    ############################################
+    # Stage Timing:                            #
+    ############################################
+    def _stage_entry(self, name):
+        """ Return the statistics entry of the named stage """
+        return self._stages.setdefault(
+            name,
+            {'seconds': 0.0, 'calls': 0, 'requests': 0, 'bytes': 0}
+        )
+
+    @contextmanager
+    def stage(self, name):
+        """ Time the wrapped block as the named stage
+
+        Github API requests made while the block runs, including requests
+        made by worker threads, are attributed to the innermost stage.
+        """
+        self._stage_stack.append(name)
+        this_start = time.monotonic()
+        try:
+            yield self
+        finally:
+            this_elapsed = time.monotonic() - this_start
+            self._stage_stack.pop()
+            with self._lock:
+                this_stage = self._stage_entry(name)
+                this_stage['seconds'] += this_elapsed
+                this_stage['calls'] += 1
+
+    @contextmanager
+    def thread_stage(self, name):
+        """ Attribute the requests of the current thread to the named stage
+
+        For background threads, such as page prefetchers, working for a
+        stage that the main thread times. The stage is not timed again,
+        and the stage stack of the main thread is left alone.
+        """
+        this_previous = getattr(self._thread_stage, 'name', None)
+        self._thread_stage.name = name
+        try:
+            yield self
+        finally:
+            self._thread_stage.name = this_previous
+
+    def timed_iter(self, name, iterable):
+        """ Iterate, timing each step of the iterator as the named stage
+
+        Used for lazily paginated results, where the page requests happen
+        while the iterator advances.
+        """
+        this_iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    this_item = next(this_iterator)
+                except StopIteration:
+                    return
+            yield this_item
+
+    ############################################
+    # Event Recording:                         #
+    ############################################
+    def request(
+        self,
+        verb,
+        url,
+        status=None,
+        size=0,
+        seconds=0.0,
+        headers=None
+    ):
+        """ Record a completed Github API request """
+        this_label = endpoint_label(verb, url)
+        this_stage_name = getattr(self._thread_stage, 'name', None)
+        if this_stage_name is None:
+            this_stage_name = (
+                self._stage_stack[-1] if self._stage_stack else 'unstaged'
+            )
+        with self._lock:
+            this_endpoint = self._endpoints.setdefault(
+                this_label,
+                {'requests': 0, 'bytes': 0, 'seconds': 0.0, 'errors': 0}
+            )
+            this_endpoint['requests'] += 1
+            this_endpoint['bytes'] += size
+            this_endpoint['seconds'] += seconds
+            if status is not None and status >= 400:
+                this_endpoint['errors'] += 1
+
+            this_stage = self._stage_entry(this_stage_name)
+            this_stage['requests'] += 1
+            this_stage['bytes'] += size
+
+            if headers and 'x-ratelimit-remaining' in headers:
+                self._rate_limits[
+                    headers.get('x-ratelimit-resource', 'core')
+                ] = int(float(headers['x-ratelimit-remaining']))
+
+    def cache(self, name, hit, count=1):
+        """ Record cache hits (hit=True) or misses for the named cache """
+        with self._lock:
+            this_cache = self._caches.setdefault(
+                name,
+                {'hits': 0, 'misses': 0}
+            )
+            this_cache['hits' if hit else 'misses'] += count
+
+    def rate_limit_wait(self, seconds, source='retry', count=1):
+        """ Record time spent waiting on a rate limit or write throttle """
+        with self._lock:
+            this_wait = self._waits.setdefault(
+                source,
+                {'waits': 0, 'seconds': 0.0}
+            )
+            this_wait['waits'] += count
+            this_wait['seconds'] += seconds
+
+    def count(self, name, value=1):
+        """ Increment the named event counter """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    ############################################
+    # PyGithub Instrumentation:                #
+    ############################################
+    def instrument(self, github):
+        """ Record every request made through the Github object
+
+        Wraps the requestJson method of the Github object's requester, which
+        all REST calls made by the reports go through, on that instance
+        only.
+        """
+        self.instrument_requester(github.requester)
+        return github
+
+    def instrument_requester(self, requester):
+        """ Record every request made through a PyGithub Requester """
+        this_request_json = requester.requestJson
+
+        def request_json(verb, url, *args, **kwargs):
+            this_start = time.monotonic()
+            this_status, this_headers, this_output = this_request_json(
+                verb, url, *args, **kwargs
+            )
+            self.request(
+                verb,
+                url,
+                this_status,
+                len(this_output.encode('utf-8')),
+                time.monotonic() - this_start,
+                this_headers
+            )
+            return this_status, this_headers, this_output
+
+        requester.requestJson = request_json
+        return requester
+
+    def retry(self, **kwargs):
+        """ Return a GithubRetry that records its waits in these stats """
+        this_retry = _instrumented_retry()(**kwargs)
+        this_retry.stats = self
+        return this_retry
+
+    ############################################
+    # Export:                                  #
+    ############################################
+    def as_dict(self):
+        """ Return a copy of the collected statistics """
+        with self._lock:
+            this_stages = {
+                _name_: dict(_stage_) for _name_, _stage_ in
+                self._stages.items()
+            }
+            this_endpoints = {
+                _name_: dict(_endpoint_) for _name_, _endpoint_ in
+                self._endpoints.items()
+            }
+            return {
+                'elapsed': self.elapsed,
+                'requests': sum(
+                    _e_['requests'] for _e_ in this_endpoints.values()
+                ),
+                'bytes': sum(_e_['bytes'] for _e_ in this_endpoints.values()),
+                'stages': this_stages,
+                'endpoints': this_endpoints,
+                'caches': {
+                    _name_: dict(_cache_) for _name_, _cache_ in
+                    self._caches.items()
+                },
+                'rate_limit_waits': {
+                    _name_: dict(_wait_) for _name_, _wait_ in
+                    self._waits.items()
+                },
+                'rate_limit_remaining': dict(self._rate_limits),
+                'counters': dict(self._counters)
+            }
+
+    def _metrics(self):
+        """ Yield (name, type, unit, help, [(labels, value)]) metrics """
+        this_stats = self.as_dict()
+        this_endpoints = [
+            (dict(zip(('method', 'endpoint'), _name_.split(' ', 1))), _e_)
+            for _name_, _e_ in sorted(this_stats['endpoints'].items())
+        ]
+        this_stages = sorted(this_stats['stages'].items())
+
+        yield ('run_seconds', 'gauge', 's', "Report run wall time.",
+               [({}, this_stats['elapsed'])])
+        yield ('stage_seconds_total', 'counter', 's',
+               "Wall time spent in each report stage.",
+               [({'stage': _n_}, _s_['seconds']) for _n_, _s_ in this_stages])
+        yield ('stage_calls_total', 'counter', '1',
+               "Number of times each report stage ran.",
+               [({'stage': _n_}, _s_['calls']) for _n_, _s_ in this_stages])
+        yield ('stage_api_requests_total', 'counter', '1',
+               "Github API requests issued by each report stage.",
+               [({'stage': _n_}, _s_['requests']) for _n_, _s_ in
+                this_stages])
+        yield ('api_requests_total', 'counter', '1',
+               "Github API requests by endpoint.",
+               [(_l_, _e_['requests']) for _l_, _e_ in this_endpoints])
+        yield ('api_errors_total', 'counter', '1',
+               "Github API error responses by endpoint.",
+               [(_l_, _e_['errors']) for _l_, _e_ in this_endpoints])
+        yield ('api_response_bytes_total', 'counter', 'By',
+               "Github API response body bytes by endpoint.",
+               [(_l_, _e_['bytes']) for _l_, _e_ in this_endpoints])
+        yield ('api_request_seconds_total', 'counter', 's',
+               "Github API request wall time by endpoint.",
+               [(_l_, _e_['seconds']) for _l_, _e_ in this_endpoints])
+        this_caches = sorted(this_stats['caches'].items())
+        yield ('cache_hits_total', 'counter', '1', "Cache hits by cache.",
+               [({'cache': _n_}, _c_['hits']) for _n_, _c_ in this_caches])
+        yield ('cache_misses_total', 'counter', '1', "Cache misses by cache.",
+               [({'cache': _n_}, _c_['misses']) for _n_, _c_ in this_caches])
+        this_waits = sorted(this_stats['rate_limit_waits'].items())
+        yield ('rate_limit_waits_total', 'counter', '1',
+               "Rate limit and write throttle waits by source.",
+               [({'source': _n_}, _w_['waits']) for _n_, _w_ in this_waits])
+        yield ('rate_limit_wait_seconds_total', 'counter', 's',
+               "Time spent waiting on rate limits by source.",
+               [({'source': _n_}, _w_['seconds']) for _n_, _w_ in
+                this_waits])
+        yield ('rate_limit_remaining', 'gauge', '1',
+               "Last seen Github rate limit remaining by resource.",
+               [({'resource': _n_}, _v_) for _n_, _v_ in
+                sorted(this_stats['rate_limit_remaining'].items())])
+        yield ('events_total', 'counter', '1', "Report event counters.",
+               [({'event': _n_}, _v_) for _n_, _v_ in
+                sorted(this_stats['counters'].items())])
+
+    @staticmethod
+    def _prometheus_labels(labels):
+        """ Render a Prometheus label set """
+        if not labels:
+            return ''
+        this_labels = ','.join(
+            '{}="{}"'.format(
+                _key_,
+                str(_value_).replace('\\', '\\\\').replace(
+                    '"', '\\"'
+                ).replace('\n', '\\n')
+            )
+            for _key_, _value_ in labels.items()
+        )
+        return f"{{{this_labels}}}"
+
+    def to_prometheus(self, prefix='gitutils_report'):
+        """ Render the statistics in the Prometheus text exposition format """
+        this_lines = []
+        for _name_, _type_, _unit_, _help_, _points_ in self._metrics():
+            if not _points_:
+                continue
+            this_name = f"{prefix}_{_name_}"
+            this_lines.append(f"# HELP {this_name} {_help_}")
+            this_lines.append(f"# TYPE {this_name} {_type_}")
+            for _labels_, _value_ in _points_:
+                this_lines.append(
+                    f"{this_name}{self._prometheus_labels(_labels_)} "
+                    f"{_value_}"
+                )
+        return '\n'.join(this_lines) + '\n'
+
+    def to_opentelemetry(
+        self,
+        prefix='gitutils.report',
+        service_name='cloudmage-gitutils'
+    ):
+        """ Return the statistics as an OTLP JSON ExportMetricsServiceRequest
+
+        The returned dictionary can be posted to an OpenTelemetry collector
+        /v1/metrics endpoint with the application/json content type.
+        """
+        this_now = str(time.time_ns())
+        this_start = str(self._started_ns)
+        this_metrics = []
+        for _name_, _type_, _unit_, _help_, _points_ in self._metrics():
+            if not _points_:
+                continue
+            this_points = []
+            for _labels_, _value_ in _points_:
+                this_point = {
+                    'attributes': [
+                        {'key': _k_, 'value': {'stringValue': str(_v_)}}
+                        for _k_, _v_ in _labels_.items()
+                    ],
+                    'startTimeUnixNano': this_start,
+                    'timeUnixNano': this_now
+                }
+                if isinstance(_value_, int):
+                    this_point['asInt'] = str(_value_)
+                else:
+                    this_point['asDouble'] = float(_value_)
+                this_points.append(this_point)
+
+            this_metric = {
+                'name': f"{prefix}.{_name_.replace('_total', '')}",
+                'description': _help_,
+                'unit': _unit_
+            }
+            if _type_ == 'counter':
+                this_metric['sum'] = {
+                    'dataPoints': this_points,
+                    'aggregationTemporality': 2,
+                    'isMonotonic': True
+                }
+            else:
+                this_metric['gauge'] = {'dataPoints': this_points}
+            this_metrics.append(this_metric)
+
+        return {
+            'resourceMetrics': [{
+                'resource': {
+                    'attributes': [{
+                        'key': 'service.name',
+                        'value': {'stringValue': service_name}
+                    }]
+                },
+                'scopeMetrics': [{
+                    'scope': {'name': 'cloudmage.gitutils'},
+                    'metrics': this_metrics
+                }]
+            }]
+        }
+
+    def export(self, path, export_format='prometheus'):
+        """ Write the statistics to a Prometheus text or OTLP JSON file """
+        if export_format not in self.export_formats:
+            raise ValueError(
+                f"export_format expected one of {self.export_formats} but "
+                f"received: {export_format}"
+            )
+        with open(path, 'w') as f:
+            if export_format == 'prometheus':
+                f.write(self.to_prometheus())
+            else:
+                json.dump(self.to_opentelemetry(), f)
+        return path
@@ -0,0 +1,177 @@
+##############################################################################
+# CloudMage : Github Pull Request Reviewer States
+# ============================================================================
+# CloudMage Reviewer States
+#   - Track the requested reviewers and review teams of a pull request and
+#     the latest review state of each reviewer.
+#   - Render the reviewer list and @mentions of the open pull request report.
+#   - Optionally keep the review history of the pull request as columns.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+
+#####################
+# Class Definition: #
+#####################
+class ReviewerStates(object):
+    """ CloudMage Pull Request Reviewer States Class
+
+    This class is designed to collect the reviewers of a single pull
+    request. Requested users are keyed by login and requested teams by
+    slug, reviews are recorded in the order they were submitted so the
+    latest state of each reviewer wins. Every lookup is a dict lookup, so
+    the cost of a pull request is linear in its reviews, and logins are
+    compared as whole values rather than matched as substrings.
+
+    With history enabled, every review request and review is also kept in
+    a timeline of parallel columns, one entry per event, which is compact
+    to hold for thousands of pull requests and maps directly onto columnar
+    analytics formats.
+    """
+
+    # Columns of the review timeline.
+    timeline_columns = ('reviewer', 'kind', 'state', 'at')
+
+    def __init__(self, author=None, history=False, organization=None):
+        """ ReviewerStates Class Constructor
+
+        Parameters:
+            author       (str) : optional [default=None] pull request author
+                                 login
+            history      (bool): optional [default=False] keep the review
+                                 timeline
+            organization (str) : optional [default=None] login of the
+                                 organization owning the requested teams
+
+        Self Attributes:
+            self._author       (str) : private
+            self._organization (str) : private
+            self._reviewers    (dict): private
+            self._timeline     (dict): private, None without history
+        """
+        self._author = author
+        self._organization = organization
+        # (kind, login or slug) -> [display name, latest review state]
+        self._reviewers = {}
+        self._timeline = (
+            {_column_: [] for _column_ in self.timeline_columns}
+            if history else None
+        )
+
+    def _record(self, reviewer, kind, state, at):
+        """ Append an event to the review timeline """
+        if self._timeline is not None:
+            self._timeline['reviewer'].append(reviewer)
+            self._timeline['kind'].append(kind)
+            self._timeline['state'].append(state)
+            self._timeline['at'].append(at)
+
+    def request_user(self, login, requested_at=None, record=True):
+        """ Record a requested reviewer
+
+        With record False, the timeline event is left to requested().
+        """
+        self._reviewers.setdefault(('user', login), [login, None])
+        if record:
+            self._record(login, 'user', 'REQUESTED', requested_at)
+
+    def request_team(self, slug, name=None, requested_at=None, record=True):
+        """ Record a requested review team
+
+        With record False, the timeline event is left to requested().
+        """
+        self._reviewers.setdefault(('team', slug), [name or slug, None])
+        if record:
+            self._record(slug, 'team', 'REQUESTED', requested_at)
+
+    def requested(self, reviewer, kind, requested_at):
+        """ Record a review request event on the timeline
+
+        For the review request events of the pull request, including the
+        requests of reviewers that have since reviewed.
+        """
+        self._record(reviewer, kind, 'REQUESTED', requested_at)
+
+    def review(self, login, state, submitted_at=None):
+        """ Record a review, replacing the reviewer's earlier state """
+        self._reviewers.setdefault(('user', login), [login, None])[1] = state
+        self._record(login, 'user', state, submitted_at)
+
+    def state(self, login):
+        """ Return the latest review state of a reviewer, or None """
+        return self._reviewers.get(('user', login), [None, None])[1]
+
+    @property
+    def reviewers(self):
+        """ reviewers Property Getter
+
+        Getter method for the reviewers property.
+        This method will return the report reviewer list: the login of
+        reviewers yet to review, the name of requested teams, and
+        "login: STATE" for reviewers that reviewed.
+        """
+        return [
+            _name_ if _state_ is None else f"{_name_}: {_state_}"
+            for _name_, _state_ in self._reviewers.values()
+        ]
+
+    @property
+    def mentions(self):
+        """ mentions Property Getter
+
+        Getter method for the mentions property.
+        This method will return the @mentions of the pull request author,
+        followed by every requested reviewer, team and reviewer. Teams are
+        mentioned as @organization/slug, the form Github resolves.
+        """
+        this_mentions = {}
+        if self._author is not None:
+            this_mentions[self._author] = None
+        for (_kind_, _key_), (_name_, _) in self._reviewers.items():
+            if _kind_ == 'team':
+                _name_ = (
+                    _key_ if self._organization is None
+                    else f"{self._organization}/{_key_}"
+                )
+            this_mentions.setdefault(_name_, None)
+        return [f"@{_name_}" for _name_ in this_mentions]
+
+    @property
+    def timeline(self):
+        """ timeline Property Getter
+
+        Getter method for the timeline property.
+        This method will return the review timeline columns, reviewer
+        (login or team slug), kind (user or team), state (REQUESTED or the
+        review state) and at (event time, None when unknown), or None when
+        history is disabled.
+        """
+        return self._timeline
+
+    def requested_at(self):
+        """ Return the time of the first review request, or None """
+        return self._first_at(lambda _state_: _state_ == 'REQUESTED')
+
+    def first_review_at(self):
+        """ Return the time of the first review, or None """
+        return self._first_at(lambda _state_: _state_ != 'REQUESTED')
+
+    def approved_at(self):
+        """ Return the time of the first approval, or None """
+        return self._first_at(lambda _state_: _state_ == 'APPROVED')
+
+    def _first_at(self, match):
+        """ Return the earliest timeline time of a matching state """
+        if self._timeline is None:
+            return None
+        return min(
+            (
+                _at_ for _state_, _at_ in zip(
+                    self._timeline['state'], self._timeline['at']
+                )
+                if _at_ is not None and match(_state_)
+            ),
+            default=None
+        )
@@ -0,0 +1,143 @@
+##############################################################################
+# CloudMage : Github Search Query Partitioner
+# ============================================================================
+# CloudMage Search Partitioner
+#   - Split a pull request search query into slices that each return fewer
+#     results than the Github search result cap, so large namespaces are
+#     reported completely.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+from datetime import datetime, timezone
+import math
+
+
+#####################
+# Class Definition: #
+#####################
+class SearchPartitioner(object):
+    """ CloudMage Search Partitioner Class
+
+    This class is designed to split a SearchQuery whose result count
+    reaches the Github search result cap (1000 results per query) into
+    slices that each stay under the cap. Queries are split into created:
+    date ranges sized from the result count, and a range that can not be
+    split any further, one second wide, is split by repository instead.
+    Slices are probed with the count function, slices without results are
+    dropped, and slices still at the cap after every split are returned and
+    listed in the truncated attribute.
+
+    Adjacent date ranges share their boundary second, as Github range
+    qualifiers include both ends, so slice results must be merged by
+    pull request id.
+    """
+
+    # Github returns at most this many results for a search query.
+    result_cap = 1000
+
+    # Lower bound of open ended date ranges, Github launched in 2008.
+    epoch = datetime(2008, 1, 1, tzinfo=timezone.utc)
+
+    def __init__(self, count, repos=None, cap=None, now=None):
+        """ SearchPartitioner Class Constructor
+
+        Parameters:
+            count (func)    : required, returns the result count of a query
+            repos (func)    : optional [default=None] returns the repository
+                              names of the query namespace
+            cap   (int)     : optional [default=1000]
+            now   (datetime): optional [default=current time]
+
+        Attributes:
+            self.truncated (list): slices still at the cap
+        """
+        self._count = count
+        self._repos = repos
+        self._cap = self.result_cap if cap is None else int(cap)
+        self._now = now or datetime.now(timezone.utc)
+        self.truncated = []
+
+    @staticmethod
+    def _utc(value):
+        """ Return a timezone aware datetime truncated to the second """
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.replace(microsecond=0)
+
+    def _split_dates(self, query, count):
+        """ Split a query into created: date ranges holding roughly equal
+        shares of its results, or return [] when the range is too narrow.
+        """
+        this_lower = self._utc(query.created_after or self.epoch)
+        this_upper = self._utc(query.created_before or self._now)
+        this_parts = max(2, math.ceil(count / self._cap) + 1)
+        this_step = (this_upper - this_lower) / this_parts
+        this_bounds = []
+        for _part_ in range(1, this_parts):
+            this_bound = self._utc(this_lower + this_step * _part_)
+            if this_bound > max([this_lower] + this_bounds):
+                this_bounds.append(this_bound)
+        this_bounds = [_b_ for _b_ in this_bounds if _b_ < this_upper]
+        if not this_bounds:
+            return []
+        # The outer slices keep the query's own bounds, so an open ended
+        # range stays open ended.
+        this_starts = [query.created_after] + this_bounds
+        this_ends = this_bounds + [query.created_before]
+        return [
+            query.copy(created_after=_start_, created_before=_end_)
+            for _start_, _end_ in zip(this_starts, this_ends)
+        ]
+
+    def _split_repos(self, query):
+        """ Split a query into one query per repository, or return [] """
+        if len(query.repos) > 1:
+            this_repos = query.repos
+        elif not query.repos and self._repos is not None:
+            this_excluded = set(query.exclude_repos)
+            this_repos = [
+                _repo_ for _repo_ in self._repos()
+                if _repo_ not in this_excluded and
+                f"{query.namespace}/{_repo_}" not in this_excluded
+            ]
+        else:
+            return []
+        return [query.copy(repos=(_repo_,)) for _repo_ in this_repos]
+
+    def partition(self, query, count=None):
+        """ Return a list of (query, result count) slices of the query
+
+        Parameters:
+            query (obj): required SearchQuery
+            count (int): optional [default=None] result count of the query
+                         when already known
+        """
+        this_slices = []
+        this_pending = [(query, count)]
+        while this_pending:
+            this_query, this_count = this_pending.pop()
+            if this_count is None:
+                this_count = self._count(this_query)
+            if this_count == 0:
+                continue
+            if this_count < self._cap:
+                this_slices.append((this_query, this_count))
+                continue
+            this_children = (
+                self._split_dates(this_query, this_count) or
+                self._split_repos(this_query)
+            )
+            if not this_children:
+                self.truncated.append(this_query)
+                this_slices.append((this_query, this_count))
+                continue
+            this_pending.extend(
+                (_child_, None) for _child_ in reversed(this_children)
+            )
+        return this_slices
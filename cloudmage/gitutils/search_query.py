@@ -0,0 +1,201 @@
+##############################################################################
+# CloudMage : Github Pull Request Search Query Builder
+# ============================================================================
+# CloudMage Search Query
+#   - Build the Github search query of the open pull request report, so
+#     filters are applied by Github instead of after the pull requests were
+#     downloaded.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+from datetime import timezone
+
+
+#####################
+# Class Definition: #
+#####################
+class SearchQuery(object):
+    """ CloudMage Search Query Class
+
+    This class is designed to build the Github issue search query for open
+    pull requests in a user or organization namespace. Every filter is
+    expressed as a search qualifier, so pull requests that are filtered
+    out are never returned by the search API:
+
+        created_before / created_after : created:<time, created:>=time
+        draft          : draft:false excludes draft pull requests
+        labels         : label:a,b matches any of the labels
+        exclude_labels : -label:a for each label
+        repos          : repo:owner/name, matches any of the repositories
+        exclude_repos  : -repo:owner/name for each repository
+        review         : review:none|required|approved|changes_requested
+
+    Repository names without an owner are qualified with the namespace.
+    SearchQuery objects are not changed once built, copy() returns a new
+    query with some of the filters replaced.
+    """
+
+    review_states = ('none', 'required', 'approved', 'changes_requested')
+
+    def __init__(
+        self,
+        namespace=None,
+        is_organization=False,
+        created_before=None,
+        created_after=None,
+        draft=None,
+        labels=(),
+        exclude_labels=(),
+        repos=(),
+        exclude_repos=(),
+        review=None
+    ):
+        """ SearchQuery Class Constructor
+
+        Parameters:
+            namespace       (str)     : optional [default=None]
+            is_organization (bool)    : optional [default=False]
+            created_before  (datetime): optional [default=None]
+            created_after   (datetime): optional [default=None]
+            draft           (bool)    : optional [default=None] both
+            labels          (list)    : optional [default=()]
+            exclude_labels  (list)    : optional [default=()]
+            repos           (list)    : optional [default=()]
+            exclude_repos   (list)    : optional [default=()]
+            review          (str)     : optional [default=None]
+        """
+        if review is not None and review not in self.review_states:
+            raise ValueError(
+                f"review expected one of {self.review_states} but received: "
+                f"{review}"
+            )
+        if draft is not None and not isinstance(draft, bool):
+            raise ValueError(
+                f"draft expected type bool but received type: {type(draft)}"
+            )
+        self.namespace = namespace
+        self.is_organization = bool(is_organization)
+        self.created_before = created_before
+        self.created_after = created_after
+        self.draft = draft
+        self.labels = tuple(labels)
+        self.exclude_labels = tuple(exclude_labels)
+        self.repos = tuple(repos)
+        self.exclude_repos = tuple(exclude_repos)
+        self.review = review
+
+    def copy(self, **changes):
+        """ Return a copy of the query with the given filters replaced """
+        this_filters = dict(vars(self))
+        this_filters.update(changes)
+        return SearchQuery(**this_filters)
+
+    @staticmethod
+    def _timestamp(value):
+        """ Format a datetime as a search qualifier timestamp """
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return f"{value.replace(microsecond=0).isoformat()}Z"
+
+    @staticmethod
+    def _quote(value):
+        """ Quote a qualifier value containing spaces """
+        return f'"{value}"' if ' ' in value else value
+
+    def _repo(self, repo):
+        """ Qualify a repository name with the namespace """
+        if '/' in repo or self.namespace is None:
+            return repo
+        return f"{self.namespace}/{repo}"
+
+    @property
+    def listable(self):
+        """ listable Property Getter
+
+        Getter method for the listable property.
+        This method will return True when every filter of the query can be
+        applied to per repository pull request listings, which hold the
+        repository and creation time but not the label, draft and review
+        qualifiers.
+        """
+        return (
+            self.draft is None and self.review is None and
+            not self.labels and not self.exclude_labels
+        )
+
+    def includes_repo(self, repo):
+        """ Return True when the repos filters include a repository """
+        this_repo = self._repo(repo).lower()
+        def qualified(repos):
+            return {self._repo(_r_).lower() for _r_ in repos}
+
+        if this_repo in qualified(self.exclude_repos):
+            return False
+        return not self.repos or this_repo in qualified(self.repos)
+
+    def includes_created(self, created_at):
+        """ Return True when the created filters include a creation time """
+        def aware(value):
+            if value.tzinfo is None:
+                return value.replace(tzinfo=timezone.utc)
+            return value
+
+        if (
+            self.created_after is not None and
+            aware(created_at) < aware(self.created_after)
+        ):
+            return False
+        return (
+            self.created_before is None or
+            aware(created_at) < aware(self.created_before)
+        )
+
+    def terms(self):
+        """ Return the list of search qualifiers of the query """
+        this_terms = ['is:pr', 'is:open', 'is:unmerged']
+        if self.namespace is not None:
+            this_owner = 'org' if self.is_organization else 'user'
+            this_terms.append(f"{this_owner}:{self.namespace}")
+        if self.created_after is not None and self.created_before is not None:
+            this_terms.append(
+                f"created:{self._timestamp(self.created_after)}.."
+                f"{self._timestamp(self.created_before)}"
+            )
+        elif self.created_before is not None:
+            this_terms.append(
+                f"created:<{self._timestamp(self.created_before)}"
+            )
+        elif self.created_after is not None:
+            this_terms.append(
+                f"created:>={self._timestamp(self.created_after)}"
+            )
+        if self.draft is not None:
+            this_terms.append(f"draft:{str(self.draft).lower()}")
+        if self.labels:
+            this_terms.append(
+                "label:" + ','.join(self._quote(_l_) for _l_ in self.labels)
+            )
+        this_terms.extend(
+            f"-label:{self._quote(_label_)}" for _label_ in self.exclude_labels
+        )
+        this_terms.extend(f"repo:{self._repo(_r_)}" for _r_ in self.repos)
+        this_terms.extend(
+            f"-repo:{self._repo(_r_)}" for _r_ in self.exclude_repos
+        )
+        if self.review is not None:
+            this_terms.append(f"review:{self.review}")
+        return this_terms
+
+    def __str__(self):
+        """ Return the search query string """
+        return ' '.join(self.terms())
+
+    def __repr__(self):
+        """ Return the search query representation """
+        return f"SearchQuery({str(self)!r})"
@@ -0,0 +1,103 @@
+##############################################################################
+# CloudMage : Github Per Thread Requesters
+# ============================================================================
+# CloudMage Thread Requesters
+#   - Stand in for the PyGithub Requester of a Github object, sending the
+#     requests of every thread through a requester of its own.
+# Author: Richard Nason rnason@cloudmage.io
+# Project Start: 4/4/2020
+# License: GNU GPLv3
+##############################################################################
+
+###############
+# Imports:    #
+###############
+# Import Base Python Modules
+import threading
+
+
+#####################
+# Class Definition: #
+#####################
+class ThreadRequesters(object):
+    """ CloudMage Thread Requesters Class
+
+    This class is designed to stand in for the PyGithub Requester of a
+    Github object whose objects are used from several threads. A Requester
+    sends its requests through a single connection object, which stores a
+    request in request() and only sends it in getresponse(), so concurrent
+    requests through one Requester interleave, and responses are handed to
+    the wrong caller. The thread that builds the class keeps the original
+    requester, and every other thread sends its requests through a
+    requester of its own, built with the settings of the original the first
+    time the thread makes a request, and dropped with the thread.
+
+    Attribute access is forwarded to the requester of the calling thread,
+    so the Github object, the objects it builds and raw transports can be
+    handed between threads. Each requester spaces its own requests by the
+    seconds_between_requests setting.
+    """
+
+    def __init__(self, requester, prepare=None):
+        """ ThreadRequesters Class Constructor
+
+        Parameters:
+            requester (obj)  : required PyGithub Requester of the building
+                               thread
+            prepare   (func) : optional [default=None] called with every
+                               requester built for another thread, such as
+                               ReportStats.instrument_requester
+        """
+        self._requester = requester
+        self._prepare = prepare
+        self._owner = threading.get_ident()
+        self._local = threading.local()
+
+    @property
+    def current(self):
+        """ current Property Getter
+
+        Getter method for the current property.
+        This method will return the requester of the calling thread.
+        """
+        if threading.get_ident() == self._owner:
+            return self._requester
+        this_requester = getattr(self._local, 'requester', None)
+        if this_requester is None:
+            this_requester = type(self._requester)(**self._requester.kwargs)
+            if self._prepare is not None:
+                self._prepare(this_requester)
+            self._local.requester = this_requester
+        return this_requester
+
+    def _derived(self, requester):
+        """ Return self for the calling thread's own requester
+
+        The with methods of a Requester return the requester itself when
+        the setting is unchanged, and a new requester otherwise, which
+        gets thread requesters of its own.
+        """
+        if requester is self.current:
+            return self
+        if self._prepare is not None:
+            self._prepare(requester)
+        return ThreadRequesters(requester, prepare=self._prepare)
+
+    def withAuth(self, auth):
+        """ Return the requesters with the given authentication """
+        return self._derived(self.current.withAuth(auth))
+
+    def withLazy(self, lazy):
+        """ Return the requesters with the given lazy setting """
+        return self._derived(self.current.withLazy(lazy))
+
+    def withApiVersion(self, api_version):
+        """ Return the requesters with the given API version """
+        return self._derived(self.current.withApiVersion(api_version))
+
+    def __getattr__(self, name):
+        """ Forward attribute access to the calling thread's requester """
+        if name in ('_requester', '_prepare', '_owner', '_local'):
+            # Not set yet, as on an instance being copied.
+            raise AttributeError(name)
+        return getattr(self.current, name)
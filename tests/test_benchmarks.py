@@ -0,0 +1,129 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_benchmarks.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_benchmarks.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from benchmarks import runner
+from benchmarks.bench_import import _import_probe, _run_probe
+
+# Base Python Module Imports:
+import os
+
+
+######################################
+# Test Benchmark Runner:             #
+######################################
+def test_measure():
+    """ Benchmark Runner Measure Test
+
+    This test will measure a registered benchmark case that allocates a
+    known amount of memory, and ensure its fixture is cleaned up.
+
+    Expected Result:
+      Positive per call time, at least the allocated peak memory, and the
+      setup generator closed after measurement.
+    """
+    Events = []
+
+    def setup():
+        Events.append('setup')
+        try:
+            yield lambda: bytearray(1024 * 1024)
+        finally:
+            Events.append('teardown')
+
+    Case = runner.Benchmark('test.alloc', setup, repeat=3, min_time=0.01)
+    Result = runner.measure(Case)
+    assert(Result['time'] > 0)
+    assert(Result['repeat'] == 3)
+    assert(Result['loops'] >= 1)
+    assert(Result['peak_memory'] >= 1024 * 1024)
+    assert(Events == ['setup', 'teardown'])
+
+
+def test_compare_and_save(tmp_path):
+    """ Benchmark Runner Baseline Test
+
+    This test will save baselines, and compare results within and beyond
+    the time and memory tolerances against them.
+
+    Expected Result:
+      Only the metrics that exceed their tolerance are reported.
+    """
+    BaselinePath = os.path.join(str(tmp_path), 'baselines.json')
+    runner.save_baselines(
+        {'case': {'time': 1.0, 'peak_memory': 1000, 'loops': 1}},
+        BaselinePath
+    )
+    Baselines = runner.load_baselines(BaselinePath)
+    assert(
+        Baselines['benchmarks']['case'] == {'time': 1.0, 'peak_memory': 1000}
+    )
+    assert(Baselines['machine'] == runner.machine_info())
+
+    assert(runner.compare(
+        {'case': {'time': 1.2, 'peak_memory': 1050}}, Baselines
+    ) == [])
+    assert(runner.compare(
+        {
+            'case': {'time': 1.3, 'peak_memory': 1200},
+            'new': {'time': 9.0, 'peak_memory': 9000}
+        },
+        Baselines
+    ) == [
+        ('case', 'time', 1.0, 1.3),
+        ('case', 'peak_memory', 1000, 1200)
+    ])
+
+
+######################################
+# Test Import Time:                  #
+######################################
+def test_self_timed_measure():
+    """ Benchmark Runner Self Timed Measure Test
+
+    This test will measure a self timed import case that reports its own
+    time and peak memory from fresh interpreters.
+
+    Expected Result:
+      One sample per repeat, and positive time and peak memory.
+    """
+    def setup():
+        yield _import_probe("import csv")
+
+    Case = runner.Benchmark('test.import', setup, repeat=2, self_timed=True)
+    Result = runner.measure(Case)
+    assert(Result['repeat'] == 2)
+    assert(Result['loops'] == 1)
+    assert(Result['time'] > 0)
+    assert(Result['peak_memory'] > 0)
+
+
+def test_lazy_package_imports():
+    """ GitUtils Lazy Package Import Test
+
+    This test will import the package and use GitConfigParser in a fresh
+    interpreter, then access GithubReports.
+
+    Expected Result:
+      PyGithub, jinja2 and progress are only imported once they are used,
+      and the lazily exported classes are listed by dir().
+    """
+    Modules = _run_probe(
+        "import sys, json\n"
+        "import cloudmage.gitutils as gitutils\n"
+        "from cloudmage.gitutils import GitConfigParser\n"
+        "Heavy = ('github', 'jinja2', 'progress')\n"
+        "Before = [_m_ for _m_ in Heavy if _m_ in sys.modules]\n"
+        "Exported = 'GithubReports' in dir(gitutils)\n"
+        "Reports = gitutils.GithubReports(auth_token='1234')\n"
+        "print(json.dumps([Before, Exported, type(Reports).__name__]))"
+    )
+    assert(Modules == [[], True, 'GithubReports'])
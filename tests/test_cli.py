@@ -0,0 +1,162 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_cli.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_cli.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils.cli import (
+    CommandSession, GitUtilsDaemon, run_command, main
+)
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+
+# Base Python Module Imports:
+import threading
+import pytest
+import json
+import os
+
+RepositoryUrl = "https://github.com/TheCloudMage/Mock-Repository.git"
+
+
+######################################
+# Define Fixtures:                   #
+######################################
+@pytest.fixture
+def repository(tmp_path):
+    """ Temporary repository with a .git/config PyTest Fixture """
+    os.mkdir(os.path.join(str(tmp_path), '.git'))
+    with open(os.path.join(str(tmp_path), '.git', 'config'), 'w') as f:
+        f.write(f'[remote "origin"]\n    url = {RepositoryUrl}\n')
+    return str(tmp_path)
+
+
+@pytest.fixture(scope='module')
+def stub_server():
+    """ GithubStubServer PyTest Fixture """
+    with GithubStubServer(pr_count=5, repo_count=1) as ThisServer:
+        yield ThisServer
+
+
+######################################
+# Test Commands:                     #
+######################################
+def test_repo_info(repository, capsys):
+    """ gitutils repo-info Command Test
+
+    This test will print the repository info of a git repository twice
+    through the same session, then after its config changed.
+
+    Expected Result:
+      The parsed url and provider, the config parsed again only after it
+      changed.
+    """
+    Session = CommandSession()
+    assert(run_command(['repo-info', '--json', repository], Session) == 0)
+    Info = json.loads(capsys.readouterr().out)
+    assert(Info['url'] == RepositoryUrl)
+    assert(Info['provider'] == 'github.com')
+
+    Cached = Session.configs[os.path.realpath(repository)]
+    run_command(['repo-info', repository], Session)
+    assert(Session.configs[os.path.realpath(repository)] is Cached)
+    assert(f"url:      {RepositoryUrl}" in capsys.readouterr().out)
+
+    ConfigPath = os.path.join(repository, '.git', 'config')
+    os.utime(ConfigPath, ns=(0, 0))
+    run_command(['repo-info', repository], Session)
+    assert(Session.configs[os.path.realpath(repository)] is not Cached)
+
+
+def test_open_prs(stub_server, tmp_path, capsys):
+    """ gitutils open-prs Command Test
+
+    This test will list the open pull requests of the stub organization,
+    then export them, and run without a token.
+
+    Expected Result:
+      One line per pull request on stdout, the exported file path, and an
+      error status without a token.
+    """
+    Env = {'GITHUB_TOKEN': '12345678910987654321'}
+    Args = [
+        'open-prs', 'StubOrg', '--org', '--request-interval', '0',
+        '--base-url', stub_server.base_url
+    ]
+    assert(run_command(Args, env=Env) == 0)
+    out, err = capsys.readouterr()
+    assert(len(out.splitlines()) == 5)
+    assert(out.startswith('repo-0#'))
+
+    assert(run_command(Args + ['--exclude-repo', 'repo-0'], env=Env) == 1)
+    assert(capsys.readouterr().out == '')
+
+    OutputPath = os.path.join(str(tmp_path), 'open.jsonl')
+    Args += ['--format', 'jsonl', '--output', OutputPath]
+    assert(run_command(Args, env=Env) == 0)
+    assert(capsys.readouterr().out.strip() == OutputPath)
+    with open(OutputPath) as f:
+        assert(len(f.readlines()) == 5)
+
+    assert(run_command(Args, env={}) == 2)
+    assert('GITHUB_TOKEN' in capsys.readouterr().err)
+
+
+######################################
+# Test Daemon:                       #
+######################################
+def test_daemon(stub_server, repository, tmp_path, monkeypatch, capsys):
+    """ gitutils Daemon Test
+
+    This test will start a daemon, run repo-info and open-prs through it
+    twice, query its status and stop it.
+
+    Expected Result:
+      Command output relayed from the daemon, the GithubReports object and
+      its Github connection reused by the second run, the request interval
+      of the earlier runs not applied to a run leaving it out, and the
+      socket removed on stop.
+    """
+    SocketPath = os.path.join(str(tmp_path), 'gitutils.sock')
+    Daemon = GitUtilsDaemon(SocketPath)
+    assert(oct(os.stat(SocketPath).st_mode & 0o777) == oct(0o600))
+    DaemonThread = threading.Thread(target=Daemon.serve, daemon=True)
+    DaemonThread.start()
+
+    monkeypatch.chdir(repository)
+    assert(main(['--socket', SocketPath, 'repo-info', '--json']) == 0)
+    assert(json.loads(capsys.readouterr().out)['url'] == RepositoryUrl)
+
+    monkeypatch.setenv('GITHUB_TOKEN', '12345678910987654321')
+    Args = [
+        '--socket', SocketPath, 'open-prs', 'StubOrg', '--org',
+        '--request-interval', '0', '--base-url', stub_server.base_url
+    ]
+    assert(main(Args) == 0)
+    Report = next(iter(Daemon.session.reports.values()))
+    Client = Report._github
+    assert(main(Args) == 0)
+    assert(len(Daemon.session.reports) == 1)
+    assert(Report._github is Client)
+    assert(len(capsys.readouterr().out.splitlines()) == 10)
+
+    # Options left out of a later command do not persist from the last.
+    assert(main(Args[:5] + Args[7:] + ['--exclude-repo', 'repo-0']) == 1)
+    assert(len(Daemon.session.reports) == 1)
+    assert(Report.request_interval is None)
+    capsys.readouterr()
+
+    assert(main(['--socket', SocketPath, 'daemon', 'status']) == 0)
+    assert('4 commands served' in capsys.readouterr().out)
+    with pytest.raises(OSError):
+        GitUtilsDaemon(SocketPath)
+
+    assert(main(['--socket', SocketPath, 'daemon', 'stop']) == 0)
+    DaemonThread.join(5)
+    assert(not os.path.exists(SocketPath))
+    assert(main(['--socket', SocketPath, 'daemon', 'status']) == 1)
@@ -0,0 +1,61 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_github_api.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_github_api.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Base Python Module Imports:
+import importlib.util
+import os
+
+# The archived GitHubAPI class is not part of the package, so it is loaded
+# from its source file.
+ArchiveSpec = importlib.util.spec_from_file_location(
+    'archive_github_api',
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        'archive',
+        'github_api.py'
+    )
+)
+ArchiveModule = importlib.util.module_from_spec(ArchiveSpec)
+ArchiveSpec.loader.exec_module(ArchiveModule)
+GitHubAPI = ArchiveModule.GitHubAPI
+
+
+######################################
+# Test GitHubAPI RepoOwner Interning:#
+######################################
+def test_repo_owner_interning():
+    """
+    This test will construct RepoOwner objects directly to ensure that owners
+    sharing an owner id are interned into a single shared instance, that the
+    shared instance is refreshed with the latest payload, that owners without
+    an id are never shared, and that the class uses __slots__ instead of a
+    per instance __dict__.
+    """
+    OwnerA = GitHubAPI.RepoOwner(
+        59182333, 'CloudMages', 'avatar_a', 'https://github.com/CloudMages'
+    )
+    OwnerB = GitHubAPI.RepoOwner(
+        59182333, 'CloudMages', 'avatar_b', 'https://github.com/CloudMages'
+    )
+    assert(OwnerA is OwnerB)
+    assert(OwnerA.avatar == 'avatar_b')
+    assert(not hasattr(OwnerA, '__dict__'))
+
+    OwnerC = GitHubAPI.RepoOwner(42, 'Other', None, None)
+    assert(OwnerC is not OwnerA)
+
+    OwnerD = GitHubAPI.RepoOwner(None, 'Anon', None, None)
+    OwnerE = GitHubAPI.RepoOwner(None, 'Anon', None, None)
+    assert(OwnerD is not OwnerE)
+
+    # Releasing every reference drops the owner from the intern table.
+    del OwnerA, OwnerB
+    assert(59182333 not in GitHubAPI.RepoOwner._instances)
@@ -0,0 +1,202 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_github_notifier.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_github_notifier.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubNotifier
+
+# Base Python Module Imports:
+from datetime import datetime, timedelta, timezone
+import threading
+import json
+import os
+
+
+######################################
+# Define Mock Pull Request Objects:  #
+######################################
+class MockComment(object):
+    """Mock PyGithub IssueComment Object"""
+
+    def __init__(self, body, created_at):
+        """Class Constructor"""
+        self.body = body
+        self.created_at = created_at
+
+
+class MockPullRequest(object):
+    """Mock PyGithub PullRequest Object"""
+
+    def __init__(self, number, comments=None):
+        """Class Constructor"""
+        self.html_url = f"https://github.com/CloudMaege/Mock/pull/{number}"
+        self.comments = comments if comments is not None else []
+        self.comment_reads = 0
+        self.lock = threading.Lock()
+
+    def get_issue_comments(self):
+        """Return the mock comments"""
+        with self.lock:
+            self.comment_reads += 1
+        return list(self.comments)
+
+    def create_issue_comment(self, body):
+        """Record a published comment"""
+        with self.lock:
+            self.comments.append(
+                MockComment(body, datetime.now(timezone.utc))
+            )
+
+
+######################################
+# Test Notifier Dispatch:            #
+######################################
+def test_dispatch_publishes_queued_comments():
+    """ GithubNotifier Class Dispatch Test
+
+    This test will queue notifications on several mock pull requests and
+    ensure that nothing is published until dispatch() is called, and that
+    dispatch() publishes each queued comment once.
+
+    Expected Result:
+      Each pull request receives exactly one comment after dispatch.
+    """
+    NotifierObj = GithubNotifier(writes_per_minute=6000, max_workers=4)
+    Pulls = [MockPullRequest(_n_) for _n_ in range(10)]
+
+    for _pull_ in Pulls:
+        NotifierObj.enqueue(_pull_, f"@user {_pull_.html_url} reminder")
+    assert(NotifierObj.pending == 10)
+    assert(all(len(_pull_.comments) == 0 for _pull_ in Pulls))
+
+    Summary = NotifierObj.dispatch()
+    assert(Summary == {'published': 10, 'skipped': 0, 'failed': 0})
+    assert(NotifierObj.pending == 0)
+    assert(all(len(_pull_.comments) == 1 for _pull_ in Pulls))
+
+
+def test_dispatch_skips_reminders_from_today():
+    """ GithubNotifier Class Duplicate Detection Test
+
+    This test will ensure that a pull request that already carries an
+    identical reminder published today is skipped, while an identical
+    reminder from a previous day does not prevent today's reminder.
+
+    Expected Result:
+      Only the pull request without a reminder from today gets a comment.
+    """
+    Message = "@user reminder"
+    Yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    PostedToday = MockPullRequest(
+        1, [MockComment(f"{Message}\n", datetime.now(timezone.utc))]
+    )
+    PostedYesterday = MockPullRequest(2, [MockComment(Message, Yesterday)])
+
+    NotifierObj = GithubNotifier(writes_per_minute=6000)
+    NotifierObj.enqueue(PostedToday, Message)
+    NotifierObj.enqueue(PostedYesterday, Message)
+    NotifierObj.enqueue(PostedYesterday, Message)
+    Summary = NotifierObj.dispatch()
+
+    assert(Summary == {'published': 1, 'skipped': 2, 'failed': 0})
+    assert(len(PostedToday.comments) == 1)
+    assert(len(PostedYesterday.comments) == 2)
+
+    # A second run reuses the cached hashes instead of re-reading comments.
+    NotifierObj.enqueue(PostedYesterday, Message)
+    Summary = NotifierObj.dispatch()
+    assert(Summary == {'published': 0, 'skipped': 1, 'failed': 0})
+    assert(PostedYesterday.comment_reads == 1)
+    assert(NotifierObj.stats['cache_misses'] == 2)
+    assert(NotifierObj.stats['cache_hits'] == 1)
+
+
+def test_dispatch_cache_file(tmp_path):
+    """ GithubNotifier Class Cache File Test
+
+    This test will ensure that the comment hash cache is persisted to the
+    provided cache file, and that a new notifier loading the cache skips
+    the reminder without reading the pull request comments.
+
+    Expected Result:
+      The second notifier skips the reminder with zero comment reads.
+    """
+    CachePath = os.path.join(str(tmp_path), 'comment_cache.json')
+    Message = "@user reminder"
+
+    FirstNotifier = GithubNotifier(
+        writes_per_minute=6000,
+        cache_path=CachePath
+    )
+    FirstNotifier.enqueue(MockPullRequest(1), Message)
+    assert(FirstNotifier.dispatch()['published'] == 1)
+    assert(os.path.exists(CachePath))
+    with open(CachePath) as f:
+        CacheData = json.load(f)
+    assert(
+        CacheData['date'] == datetime.now(timezone.utc).date().isoformat()
+    )
+
+    Pull = MockPullRequest(1)
+    SecondNotifier = GithubNotifier(
+        writes_per_minute=6000,
+        cache_path=CachePath
+    )
+    SecondNotifier.enqueue(Pull, Message)
+    assert(SecondNotifier.dispatch()['skipped'] == 1)
+    assert(Pull.comment_reads == 0)
+    assert(len(Pull.comments) == 0)
+
+
+def test_dispatch_failed_write(capsys):
+    """ GithubNotifier Class Failed Write Test
+
+    This test will ensure that a failing comment write is counted and
+    logged without aborting the remaining writes.
+
+    Expected Result:
+      One failed and one published write, exception logged to stderr.
+    """
+    class BrokenPullRequest(MockPullRequest):
+        """Mock Pull Request that fails to publish"""
+
+        def create_issue_comment(self, body):
+            """Raise on publish"""
+            raise Exception("403 Forbidden")
+
+    NotifierObj = GithubNotifier(writes_per_minute=6000)
+    NotifierObj.enqueue(BrokenPullRequest(1), "@user reminder")
+    NotifierObj.enqueue(MockPullRequest(2), "@user reminder")
+    Summary = NotifierObj.dispatch()
+    assert(Summary == {'published': 1, 'skipped': 0, 'failed': 1})
+
+    out, err = capsys.readouterr()
+    assert "EXCEPTION occurred in" in err
+    assert "403 Forbidden" in err
+
+
+def test_dispatch_throttle():
+    """ GithubNotifier Class Throttle Test
+
+    This test will ensure that comment writes are spaced according to the
+    configured writes per minute, even when dispatched concurrently.
+
+    Expected Result:
+      Four writes at 600 writes per minute take at least 0.3 seconds.
+    """
+    NotifierObj = GithubNotifier(writes_per_minute=600, max_workers=4)
+    for _n_ in range(4):
+        NotifierObj.enqueue(MockPullRequest(_n_), "@user reminder")
+
+    Start = datetime.now()
+    assert(NotifierObj.dispatch()['published'] == 4)
+    assert((datetime.now() - Start).total_seconds() >= 0.3)
+    assert(NotifierObj.stats['throttle_waits'] == 3)
+    assert(NotifierObj.stats['throttle_seconds'] >= 0.3)
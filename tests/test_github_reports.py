@@ -1163,3 +1163,135 @@ def test_search_open_pulls(capsys):
         "of the returned search results were verified "
         "as open pull requests" in out
     )
+
+
+########################################
+# Test Notification Plan:              #
+########################################
+def test_notification_plan(capsys):
+    """ GithubReports Class 'notification_plan' Method Test
+
+    This test will test the 'notification_plan' method. The method is
+    designed to return the notifications that a search_open_pulls run with
+    notify enabled would publish, without making any Github calls.
+
+    This test will plan notifications for a set of cached search results,
+    where one pull request exceeds the open_pr_threshold, one does not, and
+    one already received an identical reminder today.
+
+    Expected Result:
+        Two exceeding targets, one pending, one already published.
+        Calling the method without results logs an error.
+    """
+    GitHubReportObj = GithubReports()
+    assert(GitHubReportObj.notification_plan() is None)
+    out, err = capsys.readouterr()
+    assert "No search results available to plan notifications" in err
+
+    def pr_data(number, age_days):
+        """Construct a cached search result entry"""
+        return {
+            'id': number,
+            'repository': 'Mock',
+            'number': number,
+            'submitter': 'octocat',
+            'link': f"https://github.com/CloudMaege/Mock/pull/{number}",
+            'age_days': age_days,
+            'mentions': ['@octocat', '@bobby']
+        }
+
+    GitHubReportObj._search_results = [
+        pr_data(1, 10),
+        pr_data(2, 1),
+        pr_data(3, 30)
+    ]
+
+    # Record an identical reminder from today for PR 3 in the notifier cache.
+    PublishedLink = GitHubReportObj._search_results[2]['link']
+    PublishedMsg = GitHubReportObj._notification_message(
+        ['@octocat', '@bobby'],
+        PublishedLink
+    )
+    GitHubReportObj.notifier._comment_hashes[PublishedLink] = {
+        GitHubReportObj.notifier.comment_hash(PublishedMsg)
+    }
+
+    Plan = GitHubReportObj.notification_plan()
+    assert([_t_['number'] for _t_ in Plan] == [1, 3])
+    assert([_t_['pending'] for _t_ in Plan] == [True, False])
+    assert(Plan[0]['mentions'] == ['@octocat', '@bobby'])
+    assert(
+        Plan[0]['message'].startswith(
+            "@octocat @bobby https://github.com/CloudMaege/Mock/pull/1 "
+            "has been open for 5 days or longer."
+        )
+    )
+
+    # Explicitly passed results take precedence over the cached results.
+    Plan = GitHubReportObj.notification_plan(
+        search_results=[pr_data(4, 6)]
+    )
+    assert([_t_['number'] for _t_ in Plan] == [4])
+
+
+########################################
+# Test Report Writer:                  #
+########################################
+def test_write(capsys):
+    """ GithubReports Class 'write' Method Test
+
+    This test will test the 'write' method. The method is designed to
+    stream the collected open pull request data through the packaged
+    HTML report template into a report file.
+
+    This test will write a report from a generator of pull request data,
+    to ensure that the results never need to be materialized, and then
+    write a second report to ensure the compiled template is reused.
+
+    Expected Result:
+        Report file written with every pull request and the total count.
+        Calling the method without results logs an error.
+    """
+    GitHubReportObj = GithubReports()
+    GitHubReportObj.repo_namespace = "CloudMaege"
+    assert(GitHubReportObj.write(path=TestPath) is None)
+    out, err = capsys.readouterr()
+    assert "No search results available to write a report" in err
+
+    def pr_data():
+        """Yield mock search result entries"""
+        for _number_ in range(1, 4):
+            yield {
+                'repository_url': 'https://github.com/CloudMaege/Mock',
+                'link': f"https://github.com/CloudMaege/Mock/pull/{_number_}",
+                'title': f"Mock PR {_number_}",
+                'submitter': 'octocat',
+                'reviewers': ['bobby: APPROVED'],
+                'created': '2020-04-09 00:29:56',
+                'age_days': _number_ * 3,
+                'review_count': 1,
+                'days_open_threshold': 5
+            }
+
+    Report = GitHubReportObj.write(path=TestPath, search_results=pr_data())
+    assert(Report == os.path.join(TestPath, 'OpenPRs.html'))
+    with open(Report) as f:
+        ReportHtml = f.read()
+    assert("Github Cloudmaege Open Pull Request Report" in ReportHtml)
+    assert("Mock PR 3" in ReportHtml)
+    assert("Total Open PRs: 3" in ReportHtml)
+
+    CachedTemplate = GitHubReportObj._load_template(
+        'Github_Open_PR_Report.j2'
+    )
+    GitHubReportObj.write(
+        path=TestPath,
+        search_results=[],
+        output_file='Empty.html'
+    )
+    assert(
+        GitHubReportObj._load_template('Github_Open_PR_Report.j2') is
+        CachedTemplate
+    )
+    with open(os.path.join(TestPath, 'Empty.html')) as f:
+        assert("Total Open PRs: 0" in f.read())
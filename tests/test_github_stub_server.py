@@ -0,0 +1,549 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_github_stub_server.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_github_stub_server.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports, GithubNotifier
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+from cloudmage.gitutils.report_progress import TerminalProgress
+import requests
+
+# Base Python Module Imports:
+import pytest
+import time
+
+
+######################################
+# Define Stub Server Fixture:        #
+######################################
+@pytest.fixture(scope='module')
+def stub_server():
+    """ GithubStubServer PyTest Fixture
+
+    Serve a small synthetic organization and user namespace for the
+    duration of the test module.
+    """
+    with GithubStubServer(
+        orgs=('StubOrg',),
+        users=('stubuser',),
+        repo_count=3,
+        pr_count=45,
+        review_count=2,
+        reviewer_count=2
+    ) as ThisServer:
+        yield ThisServer
+
+
+######################################
+# Test REST Endpoints:               #
+######################################
+def test_search_pagination(stub_server):
+    """ GithubStubServer Search Pagination Test
+
+    This test will page through the open pull request search results of
+    the synthetic organization.
+
+    Expected Result:
+      total_count matches the generated pull requests, Link headers page
+      through every result, and rate limit headers are returned.
+    """
+    Url = f"{stub_server.base_url}/search/issues"
+    Response = requests.get(Url, params={
+        'q': 'is:unmerged org:StubOrg state:open type:pr',
+        'per_page': 20
+    })
+    assert(Response.status_code == 200)
+    assert(Response.json()['total_count'] == 45)
+    assert(Response.headers['X-RateLimit-Resource'] == 'search')
+    assert(Response.headers['X-RateLimit-Limit'] == '30')
+
+    Items = Response.json()['items']
+    while 'next' in Response.links:
+        Response = requests.get(Response.links['next']['url'])
+        Items += Response.json()['items']
+    assert(len(Items) == 45)
+    assert(len({_item_['id'] for _item_ in Items}) == 45)
+    assert(all(_i_['repository_url'].startswith(stub_server.base_url)
+               for _i_ in Items))
+
+
+def test_search_qualifiers(stub_server):
+    """ GithubStubServer Search Qualifier Test
+
+    This test will filter the search with repository and created date
+    qualifiers, and sort the results by creation date.
+
+    Expected Result:
+      Only matching pull requests are returned, oldest first.
+    """
+    Url = f"{stub_server.base_url}/search/issues"
+    Response = requests.get(Url, params={
+        'q': 'org:StubOrg repo:StubOrg/repo-1 type:pr',
+        'sort': 'created',
+        'order': 'asc',
+        'per_page': 100
+    })
+    Items = Response.json()['items']
+    assert(len(Items) == 15)
+    Created = [_item_['created_at'] for _item_ in Items]
+    assert(Created == sorted(Created))
+
+    Threshold = Created[5][:19]
+    Response = requests.get(Url, params={
+        'q': f"org:StubOrg repo:StubOrg/repo-1 created:<{Threshold}"
+    })
+    assert(Response.json()['total_count'] == 5)
+
+    Response = requests.get(Url, params={'q': 'user:stubuser is:merged'})
+    assert(Response.json()['total_count'] == 0)
+
+
+def test_pull_endpoints(stub_server):
+    """ GithubStubServer Pull Request Endpoint Test
+
+    This test will fetch and list pull requests, fetch the requested
+    reviewers and reviews of a pull request, and post a comment to it.
+
+    Expected Result:
+      Payloads match the synthetic record, listings leave the merge fields
+      out, and the comment is listed.
+    """
+    Pull = stub_server.pull_requests('StubOrg')[0]
+    Base = f"{stub_server.base_url}/repos/{Pull['repo']}"
+
+    Response = requests.get(f"{Base}/pulls/{Pull['number']}")
+    assert(Response.status_code == 200)
+    assert(Response.json()['title'] == Pull['title'])
+    assert(Response.json()['merged'] is False)
+    assert('mergeable_state' in Response.json())
+    assert(Response.headers['X-RateLimit-Resource'] == 'core')
+
+    # Listings hold the pull-request-simple payload, without the merge
+    # fields of the full pull request.
+    Response = requests.get(f"{Base}/pulls", params={'state': 'open'})
+    assert(Response.json()[0]['merged_at'] is None)
+    assert(not any(
+        _field_ in _pull_
+        for _pull_ in Response.json()
+        for _field_ in ('merged', 'merged_by', 'mergeable', 'mergeable_state')
+    ))
+
+    Response = requests.get(
+        f"{Base}/pulls/{Pull['number']}/requested_reviewers"
+    )
+    assert(
+        [_u_['login'] for _u_ in Response.json()['users']] ==
+        Pull['requested_users']
+    )
+
+    Response = requests.get(f"{Base}/pulls/{Pull['number']}/reviews")
+    assert(len(Response.json()) == 2)
+
+    Response = requests.post(
+        f"{Base}/issues/{Pull['number']}/comments",
+        json={'body': 'Reminder'}
+    )
+    assert(Response.status_code == 201)
+    Response = requests.get(f"{Base}/issues/{Pull['number']}/comments")
+    assert(Response.json()[-1]['body'] == 'Reminder')
+
+    Response = requests.get(f"{Base}/pulls/9999")
+    assert(Response.status_code == 404)
+
+
+def test_search_result_cap():
+    """ GithubStubServer Search Result Cap Test
+
+    This test will request a search page beyond the first 1000 results.
+
+    Expected Result:
+      The full total_count is reported, but pages past 1000 results fail.
+    """
+    with GithubStubServer(pr_count=1100, review_count=0) as ThisServer:
+        Url = f"{ThisServer.base_url}/search/issues"
+        Response = requests.get(
+            Url, params={'q': 'org:StubOrg', 'per_page': 100, 'page': 10}
+        )
+        assert(Response.json()['total_count'] == 1100)
+        assert('next' not in Response.links)
+        Response = requests.get(
+            Url, params={'q': 'org:StubOrg', 'per_page': 100, 'page': 11}
+        )
+        assert(Response.status_code == 422)
+
+
+def test_rate_limit_and_latency():
+    """ GithubStubServer Rate Limit and Latency Test
+
+    This test will exhaust an enforced search rate limit, and measure the
+    injected request latency.
+
+    Expected Result:
+      Requests past the limit are rejected with a 403, and each request
+      takes at least the injected latency.
+    """
+    with GithubStubServer(
+        pr_count=1,
+        search_rate_limit=2,
+        enforce_rate_limit=True,
+        latency=0.05
+    ) as ThisServer:
+        Url = f"{ThisServer.base_url}/search/issues"
+        Start = time.monotonic()
+        Statuses = [
+            requests.get(Url, params={'q': 'org:StubOrg'}).status_code
+            for _n_ in range(3)
+        ]
+        assert((time.monotonic() - Start) >= 0.15)
+        assert(Statuses == [200, 200, 403])
+        assert(ThisServer.stats['rate_limited'] == 1)
+
+        Limits = requests.get(f"{ThisServer.base_url}/rate_limit").json()
+        assert(Limits['resources']['search']['remaining'] == 0)
+
+
+######################################
+# Test GraphQL Subset:               #
+######################################
+def test_graphql_search(stub_server):
+    """ GithubStubServer GraphQL Search Test
+
+    This test will page through a GraphQL pull request search.
+
+    Expected Result:
+      Every pull request node is returned with reviews and reviewers.
+    """
+    Query = """
+    query OpenPulls($query: String!, $first: Int!, $after: String) {
+      rateLimit { remaining }
+      search(query: $query, type: ISSUE, first: $first, after: $after) {
+        issueCount
+        pageInfo { hasNextPage endCursor }
+        nodes { ... on PullRequest { number } }
+      }
+    }
+    """
+    Variables = {'query': 'org:StubOrg is:pr is:open', 'first': 20}
+    Nodes = []
+    while True:
+        Response = requests.post(
+            f"{stub_server.base_url}/graphql",
+            json={'query': Query, 'variables': Variables}
+        )
+        assert(Response.headers['X-RateLimit-Resource'] == 'graphql')
+        Data = Response.json()['data']
+        assert(Data['search']['issueCount'] == 45)
+        assert('remaining' in Data['rateLimit'])
+        Nodes += Data['search']['nodes']
+        if not Data['search']['pageInfo']['hasNextPage']:
+            break
+        Variables['after'] = Data['search']['pageInfo']['endCursor']
+
+    assert(len(Nodes) == 45)
+    assert(Nodes[0]['reviews']['totalCount'] == 2)
+    assert(Nodes[0]['reviewRequests']['totalCount'] == 3)
+
+
+######################################
+# Test GithubReports Against Stub:   #
+######################################
+def test_search_open_pulls_stub(capsys):
+    """ GithubReports Class 'search_open_pulls' Stub Server Test
+
+    This test will run the open pull request report against a synthetic
+    organization with notifications enabled, twice.
+
+    Expected Result:
+      Every pull request is collected, reminders are published on the first
+      run only, and the second run skips them as already published today.
+    """
+    with GithubStubServer(pr_count=12, repo_count=2) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.notify = True
+        GitHubReportObj.notifier = GithubNotifier(writes_per_minute=60000)
+        GitHubReportObj.progress = TerminalProgress()
+
+        Results = GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+        assert(len(Results) == 12)
+        Exceeded = [
+            _pr_ for _pr_ in Results
+            if _pr_['age_days'] > _pr_['days_open_threshold']
+        ]
+        Writes = 'POST /repos/{repo}/issues/{number}/comments'
+        assert(ThisServer.stats['endpoints'][Writes] == len(Exceeded))
+
+        GitHubReportObj.search_open_pulls()
+        assert(ThisServer.stats['endpoints'][Writes] == len(Exceeded))
+
+        out, err = capsys.readouterr()
+        assert(
+            f"0 notification comments published, {len(Exceeded)} skipped"
+            in out
+        )
+
+
+def test_search_open_pulls_lean():
+    """ GithubReports Class 'lean_hydration' Property Test
+
+    This test will search the stub server with full hydration, and with
+    lean hydration with and without the mergeability fields, enumerate it
+    with lean GraphQL search, then publish reminders from a lean run.
+
+    Expected Result:
+      The same records from every run apart from the skipped mergeability
+      fields, no pull request or repository fetched without them, and
+      reminders published on the lean pull requests.
+    """
+    def records(results):
+        return sorted(
+            sorted((_k_, str(_v_)) for _k_, _v_ in _pr_.items()
+                   if _k_ != 'age')
+            for _pr_ in results
+        )
+
+    with GithubStubServer(pr_count=12, repo_count=2) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.repo_namespace = "StubOrg"
+        GitHubReportObj.enumeration = 'search'
+        Full = GitHubReportObj.search_open_pulls()
+        FullRequests = GitHubReportObj.stats.as_dict()['requests']
+
+        GitHubReportObj.lean_hydration = True
+        Lean = GitHubReportObj.search_open_pulls()
+        assert(records(Lean) == records(Full))
+        assert(GitHubReportObj.stats.as_dict()['requests'] <= FullRequests)
+
+        GitHubReportObj.mergeability = False
+        Leaner = GitHubReportObj.search_open_pulls()
+        Stats = GitHubReportObj.stats.as_dict()
+        assert(Stats['requests'] < FullRequests)
+        assert('GET /repos/{repo}/pulls/{number}' not in Stats['endpoints'])
+        assert('GET /repos/{repo}' not in Stats['endpoints'])
+        assert(all(
+            _pr_['mergable'] is None and _pr_['merge_state'] is None
+            for _pr_ in Leaner
+        ))
+        for _pr_ in Full:
+            _pr_.update(mergable=None, merge_state=None)
+        assert(records(Leaner) == records(Full))
+
+        # GraphQL search nodes hold the fields of lean records as well.
+        GitHubReportObj.enumeration = 'graphql'
+        for _raw_ in (False, True):
+            GitHubReportObj.raw_transport = _raw_
+            Graphql = GitHubReportObj.search_open_pulls()
+            Stats = GitHubReportObj.stats.as_dict()
+            assert(records(Graphql) == records(Full))
+            assert(
+                'GET /repos/{repo}/pulls/{number}' not in Stats['endpoints']
+            )
+            assert('GET /repos/{repo}' not in Stats['endpoints'])
+        GitHubReportObj.raw_transport = False
+        GitHubReportObj.enumeration = 'search'
+
+        GitHubReportObj.notify = True
+        GitHubReportObj.notifier = GithubNotifier(writes_per_minute=60000)
+        GitHubReportObj.search_open_pulls()
+        Writes = 'POST /repos/{repo}/issues/{number}/comments'
+        assert(ThisServer.stats['endpoints'][Writes] == len([
+            _pr_ for _pr_ in Full
+            if _pr_['age_days'] > _pr_['days_open_threshold']
+        ]))
+
+
+def test_search_open_pulls_mergeability():
+    """ GithubReports Class Deferred Mergeability Test
+
+    This test will search a stub server that takes a moment to compute the
+    mergeability of pull requests, with lean hydration, and then a stub
+    server that never computes it.
+
+    Expected Result:
+      Pending mergeability polled in batches after the scan until every
+      record is filled in, and records left as None and counted once the
+      polls are exhausted.
+    """
+    with GithubStubServer(
+        pr_count=15, repo_count=2, merge_delay=0.2
+    ) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.enumeration = 'search'
+        GitHubReportObj.lean_hydration = True
+        GitHubReportObj.mergeability_batch = 4
+        GitHubReportObj.mergeability_polls = 10
+        GitHubReportObj.mergeability_poll_interval = 0.1
+        Results = GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+        Stats = GitHubReportObj.stats.as_dict()
+
+    assert(len(Results) == 15)
+    assert(all(_pr_['mergable'] is not None for _pr_ in Results))
+    assert(all(_pr_['merge_state'] != 'unknown' for _pr_ in Results))
+    assert(Stats['stages']['poll_mergeability']['requests'] > 15)
+    assert(Stats['counters']['mergeability_polled'] > 15)
+    assert('get_pull' not in Stats['stages'])
+
+    with GithubStubServer(
+        pr_count=15, repo_count=2, merge_delay=None
+    ) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.enumeration = 'search'
+        GitHubReportObj.mergeability_polls = 2
+        GitHubReportObj.mergeability_poll_interval = 0
+        Results = GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+        Stats = GitHubReportObj.stats.as_dict()
+
+    Pending = [_pr_ for _pr_ in Results if _pr_['mergable'] is None]
+    assert(0 < len(Pending) < 15)
+    assert(Stats['counters']['mergeability_polled'] == 2 * len(Pending))
+    assert(Stats['counters']['mergeability_unknown'] == len(Pending))
+
+
+def test_search_open_pulls_staleness(capsys):
+    """ GithubReports Class 'staleness' Property Test
+
+    This test will search the stub server measuring ages from creation and
+    from the last activity, with search and GraphQL enumeration, only
+    reporting stale pull requests, and set an invalid staleness mode.
+
+    Expected Result:
+      Ages measured from the latest commit, comment or review, fetched
+      with a single GraphQL request instead of a request per pull request,
+      fewer stale pull requests by activity than by creation, and an
+      error logged for the invalid mode.
+    """
+    def requests(report):
+        return report.stats.as_dict()['requests']
+
+    with GithubStubServer(
+        pr_count=30, repo_count=2, comment_count=2, max_age_days=20
+    ) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.repo_namespace = "StubOrg"
+        GitHubReportObj.enumeration = 'search'
+        GitHubReportObj.mergeability = False
+        Created = GitHubReportObj.search_open_pulls()
+        CreatedRequests = requests(GitHubReportObj)
+
+        GitHubReportObj.staleness = 'activity'
+        Active = GitHubReportObj.search_open_pulls()
+        Stats = GitHubReportObj.stats.as_dict()
+        assert(Stats['endpoints']['POST /graphql']['requests'] == 1)
+        assert(requests(GitHubReportObj) == CreatedRequests + 1)
+
+        GitHubReportObj.enumeration = 'graphql'
+        Graphql = GitHubReportObj.search_open_pulls()
+        assert('graphql_index' not in GitHubReportObj.stats.as_dict()[
+            'stages'
+        ])
+
+        GitHubReportObj.enumeration = 'search'
+        GitHubReportObj.stale_only = True
+        Stale = GitHubReportObj.search_open_pulls()
+        GitHubReportObj.staleness = 'created'
+        StaleCreated = GitHubReportObj.search_open_pulls()
+
+    assert('last_activity' not in Created[0])
+    for _pr_ in Active:
+        this_pull = ThisServer._find_pull(
+            f"StubOrg/{_pr_['repository']}", _pr_['number']
+        )
+        assert(_pr_['last_activity'] == ThisServer._updated_at(this_pull))
+        assert(_pr_['last_activity'] >= _pr_['created'])
+    assert(len({
+        _pr_['last_activity'] + _pr_['age'] for _pr_ in Active
+    }) == 1)
+    assert(
+        sorted((_pr_['id'], _pr_['last_activity']) for _pr_ in Active) ==
+        sorted((_pr_['id'], _pr_['last_activity']) for _pr_ in Graphql)
+    )
+    assert(all(
+        _pr_['age_days'] > _pr_['days_open_threshold'] for _pr_ in Stale
+    ))
+    assert(
+        {_pr_['id'] for _pr_ in Stale} <=
+        {_pr_['id'] for _pr_ in StaleCreated}
+    )
+    assert(len(Stale) < len(StaleCreated))
+
+    GitHubReportObj.staleness = 'updated'
+    assert(GitHubReportObj.staleness == 'created')
+    out, err = capsys.readouterr()
+    assert("staleness property argument expected one of" in err)
+
+
+def test_search_open_pulls_staleness_reminders():
+    """ GithubReports Class Activity Staleness Reminder Test
+
+    This test will publish reminders on the pull requests of the stub
+    server that are stale by activity, and search it again with every
+    enumeration strategy.
+
+    Expected Result:
+      Reminders published on the stale pull requests, which are still
+      stale with the same last activity once they carry the reminders.
+    """
+    def stale(results):
+        return sorted(
+            (_pr_['id'], _pr_['last_activity']) for _pr_ in results
+            if _pr_['age_days'] > _pr_['days_open_threshold']
+        )
+
+    with GithubStubServer(
+        pr_count=30, repo_count=2, comment_count=2, max_age_days=20
+    ) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.repo_namespace = "StubOrg"
+        GitHubReportObj.enumeration = 'search'
+        GitHubReportObj.mergeability = False
+        GitHubReportObj.staleness = 'activity'
+        GitHubReportObj.open_pr_threshold = 5
+        GitHubReportObj.notify = True
+        GitHubReportObj.notifier = GithubNotifier(writes_per_minute=60000)
+        Stale = stale(GitHubReportObj.search_open_pulls())
+        Reminded = [
+            _pull_ for _pull_ in ThisServer._pull_list
+            if _pull_['comments'][-1]['user'] == 'stub-bot'
+        ]
+        assert(0 < len(Stale) == len(Reminded) < 30)
+
+        GitHubReportObj.notify = False
+        for _strategy_ in ('search', 'list', 'graphql'):
+            GitHubReportObj.enumeration = _strategy_
+            assert(stale(GitHubReportObj.search_open_pulls()) == Stale)
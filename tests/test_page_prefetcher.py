@@ -0,0 +1,194 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_page_prefetcher.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_page_prefetcher.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports, ReportStats
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+from cloudmage.gitutils.page_prefetcher import PagePrefetcher
+
+# Base Python Module Imports:
+import threading
+import pytest
+import time
+
+
+def prefetcher_threads():
+    """ Return the running prefetcher threads """
+    return [
+        _thread_ for _thread_ in threading.enumerate()
+        if _thread_.name == 'gitutils-page-prefetcher'
+    ]
+
+
+######################################
+# Test Page Prefetching:             #
+######################################
+def test_prefetch_read_ahead():
+    """ PagePrefetcher Read Ahead Test
+
+    This test will iterate 30 items in pages of 5 with a read ahead of one
+    page, pausing while the first item is processed, and then iterate them
+    without read ahead.
+
+    Expected Result:
+      The items in order, the next page fetched while the first is being
+      processed, never more than the page being processed and one more
+      page fetched ahead, and no thread without read ahead.
+    """
+    Produced = []
+
+    def pages():
+        for _n_ in range(30):
+            Produced.append(_n_)
+            yield _n_
+
+    Consumed = []
+    for _item_ in PagePrefetcher(pages(), read_ahead=1, page_size=5):
+        if not Consumed:
+            time.sleep(0.3)
+            assert(len(Produced) > 5)
+        assert(len(Produced) <= len(Consumed) + 2 * 5 + 2)
+        Consumed.append(_item_)
+    assert(Consumed == list(range(30)))
+
+    Produced.clear()
+    assert(list(PagePrefetcher(pages(), read_ahead=0)) == list(range(30)))
+    assert(prefetcher_threads() == [])
+
+
+def test_prefetch_errors_and_close():
+    """ PagePrefetcher Error and Early Close Test
+
+    This test will iterate results that fail part way, and close an
+    iteration of long results after a few items.
+
+    Expected Result:
+      The items before the failure, the failure raised by the iteration,
+      and the prefetching thread stopped once the iteration is closed.
+    """
+    def failing():
+        yield 1
+        yield 2
+        raise RuntimeError("page request failed")
+
+    Items = []
+    with pytest.raises(RuntimeError):
+        for _item_ in PagePrefetcher(failing(), page_size=1):
+            Items.append(_item_)
+    assert(Items == [1, 2])
+
+    Iteration = iter(PagePrefetcher(iter(range(10000)), page_size=2))
+    assert([next(Iteration) for _ in range(3)] == [0, 1, 2])
+    Iteration.close()
+    time.sleep(PagePrefetcher.poll_interval * 3)
+    assert(prefetcher_threads() == [])
+
+
+def test_prefetch_stage_attribution():
+    """ PagePrefetcher Stage Attribution Test
+
+    This test will record requests from a prefetching thread attributed to
+    the search stage while the main thread is timing another stage.
+
+    Expected Result:
+      The page requests attributed to the search stage, and the requests
+      of the main thread to its own stage.
+    """
+    StatsObj = ReportStats()
+    StatsObj.start()
+
+    def pages():
+        for _n_ in range(3):
+            StatsObj.request('GET', f'/search/issues?page={_n_}', 200, 10)
+            yield _n_
+
+    with StatsObj.stage('get_reviews'):
+        for _item_ in PagePrefetcher(
+            pages(), page_size=1, stats=StatsObj, stage='search_issues'
+        ):
+            StatsObj.request('GET', '/repos/o/r/pulls/1/reviews', 200, 10)
+    Stages = StatsObj.as_dict()['stages']
+    assert(Stages['search_issues']['requests'] == 3)
+    assert(Stages['get_reviews']['requests'] == 3)
+
+
+def test_search_open_pulls_prefetched():
+    """ GithubReports Class 'page_read_ahead' Test
+
+    This test will collect 250 pull requests of the stub server in three
+    pages, with the search API and with listings, reading one page ahead.
+
+    Expected Result:
+      The same pull requests from both strategies, and every page request
+      attributed to the enumeration stage.
+    """
+    Collected = []
+    with GithubStubServer(pr_count=250, repo_count=1) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.repo_namespace = "StubOrg"
+        GitHubReportObj.lean_hydration = True
+        GitHubReportObj.mergeability = False
+        GitHubReportObj.page_read_ahead = 1
+        for _strategy_, _stage_, _pages_ in (
+            ('search', 'search_issues', 3),
+            ('list', 'list_pulls', 4)
+        ):
+            GitHubReportObj.enumeration = _strategy_
+            Collected.append(sorted(
+                _pr_['id'] for _pr_ in GitHubReportObj.search_open_pulls()
+            ))
+            Stages = GitHubReportObj.stats.as_dict()['stages']
+            assert(Stages[_stage_]['requests'] == _pages_)
+            assert('unstaged' not in Stages)
+
+    assert(len(Collected[0]) == 250)
+    assert(Collected[0] == Collected[1])
+
+
+def test_cached_repository_threads():
+    """ GithubReports Repository Cache Thread Safety Test
+
+    This test will resolve a repository from several threads at once, as
+    a page prefetching thread and the main thread do, with a slow
+    repository factory.
+
+    Expected Result:
+      The repository built once and handed to every thread, with a
+      single cache miss recorded.
+    """
+    GitHubReportObj = GithubReports(auth_token="12345678910987654321")
+    Built = []
+    Resolved = []
+
+    def factory():
+        time.sleep(0.05)
+        Built.append(object())
+        return Built[-1]
+
+    def resolve():
+        Resolved.append(
+            GitHubReportObj._cached_repository('StubOrg/Repo-0', factory)
+        )
+
+    Threads = [threading.Thread(target=resolve) for _n_ in range(4)]
+    for _thread_ in Threads:
+        _thread_.start()
+    for _thread_ in Threads:
+        _thread_.join()
+    assert(len(Built) == 1)
+    assert(all(_repo_ is Built[0] for _repo_ in Resolved))
+    Caches = GitHubReportObj.stats.as_dict()['caches']
+    assert(Caches['repositories'] == {'hits': 3, 'misses': 1})
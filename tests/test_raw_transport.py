@@ -0,0 +1,155 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_raw_transport.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_raw_transport.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports, GithubNotifier
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+from cloudmage.gitutils.raw_transport import RawPull, RawTransport
+from github import Github
+
+# Base Python Module Imports:
+from datetime import datetime
+
+
+######################################
+# Test Raw Records:                  #
+######################################
+def test_raw_transport_pages():
+    """ RawTransport Class Search and Listing Test
+
+    This test will search and list the pull requests of a stub repository
+    holding more than a page of them through the raw transport.
+
+    Expected Result:
+      The total_count read from a single result probe, every page followed
+      through its Link header, and records holding the fields of the
+      PyGithub objects.
+    """
+    with GithubStubServer(pr_count=150, repo_count=1) as ThisServer:
+        ThisGithub = Github(
+            "12345678910987654321",
+            base_url=ThisServer.base_url,
+            seconds_between_requests=0
+        )
+        ThisTransport = RawTransport(ThisGithub.requester)
+        Query = 'is:pr is:open org:StubOrg'
+        assert(ThisTransport.search_issues(Query).totalCount == 150)
+        Results = ThisTransport.search_issues(Query)
+        assert(isinstance(Results[0], RawPull))
+        assert(Results.totalCount == 150)
+        Issues = list(Results)
+        assert(len({_issue_.id for _issue_ in Issues}) == 150)
+
+        Repository = ThisTransport.get_repo('StubOrg/repo-0')
+        Listed = list(Repository.get_pulls(state='open'))
+        assert(len(Listed) == 150)
+
+        Expected = ThisGithub.get_repo('StubOrg/repo-0').get_pull(
+            Listed[0].number
+        )
+        Pull = Repository.get_pull(Listed[0].number)
+        for _field_ in (
+            'id', 'number', 'title', 'html_url', 'state', 'created_at',
+            'updated_at', 'merged', 'merged_at', 'mergeable_state'
+        ):
+            assert(getattr(Pull, _field_) == getattr(Expected, _field_))
+        assert(Pull.user.login == Expected.user.login)
+        assert(isinstance(Pull.created_at, datetime))
+        assert(Pull.created_at.tzinfo is not None)
+        Users, Teams = Pull.get_review_requests()
+        ExpectedUsers, ExpectedTeams = Expected.get_review_requests()
+        assert(
+            [_u_.login for _u_ in Users] ==
+            [_u_.login for _u_ in ExpectedUsers]
+        )
+        assert(
+            [_t_.slug for _t_ in Teams] == [_t_.slug for _t_ in ExpectedTeams]
+        )
+        assert(
+            [(_r_.user.login, _r_.state) for _r_ in Pull.get_reviews()] ==
+            [
+                (_r_.user.login, _r_.state)
+                for _r_ in Expected.get_reviews()
+            ]
+        )
+
+
+######################################
+# Test GithubReports Raw Transport:  #
+######################################
+def test_search_open_pulls_raw_transport(capsys):
+    """ GithubReports Class 'raw_transport' Property Test
+
+    This test will collect the open pull requests of the stub server with
+    and without the raw transport, with every enumeration strategy, then
+    publish reminders from a raw lean run, and set an invalid value.
+
+    Expected Result:
+      The same records from both transports, a single requested reviewers
+      request per pull request instead of two, reminders published and
+      then skipped on raw records, and an error logged for the invalid
+      value.
+    """
+    def records(results):
+        return sorted(
+            sorted((_k_, str(_v_)) for _k_, _v_ in _pr_.items()
+                   if _k_ != 'age')
+            for _pr_ in results
+        )
+
+    Reviewers = 'GET /repos/{repo}/pulls/{number}/requested_reviewers'
+    with GithubStubServer(pr_count=20, repo_count=2) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.repo_namespace = "StubOrg"
+        GitHubReportObj.review_history = True
+        for _strategy_ in ('search', 'list', 'graphql'):
+            GitHubReportObj.enumeration = _strategy_
+            GitHubReportObj.raw_transport = False
+            Objects = GitHubReportObj.search_open_pulls()
+            assert(
+                GitHubReportObj.stats.as_dict()['endpoints'][Reviewers]
+                ['requests'] == 40
+            )
+            GitHubReportObj.raw_transport = True
+            Raw = GitHubReportObj.search_open_pulls()
+            assert(
+                GitHubReportObj.stats.as_dict()['endpoints'][Reviewers]
+                ['requests'] == 20
+            )
+            assert(len(Raw) == 20)
+            assert(records(Raw) == records(Objects))
+
+        GitHubReportObj.enumeration = 'search'
+        GitHubReportObj.lean_hydration = True
+        GitHubReportObj.notify = True
+        GitHubReportObj.notifier = GithubNotifier(writes_per_minute=60000)
+        Lean = GitHubReportObj.search_open_pulls()
+        assert(records(Lean) == records(Objects))
+        Writes = 'POST /repos/{repo}/issues/{number}/comments'
+        Exceeded = len([
+            _pr_ for _pr_ in Lean
+            if _pr_['age_days'] > _pr_['days_open_threshold']
+        ])
+        assert(ThisServer.stats['endpoints'][Writes] == Exceeded)
+        GitHubReportObj.search_open_pulls()
+        assert(ThisServer.stats['endpoints'][Writes] == Exceeded)
+        Counters = GitHubReportObj.stats.as_dict()['counters']
+        assert(Counters['comments_skipped'] == Exceeded)
+
+    GitHubReportObj.raw_transport = "yes"
+    assert(GitHubReportObj.raw_transport is True)
+    out, err = capsys.readouterr()
+    assert("raw_transport property argument expected type bool" in err)
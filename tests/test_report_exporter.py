@@ -0,0 +1,179 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_report_exporter.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_report_exporter.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports, ReportExporter
+
+# Base Python Module Imports:
+from datetime import datetime, timedelta, timezone
+import pytest
+import json
+import csv
+import os
+
+
+######################################
+# Define Mock Search Results:        #
+######################################
+class MockUser(object):
+    """Mock PyGithub NamedUser Object"""
+
+    def __init__(self, login):
+        """Class Constructor"""
+        self.login = login
+
+
+def search_results(count):
+    """ Yield mock search_open_pulls result entries """
+    for _number_ in range(count):
+        yield {
+            'id': 1000 + _number_,
+            'repository': 'Mock',
+            'repository_url': 'https://github.com/CloudMaege/Mock',
+            'number': _number_,
+            'submitter': 'octocat',
+            'reviewers': ['bobby: APPROVED', 'team-a'],
+            'mentions': ['@octocat', '@bobby'],
+            'link': f"https://github.com/CloudMaege/Mock/pull/{_number_}",
+            'title': f"Mock PR {_number_}",
+            'body': 'Line one,\nline "two"',
+            'created': datetime(2020, 4, 9, 0, 29, 56, tzinfo=timezone.utc),
+            'age': timedelta(days=_number_, seconds=30),
+            'age_days': _number_,
+            'state': 'open',
+            'is_merged': False,
+            'merged': None,
+            'mergable': True,
+            'merge_state': 'clean',
+            'merged_by': MockUser('merger') if _number_ == 0 else None,
+            'review_count': _number_ % 3,
+            'days_open_threshold': 5
+        }
+
+
+######################################
+# Test Export Formats:               #
+######################################
+def test_export_csv(tmp_path):
+    """ ReportExporter Class CSV Export Test
+
+    This test will export a generator of mock results to CSV using a chunk
+    size that does not evenly divide the result count.
+
+    Expected Result:
+      Every row written with typed, UTC and JSON encoded values.
+    """
+    ExportPath = os.path.join(str(tmp_path), 'open_prs.csv')
+    ExporterObj = ReportExporter(chunk_size=4)
+    assert(ExporterObj.export(search_results(10), ExportPath, 'csv') == 10)
+
+    with open(ExportPath, newline='') as f:
+        Rows = list(csv.DictReader(f))
+    assert(len(Rows) == 10)
+    assert(Rows[0]['created'] == '2020-04-09T00:29:56+00:00')
+    assert(Rows[1]['age'] == '86430.0')
+    assert(Rows[9]['age_days'] == '9')
+    assert(Rows[0]['is_merged'] == 'false')
+    assert(Rows[0]['merged'] == '')
+    assert(Rows[0]['merged_by'] == 'merger')
+    assert(json.loads(Rows[0]['reviewers']) == ['bobby: APPROVED', 'team-a'])
+    assert(Rows[0]['body'] == 'Line one,\nline "two"')
+
+
+def test_export_jsonl(tmp_path):
+    """ ReportExporter Class JSONL Export Test
+
+    This test will export mock results to a JSON lines file.
+
+    Expected Result:
+      One JSON object per line with native JSON types.
+    """
+    ExportPath = os.path.join(str(tmp_path), 'open_prs.jsonl')
+    ExporterObj = ReportExporter(chunk_size=3)
+    assert(ExporterObj.export(search_results(5), ExportPath, 'jsonl') == 5)
+
+    with open(ExportPath) as f:
+        Rows = [json.loads(_line_) for _line_ in f]
+    assert(len(Rows) == 5)
+    assert(Rows[2]['review_count'] == 2)
+    assert(Rows[2]['created'] == '2020-04-09T00:29:56+00:00')
+    assert(Rows[2]['mentions'] == ['@octocat', '@bobby'])
+    assert(Rows[2]['merged'] is None)
+
+
+@pytest.mark.parametrize('export_format', ['parquet', 'arrow'])
+def test_export_columnar(tmp_path, export_format):
+    """ ReportExporter Class Parquet and Arrow Export Test
+
+    This test will export mock results to Parquet and Arrow IPC files and
+    read them back with pyarrow to validate the column types.
+
+    Expected Result:
+      Typed timestamp and integer columns, every row written.
+    """
+    pa = pytest.importorskip('pyarrow')
+    ExportPath = os.path.join(str(tmp_path), f"open_prs.{export_format}")
+    ExporterObj = ReportExporter(chunk_size=4)
+    assert(
+        ExporterObj.export(search_results(10), ExportPath, export_format) ==
+        10
+    )
+
+    if export_format == 'parquet':
+        import pyarrow.parquet as pq
+        ThisTable = pq.read_table(ExportPath)
+    else:
+        ThisTable = pa.ipc.open_file(ExportPath).read_all()
+
+    assert(ThisTable.num_rows == 10)
+    assert(ThisTable.schema.field('created').type == pa.timestamp('us', 'UTC'))
+    assert(ThisTable.schema.field('age_days').type == pa.int64())
+    assert(ThisTable.schema.field('review_count').type == pa.int64())
+    assert(ThisTable.column('review_count').to_pylist()[:4] == [0, 1, 2, 0])
+
+
+def test_export_invalid_format(capsys, tmp_path):
+    """ ReportExporter Class Invalid Format Test
+
+    This test will request an unsupported export format.
+
+    Expected Result:
+      None returned and an error logged.
+    """
+    ExporterObj = ReportExporter()
+    assert(
+        ExporterObj.export(
+            search_results(1),
+            os.path.join(str(tmp_path), 'open_prs.xml'),
+            'xml'
+        ) is None
+    )
+    out, err = capsys.readouterr()
+    assert "export_format expected one of" in err
+
+
+def test_github_reports_export(capsys, tmp_path):
+    """ GithubReports Class 'export' Method Test
+
+    This test will export the cached search results of a GithubReports
+    object.
+
+    Expected Result:
+      Cached results exported, missing results log an error.
+    """
+    GitHubReportObj = GithubReports()
+    ExportPath = os.path.join(str(tmp_path), 'open_prs.jsonl')
+    assert(GitHubReportObj.export(ExportPath, 'jsonl') is None)
+    out, err = capsys.readouterr()
+    assert "No search results available to export" in err
+
+    GitHubReportObj._search_results = list(search_results(3))
+    assert(GitHubReportObj.export(ExportPath, 'jsonl', chunk_size=2) == 3)
@@ -0,0 +1,271 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_report_planner.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_report_planner.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+from cloudmage.gitutils.report_planner import ReportPlanner
+from cloudmage.gitutils.search_query import SearchQuery
+
+# Base Python Module Imports:
+import pytest
+
+
+FULL_BUDGETS = {
+    'core': (5000, 5000, 3600),
+    'search': (30, 30, 60),
+    'graphql': (5000, 5000, 3600)
+}
+
+
+######################################
+# Test Enumeration Planning:         #
+######################################
+def test_report_planner_costs():
+    """ ReportPlanner Class Estimate Test
+
+    This test will estimate every strategy for a namespace with two busy
+    repositories, and for a search reaching the result cap.
+
+    Expected Result:
+      Every pull request fetched, with two review request requests, unless
+      lean hydration leaves search results and listed pull requests
+      unfetched, search pages spent on the search budget, activity
+      staleness adding GraphQL search pages to the other strategies, and
+      partitioned searches paying for their probes.
+    """
+    Planner = ReportPlanner({'api': 450, 'web': 50, 'docs': 0}, FULL_BUDGETS)
+    assert(Planner.pull_count == 500)
+    assert(Planner.estimate('search')['requests'] == {
+        'core': 2000, 'search': 5
+    })
+    assert(Planner.estimate('list')['requests'] == {'core': 2000 + 6 + 2})
+    assert(Planner.estimate('graphql')['requests'] == {
+        'core': 2002, 'graphql': 5
+    })
+    assert(Planner.plan()['strategy'] == 'search')
+    Planner = ReportPlanner(
+        {'api': 450, 'web': 50}, FULL_BUDGETS, fetch_pulls=False
+    )
+    assert(Planner.estimate('search')['requests']['core'] == 1500)
+    assert(Planner.estimate('list')['requests']['core'] == 1500 + 6 + 2)
+    assert(Planner.estimate('graphql')['requests']['core'] == 1502)
+    Planner = ReportPlanner(
+        {'api': 450, 'web': 50}, FULL_BUDGETS, review_requests=1
+    )
+    assert(Planner.estimate('search')['requests']['core'] == 1500)
+
+    Planner = ReportPlanner(
+        {'api': 450, 'web': 50}, FULL_BUDGETS, activity=True
+    )
+    assert(Planner.estimate('search')['requests']['graphql'] == 5)
+    assert(Planner.estimate('list')['requests']['graphql'] == 5)
+    assert(Planner.estimate('graphql')['requests']['graphql'] == 5)
+
+    Planner = ReportPlanner({'api': 2500}, FULL_BUDGETS)
+    assert(Planner.estimate('search')['requests']['search'] == 25 + 2 * 4)
+
+    with pytest.raises(ValueError):
+        Planner.estimate('scrape')
+
+
+def test_report_planner_budgets():
+    """ ReportPlanner Class Rate Limit Budget Test
+
+    This test will plan a namespace with many quiet repositories, with and
+    without search budget left, and with filters listings can not apply.
+
+    Expected Result:
+      Search while its budget lasts, GraphQL once the search budget is
+      spent, listings never chosen for filtered queries, and listings for
+      a busy repository.
+    """
+    Repos = {f"repo-{_n_}": 1 for _n_ in range(200)}
+    assert(ReportPlanner(Repos, FULL_BUDGETS).plan()['strategy'] == 'search')
+
+    Spent = dict(FULL_BUDGETS, search=(1, 30, 300))
+    Planner = ReportPlanner(Repos, Spent, listable=False)
+    assert(Planner.estimate('search')['seconds'] > 300)
+    assert(Planner.estimate('list')['seconds'] is None)
+    assert(Planner.plan()['strategy'] == 'graphql')
+    assert(ReportPlanner({'api': 500}, Spent).plan()['strategy'] == 'list')
+
+
+######################################
+# Test Enumeration Strategies:       #
+######################################
+def test_search_open_pulls_enumeration(capsys):
+    """ GithubReports Class 'enumeration' Property Test
+
+    This test will collect the open pull requests of the stub server with
+    every enumeration strategy, let the planner choose for a listable and
+    a label filtered query with the search and GraphQL budgets spent, and
+    set an invalid strategy.
+
+    Expected Result:
+      The same pull requests from every strategy, listings chosen for the
+      unfiltered query, search for the filtered query, and an error logged
+      for the invalid strategy.
+    """
+    Collected = {}
+    with GithubStubServer(
+        pr_count=30, repo_count=3, search_rate_limit=0, graphql_rate_limit=0
+    ) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.repo_namespace = "StubOrg"
+        for _strategy_ in ('search', 'list', 'graphql', 'auto'):
+            GitHubReportObj.enumeration = _strategy_
+            Results = GitHubReportObj.search_open_pulls()
+            Collected[_strategy_] = sorted(
+                (_pr_['repository'], _pr_['number'], _pr_['reviewers'])
+                for _pr_ in Results
+            )
+            Stages = GitHubReportObj.stats.as_dict()['stages']
+            assert(
+                GithubReports.enumeration_stages[
+                    GitHubReportObj.enumeration_plan['strategy']
+                ] in Stages
+            )
+
+        Plan = GitHubReportObj.enumeration_plan
+        assert(Plan['strategy'] == 'list')
+        assert(sum(Plan['repo_pulls'].values()) == 30)
+        # Listed pull requests are only fetched for their mergeability.
+        assert(Stages['get_pull']['requests'] == 30)
+        GitHubReportObj.lean_hydration = True
+        GitHubReportObj.mergeability = False
+        GitHubReportObj.search_open_pulls()
+        Stats = GitHubReportObj.stats.as_dict()
+        assert('get_pull' not in Stats['stages'])
+        assert(
+            'GET /repos/{repo}/pulls/{number}' not in Stats['endpoints']
+        )
+        GitHubReportObj.lean_hydration = False
+        GitHubReportObj.mergeability = True
+
+        GitHubReportObj.search_query = SearchQuery(labels=['bug'])
+        GitHubReportObj.search_open_pulls()
+        assert(GitHubReportObj.enumeration_plan['strategy'] == 'search')
+
+    assert(len(Collected['search']) == 30)
+    assert(
+        Collected['search'] == Collected['list'] ==
+        Collected['graphql'] == Collected['auto']
+    )
+
+    GitHubReportObj.enumeration = 'scrape'
+    assert(GitHubReportObj.enumeration == 'auto')
+    out, err = capsys.readouterr()
+    assert("enumeration property argument expected one of" in err)
+
+
+def test_search_open_pulls_user_inventory():
+    """ GithubReports User Namespace Inventory Test
+
+    This test will enumerate the open pull requests of a user namespace
+    that collaborates on the repositories of an organization, by listings
+    and with the auto strategy.
+
+    Expected Result:
+      The pull requests of the user repositories alone, with the inventory
+      keyed by full repository name.
+    """
+    with GithubStubServer(
+        users=('StubUser',), pr_count=12, repo_count=2
+    ) as ThisServer:
+        Expected = sorted(
+            (_pr_['repo'], _pr_['number'])
+            for _pr_ in ThisServer.pull_requests('StubUser')
+        )
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = False
+        GitHubReportObj.repo_namespace = "StubUser"
+        for _strategy_ in ('list', 'auto'):
+            GitHubReportObj.enumeration = _strategy_
+            Results = GitHubReportObj.search_open_pulls()
+            assert(sorted(
+                ('/'.join(_pr_['repository_url'].split('/')[-2:]),
+                 _pr_['number'])
+                for _pr_ in Results
+            ) == Expected)
+            assert(sorted(GitHubReportObj.enumeration_plan['repo_pulls']) == [
+                'StubUser/repo-0', 'StubUser/repo-1'
+            ])
+
+
+def test_search_open_pulls_oldest_first(capsys):
+    """ GithubReports Class 'oldest_first' Property Test
+
+    This test will collect the stale pull requests of a busy repository
+    oldest first with every enumeration strategy, list them in the default
+    order, and set an invalid value.
+
+    Expected Result:
+      The same stale pull requests from every strategy in creation order,
+      the listing stopped at its first page instead of reading all three,
+      and an error logged for the invalid value.
+    """
+    Collected = {}
+    with GithubStubServer(pr_count=250, repo_count=1) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.repo_namespace = "StubOrg"
+        GitHubReportObj.mergeability = False
+        GitHubReportObj.open_pr_threshold = 50
+        GitHubReportObj.stale_only = True
+        for _strategy_ in ('list', 'search', 'graphql'):
+            GitHubReportObj.enumeration = _strategy_
+            GitHubReportObj.oldest_first = True
+            Collected[_strategy_] = [
+                (_pr_['created'], _pr_['number'])
+                for _pr_ in GitHubReportObj.search_open_pulls()
+            ]
+            if _strategy_ == 'list':
+                Stats = GitHubReportObj.stats.as_dict()
+                assert(
+                    Stats['endpoints']['GET /repos/{repo}/pulls']
+                    ['requests'] == 1
+                )
+                assert(Stats['counters']['enumeration_stopped_early'] == 1)
+
+        GitHubReportObj.enumeration = 'list'
+        GitHubReportObj.oldest_first = False
+        Unordered = GitHubReportObj.search_open_pulls()
+        assert(
+            GitHubReportObj.stats.as_dict()['endpoints'][
+                'GET /repos/{repo}/pulls'
+            ]['requests'] == 3
+        )
+
+    assert(0 < len(Collected['list']) < 250)
+    assert(Collected['list'] == sorted(Collected['list']))
+    assert(Collected['list'] == Collected['search'] == Collected['graphql'])
+    assert(sorted(
+        (_pr_['created'], _pr_['number']) for _pr_ in Unordered
+    ) == Collected['list'])
+
+    GitHubReportObj.oldest_first = "yes"
+    assert(GitHubReportObj.oldest_first is False)
+    out, err = capsys.readouterr()
+    assert("oldest_first property argument expected type bool" in err)
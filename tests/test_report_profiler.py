@@ -0,0 +1,186 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_report_profiler.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_report_profiler.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+from cloudmage.gitutils.report_profiler import ReportProfiler
+
+# Base Python Module Imports:
+import pstats
+import pytest
+import json
+import sys
+import os
+
+
+######################################
+# Define Stub Server Fixture:        #
+######################################
+@pytest.fixture(scope='module')
+def stub_server():
+    """ GithubStubServer PyTest Fixture """
+    with GithubStubServer(pr_count=5, repo_count=1) as ThisServer:
+        yield ThisServer
+
+
+def stub_report(stub_server, **kwargs):
+    """ Return a GithubReports object targeting the stub server """
+    GitHubReportObj = GithubReports(
+        auth_token="12345678910987654321",
+        base_url=stub_server.base_url,
+        **kwargs
+    )
+    GitHubReportObj.request_interval = 0
+    GitHubReportObj.is_organization = True
+    return GitHubReportObj
+
+
+######################################
+# Test Profiled Runs:                #
+######################################
+def test_cprofile_run(stub_server, tmp_path):
+    """ GithubReports Class cProfile Run Test
+
+    This test will profile a search_open_pulls run with the constructor
+    profile_path flag.
+
+    Expected Result:
+      A loadable pstats file containing the run, and a metadata file with
+      the search query and report settings, run statistics and no auth
+      token.
+    """
+    ProfilePath = os.path.join(str(tmp_path), 'run.prof')
+    GitHubReportObj = stub_report(stub_server, profile_path=ProfilePath)
+    Results = GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+    assert(len(Results) == 5)
+
+    Stats = pstats.Stats(ProfilePath)
+    assert(any(
+        _func_[2] == 'search_open_pulls' for _func_ in Stats.stats
+    ))
+
+    with open(f"{ProfilePath}.meta.json") as f:
+        Metadata = json.load(f)
+    assert(Metadata['profiler'] == 'cprofile')
+    assert(Metadata['method'] == 'search_open_pulls')
+    assert(Metadata['repo_namespace'] == 'StubOrg')
+    assert(Metadata['is_organization'] is True)
+    assert(Metadata['result_count'] == 5)
+    assert(Metadata['search_query'] == str(GitHubReportObj._build_query()))
+    assert('is:open' in Metadata['search_query'])
+    for _setting_ in (
+        'stale_only', 'staleness', 'oldest_first', 'enumeration',
+        'enumeration_strategy', 'lean_hydration', 'mergeability',
+        'raw_transport', 'search_workers', 'page_read_ahead',
+        'mergeability_batch'
+    ):
+        assert(_setting_ in Metadata)
+    assert(Metadata['search_workers'] == GitHubReportObj.search_workers)
+    assert(Metadata['stats']['requests'] > 0)
+    assert(Metadata['elapsed'] > 0)
+    assert('12345678910987654321' not in json.dumps(Metadata))
+
+
+def test_profile_argv_redacted(stub_server, tmp_path, monkeypatch):
+    """ ReportProfiler Class argv Metadata Test
+
+    This test will profile a run started from a command line passing the
+    Github token as a separate and as an inline option value.
+
+    Expected Result:
+      The argv metadata holds the command line with both token values
+      replaced.
+    """
+    monkeypatch.setattr(sys, 'argv', [
+        'gitutils', 'open-prs', 'StubOrg', '--token', 'ghp_secret1',
+        '--token=ghp_secret2', '--org'
+    ])
+    ProfilePath = os.path.join(str(tmp_path), 'argv.prof')
+    GitHubReportObj = stub_report(stub_server, profile_path=ProfilePath)
+    GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+
+    with open(f"{ProfilePath}.meta.json") as f:
+        Metadata = json.load(f)
+    assert(Metadata['argv'] == [
+        'gitutils', 'open-prs', 'StubOrg', '--token', '***',
+        '--token=***', '--org'
+    ])
+    assert('ghp_secret' not in json.dumps(Metadata))
+
+
+def test_profile_environment(stub_server, tmp_path, monkeypatch):
+    """ GithubReports Class Profiling Environment Variable Test
+
+    This test will enable profiling with the GITUTILS_PROFILE environment
+    variable, then disable it with the profile_path property.
+
+    Expected Result:
+      The first run is profiled, the second is not.
+    """
+    ProfilePath = os.path.join(str(tmp_path), 'env.prof')
+    monkeypatch.setenv('GITUTILS_PROFILE', ProfilePath)
+    GitHubReportObj = stub_report(stub_server)
+    assert(GitHubReportObj.profile_path == ProfilePath)
+    assert(GitHubReportObj.profiler == 'cprofile')
+    GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+    assert(os.path.exists(ProfilePath))
+
+    os.remove(ProfilePath)
+    GitHubReportObj.profile_path = None
+    GitHubReportObj.search_open_pulls()
+    assert(not os.path.exists(ProfilePath))
+
+
+def test_pyinstrument_run(stub_server, tmp_path):
+    """ GithubReports Class pyinstrument Run Test
+
+    This test will profile a search_open_pulls run with the sampling
+    profiler to a speedscope profile and an HTML flame graph.
+
+    Expected Result:
+      Both profile files are written.
+    """
+    pytest.importorskip('pyinstrument')
+    for _name_ in ('run.speedscope.json', 'run.html'):
+        ProfilePath = os.path.join(str(tmp_path), _name_)
+        GitHubReportObj = stub_report(stub_server, profile_path=ProfilePath)
+        GitHubReportObj.profiler = 'pyinstrument'
+        GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+        assert(os.path.getsize(ProfilePath) > 0)
+        assert(os.path.exists(f"{ProfilePath}.meta.json"))
+
+
+def test_profiler_unavailable(stub_server, tmp_path, monkeypatch, capsys):
+    """ GithubReports Class Unavailable Profiler Test
+
+    This test will request the pyinstrument profiler when it can not be
+    imported, and set an unsupported profiler.
+
+    Expected Result:
+      Errors logged, and the run completes without a profile.
+    """
+    monkeypatch.setitem(sys.modules, 'pyinstrument', None)
+    ProfilePath = os.path.join(str(tmp_path), 'run.html')
+    GitHubReportObj = stub_report(stub_server, profile_path=ProfilePath)
+    GitHubReportObj.profiler = 'yappi'
+    assert(GitHubReportObj.profiler == 'cprofile')
+    GitHubReportObj.profiler = 'pyinstrument'
+    Results = GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+    assert(len(Results) == 5)
+    assert(not os.path.exists(ProfilePath))
+
+    out, err = capsys.readouterr()
+    assert("profiler property argument expected one of" in err)
+    assert("Unable to start the pyinstrument profiler" in err)
+
+    with pytest.raises(ValueError):
+        ReportProfiler(ProfilePath, 'yappi')
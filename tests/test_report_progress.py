@@ -0,0 +1,106 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_report_progress.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_report_progress.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports
+from cloudmage.gitutils.report_progress import NullProgress, TerminalProgress
+
+# Base Python Module Imports:
+import io
+
+
+class TerminalStream(io.StringIO):
+    """ StringIO that claims to be a terminal and counts its writes """
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def isatty(self):
+        return True
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+######################################
+# Test Progress Sinks:               #
+######################################
+def test_terminal_progress_coalesces():
+    """ TerminalProgress Refresh Rate Test
+
+    This test will advance a terminal progress bar and report messages
+    far faster than its refresh rate.
+
+    Expected Result:
+      Only a handful of writes, detail messages dropped outside verbose
+      mode, and the final count and every info message written on finish.
+    """
+    Stream = TerminalStream()
+    Progress = TerminalProgress(stream=Stream, refresh_rate=1)
+    Progress.start(1000, 'Processing')
+    for _n_ in range(1000):
+        Progress.advance()
+        Progress.event(f"detail {_n_}", 'detail')
+    Progress.event("all done")
+    Progress.finish()
+
+    Output = Stream.getvalue()
+    assert(Stream.writes < 50)
+    assert('1000/1000' in Output)
+    assert('all done\n' in Output)
+    assert('detail' not in Output)
+
+
+def test_terminal_progress_headless():
+    """ TerminalProgress Non Terminal Stream Test
+
+    This test will report progress and verbose messages to a stream that
+    is not a terminal, with an unknown total.
+
+    Expected Result:
+      Messages written in order, and no progress bar drawn.
+    """
+    Stream = io.StringIO()
+    Progress = TerminalProgress(stream=Stream, refresh_rate=0, verbose=True)
+    Progress.event("first")
+    Progress.start(None, 'Processing')
+    Progress.advance(5)
+    Progress.event("second", 'detail')
+    Progress.finish()
+    assert(Stream.getvalue() == "first\nsecond\n")
+
+
+def test_github_reports_progress(capsys):
+    """ GithubReports Class 'progress' Property Test
+
+    This test will select the progress sink of headless and verbose
+    objects, and set a valid and an invalid sink.
+
+    Expected Result:
+      A NullProgress sink when headless, a TerminalProgress sink in verbose
+      mode, the assigned sink when set, and an error for an invalid sink.
+    """
+    GitHubReportObj = GithubReports()
+    assert(GitHubReportObj.progress is None)
+    assert(type(GitHubReportObj._progress_sink()) is NullProgress)
+    assert(isinstance(
+        GithubReports(verbose=True)._progress_sink(), TerminalProgress
+    ))
+
+    Sink = NullProgress()
+    GitHubReportObj.progress = Sink
+    assert(GitHubReportObj._progress_sink() is Sink)
+    GitHubReportObj.progress = 'stdout'
+    assert(GitHubReportObj.progress is Sink)
+    out, err = capsys.readouterr()
+    assert("progress property argument expected a progress sink" in err)
@@ -0,0 +1,279 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_report_stats.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_report_stats.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports, GithubNotifier, ReportStats
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+from cloudmage.gitutils.report_progress import NullProgress
+from cloudmage.gitutils.report_stats import endpoint_label
+from cloudmage.gitutils.search_query import SearchQuery
+
+# Base Python Module Imports:
+from datetime import timedelta
+import json
+import os
+
+
+######################################
+# Test Stat Collection:              #
+######################################
+def test_endpoint_label():
+    """ ReportStats Endpoint Label Test
+
+    This test will label absolute, relative and Github Enterprise request
+    urls.
+
+    Expected Result:
+      Repository names and numbers are replaced with placeholders.
+    """
+    assert(
+        endpoint_label('get', 'https://api.github.com/repos/o/r/pulls/12') ==
+        'GET /repos/{repo}/pulls/{number}'
+    )
+    assert(
+        endpoint_label('GET', '/api/v3/search/issues?q=is%3Aopen') ==
+        'GET /search/issues'
+    )
+    assert(
+        endpoint_label('POST', '/repos/o/r/issues/7/comments') ==
+        'POST /repos/{repo}/issues/{number}/comments'
+    )
+    assert(endpoint_label('GET', '/orgs/StubOrg') == 'GET /orgs/{owner}')
+
+
+def test_stages_and_requests():
+    """ ReportStats Stage and Request Recording Test
+
+    This test will record requests inside and outside of named stages, and
+    time a lazily evaluated iterator as a stage.
+
+    Expected Result:
+      Requests, bytes and errors attributed to the endpoint and the stage
+      that was active, and every iterator step counted as a stage call.
+    """
+    StatsObj = ReportStats()
+    StatsObj.start()
+    Pages = StatsObj.timed_iter('search', iter([1, 2, 3]))
+    assert(list(Pages) == [1, 2, 3])
+
+    with StatsObj.stage('get_pull'):
+        StatsObj.request(
+            'GET', '/repos/o/r/pulls/1', 200, 100, 0.5,
+            {'x-ratelimit-remaining': '42', 'x-ratelimit-resource': 'core'}
+        )
+        StatsObj.request('GET', '/repos/o/r/pulls/2', 404, 20, 0.1)
+    StatsObj.request('GET', '/rate_limit', 200, 10, 0.1)
+    StatsObj.cache('template', True)
+    StatsObj.cache('template', False, 2)
+    StatsObj.rate_limit_wait(1.5, 'retry')
+    StatsObj.count('pull_requests_collected', 2)
+    StatsObj.finish()
+
+    Stats = StatsObj.as_dict()
+    assert(Stats['requests'] == 3)
+    assert(Stats['bytes'] == 130)
+    assert(Stats['stages']['search']['calls'] == 4)
+    assert(Stats['stages']['get_pull']['requests'] == 2)
+    assert(Stats['stages']['get_pull']['bytes'] == 120)
+    assert(Stats['stages']['unstaged']['requests'] == 1)
+    Endpoint = Stats['endpoints']['GET /repos/{repo}/pulls/{number}']
+    assert(Endpoint['requests'] == 2)
+    assert(Endpoint['errors'] == 1)
+    assert(Stats['caches']['template'] == {'hits': 1, 'misses': 2})
+    assert(Stats['rate_limit_waits']['retry'] == {'waits': 1, 'seconds': 1.5})
+    assert(Stats['rate_limit_remaining'] == {'core': 42})
+    assert(Stats['counters'] == {'pull_requests_collected': 2})
+    assert(Stats['elapsed'] >= 0)
+
+
+def test_retry_records_waits():
+    """ ReportStats Instrumented Retry Test
+
+    This test will increment an instrumented GithubRetry and sleep before
+    the next attempt.
+
+    Expected Result:
+      The retry state keeps the stats object, and the wait is recorded.
+    """
+    StatsObj = ReportStats()
+    ThisRetry = StatsObj.retry(total=3, backoff_factor=0)
+    NextRetry = ThisRetry.increment('GET', '/repos/o/r')
+    assert(NextRetry.stats is StatsObj)
+    NextRetry.sleep()
+    assert(StatsObj.as_dict()['rate_limit_waits']['retry']['waits'] == 1)
+
+
+######################################
+# Test Stat Export:                  #
+######################################
+def test_prometheus_export():
+    """ ReportStats Prometheus Export Test
+
+    This test will render recorded statistics as Prometheus text.
+
+    Expected Result:
+      HELP and TYPE lines per metric, and escaped label values.
+    """
+    StatsObj = ReportStats()
+    with StatsObj.stage('get_reviews'):
+        StatsObj.request('GET', '/repos/o/r/pulls/1/reviews', 200, 64, 0.25)
+    StatsObj.count('odd "event"\n')
+    Text = StatsObj.to_prometheus()
+    assert(
+        "# TYPE gitutils_report_api_requests_total counter\n"
+        "gitutils_report_api_requests_total{method=\"GET\","
+        "endpoint=\"/repos/{repo}/pulls/{number}/reviews\"} 1\n" in Text
+    )
+    assert(
+        'gitutils_report_stage_api_requests_total{stage="get_reviews"} 1'
+        in Text
+    )
+    assert('{event="odd \\"event\\"\\n"} 1' in Text)
+    assert('cache_hits_total' not in Text)
+    assert(Text.endswith('\n'))
+
+
+def test_opentelemetry_export():
+    """ ReportStats OpenTelemetry Export Test
+
+    This test will render recorded statistics as OTLP JSON metrics.
+
+    Expected Result:
+      Monotonic cumulative sums for counters, gauges for gauges, and int
+      values encoded as strings.
+    """
+    StatsObj = ReportStats()
+    StatsObj.start()
+    StatsObj.request('GET', '/search/issues', 200, 512, 0.25)
+    StatsObj.finish()
+    Payload = StatsObj.to_opentelemetry()
+    Scope = Payload['resourceMetrics'][0]['scopeMetrics'][0]
+    Metrics = {_m_['name']: _m_ for _m_ in Scope['metrics']}
+
+    Requests = Metrics['gitutils.report.api_requests']
+    assert(Requests['sum']['isMonotonic'] is True)
+    assert(Requests['sum']['aggregationTemporality'] == 2)
+    Point = Requests['sum']['dataPoints'][0]
+    assert(Point['asInt'] == '1')
+    assert({'key': 'endpoint', 'value': {'stringValue': '/search/issues'}}
+           in Point['attributes'])
+    assert('gauge' in Metrics['gitutils.report.run_seconds'])
+    json.dumps(Payload)
+
+
+def test_github_reports_stats(tmp_path, capsys):
+    """ GithubReports Class 'stats' Property Test
+
+    This test will run search_open_pulls with notifications against the
+    stub server, then export the run statistics.
+
+    Expected Result:
+      Every stub request is recorded and attributed to a stage, comment
+      dispatch counters and cache misses are recorded, and the statistics
+      are written in both export formats.
+    """
+    with GithubStubServer(pr_count=8, repo_count=2) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.notify = True
+        GitHubReportObj.enumeration = 'search'
+        GitHubReportObj.notifier = GithubNotifier(writes_per_minute=60000)
+        Results = GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+
+        Stats = GitHubReportObj.stats.as_dict()
+        assert(Stats['requests'] == ThisServer.stats['requests'])
+        assert('unstaged' not in Stats['stages'])
+        for _stage_ in (
+            'search_issues', 'get_pull', 'get_review_requests', 'get_reviews'
+        ):
+            assert(Stats['stages'][_stage_]['requests'] > 0)
+        Published = Stats['counters']['comments_published']
+        assert(Stats['counters']['pull_requests_collected'] == len(Results))
+        assert(
+            Stats['endpoints']['POST /repos/{repo}/issues/{number}/comments']
+            ['requests'] == Published
+        )
+        assert(Stats['caches']['comment_hashes']['misses'] == Published)
+        assert(Stats['rate_limit_remaining']['search'] < 30)
+
+    PromPath = os.path.join(str(tmp_path), 'gitutils.prom')
+    assert(GitHubReportObj.export_stats(PromPath) == PromPath)
+    with open(PromPath) as f:
+        assert('gitutils_report_stage_seconds_total' in f.read())
+
+    OtlpPath = os.path.join(str(tmp_path), 'gitutils.json')
+    assert(GitHubReportObj.export_stats(OtlpPath, 'otlp') == OtlpPath)
+    with open(OtlpPath) as f:
+        assert('resourceMetrics' in json.load(f))
+
+    assert(GitHubReportObj.export_stats(OtlpPath, 'statsd') is None)
+    out, err = capsys.readouterr()
+    assert("export_format expected one of" in err)
+
+
+def test_search_open_pulls_counts():
+    """ GithubReports Class Result Count Test
+
+    This test will search the stub server, then list the pull requests
+    created in the last 60 days, recording the totals progress is started
+    with.
+
+    Expected Result:
+      A single search page request for a search count and its results, a
+      single reviews request per pull request, one shared repository and
+      login per repository and author, and an indeterminate
+      progress total for a listing whose count is not known in advance.
+    """
+    class RecordingProgress(NullProgress):
+        def __init__(self):
+            self.totals = []
+
+        def start(self, total=None, label=''):
+            self.totals.append(total)
+
+    with GithubStubServer(pr_count=12, repo_count=2) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.enumeration = 'search'
+        GitHubReportObj.progress = RecordingProgress()
+        Results = GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+        Stats = GitHubReportObj.stats.as_dict()
+        Endpoints = Stats['endpoints']
+        assert(len(Results) == 12)
+        assert(Endpoints['GET /search/issues']['requests'] == 1)
+        assert(
+            Endpoints['GET /repos/{repo}/pulls/{number}/reviews']
+            ['requests'] == 12
+        )
+        assert('GET /repos/{repo}/issues/{number}' not in Endpoints)
+        assert('GET /repos/{repo}' not in Endpoints)
+        assert(Stats['caches']['repositories'] == {'hits': 10, 'misses': 2})
+        assert(len({id(_pr_['submitter']) for _pr_ in Results}) == len(
+            {_pr_['submitter'] for _pr_ in Results}
+        ))
+
+        GitHubReportObj.enumeration = 'list'
+        GitHubReportObj.search_query = SearchQuery(
+            created_after=GitHubReportObj._now - timedelta(days=60)
+        )
+        Listed = GitHubReportObj.search_open_pulls()
+        assert(GitHubReportObj.progress.totals == [12, None])
+
+    assert(0 < len(Listed) <= 12)
+    assert(all(_pr_['age'] <= timedelta(days=60) for _pr_ in Listed))
@@ -0,0 +1,194 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_review_states.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_review_states.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+from cloudmage.gitutils.review_states import ReviewerStates
+
+# Base Python Module Imports:
+from datetime import datetime, timezone
+
+
+######################################
+# Test Reviewer States:              #
+######################################
+def test_reviewer_states():
+    """ ReviewerStates Class Test
+
+    This test will request reviewers and a team, then record several
+    reviews from requested and unrequested reviewers.
+
+    Expected Result:
+      One reviewer entry per login holding the latest review state, team
+      names for requested teams, every participant mentioned once, and
+      teams mentioned by organization and slug.
+    """
+    Reviewers = ReviewerStates('octocat', organization='CloudMages')
+    Reviewers.request_user('bobby')
+    Reviewers.request_user('alice')
+    Reviewers.request_team('platform-team', 'Platform Team')
+    Reviewers.review('bobby', 'COMMENTED')
+    Reviewers.review('bobby', 'CHANGES_REQUESTED')
+    Reviewers.review('bob', 'APPROVED')
+    Reviewers.review('bobby', 'APPROVED')
+    Reviewers.review('octocat', 'COMMENTED')
+    Reviewers.request_user('bobby')
+
+    assert(Reviewers.reviewers == [
+        'bobby: APPROVED',
+        'alice',
+        'Platform Team',
+        'bob: APPROVED',
+        'octocat: COMMENTED'
+    ])
+    assert(Reviewers.mentions == [
+        '@octocat', '@bobby', '@alice', '@CloudMages/platform-team', '@bob'
+    ])
+    assert(Reviewers.state('bobby') == 'APPROVED')
+    assert(Reviewers.state('alice') is None)
+    assert(Reviewers.state('nobody') is None)
+
+
+def test_reviewer_states_empty():
+    """ ReviewerStates Class No Reviewers Test
+
+    This test will render a pull request without reviewers.
+
+    Expected Result:
+      No reviewers, and only the author mentioned.
+    """
+    Reviewers = ReviewerStates('octocat')
+    assert(Reviewers.reviewers == [])
+    assert(Reviewers.mentions == ['@octocat'])
+
+
+######################################
+# Test Review Timeline:              #
+######################################
+def test_review_timeline():
+    """ ReviewerStates Class Review Timeline Test
+
+    This test will record review requests and reviews with history
+    enabled, and without it.
+
+    Expected Result:
+      One timeline entry per event in parallel columns, the first review
+      request, first review and first approval times, request events
+      recorded without adding reviewers, and no timeline without history.
+    """
+    Times = [
+        datetime(2020, 4, _day_, tzinfo=timezone.utc) for _day_ in (2, 3)
+    ]
+    Reviewers = ReviewerStates('octocat', history=True)
+    Reviewers.request_user('alice')
+    Reviewers.request_team('platform-team', 'Platform Team')
+    Reviewers.review('bobby', 'COMMENTED', Times[0])
+    Reviewers.review('alice', 'APPROVED', Times[1])
+
+    assert(Reviewers.timeline == {
+        'reviewer': ['alice', 'platform-team', 'bobby', 'alice'],
+        'kind': ['user', 'team', 'user', 'user'],
+        'state': ['REQUESTED', 'REQUESTED', 'COMMENTED', 'APPROVED'],
+        'at': [None, None, Times[0], Times[1]]
+    })
+    assert(Reviewers.first_review_at() == Times[0])
+    assert(Reviewers.approved_at() == Times[1])
+    assert(Reviewers.requested_at() is None)
+
+    # Review request events recorded apart from the requested reviewers.
+    Requested = datetime(2020, 4, 1, tzinfo=timezone.utc)
+    Reviewers = ReviewerStates('octocat', history=True)
+    Reviewers.request_user('alice', record=False)
+    Reviewers.requested('alice', 'user', Requested)
+    Reviewers.requested('bobby', 'user', Requested)
+    Reviewers.review('bobby', 'APPROVED', Times[1])
+    assert(Reviewers.reviewers == ['alice', 'bobby: APPROVED'])
+    assert(Reviewers.timeline['state'] == [
+        'REQUESTED', 'REQUESTED', 'APPROVED'
+    ])
+    assert(Reviewers.requested_at() == Requested)
+
+    Reviewers = ReviewerStates('octocat')
+    Reviewers.review('alice', 'APPROVED', Times[1])
+    assert(Reviewers.timeline is None)
+    assert(Reviewers.approved_at() is None)
+
+
+def test_review_history_requests():
+    """ GithubReports Class 'review_history' Property Test
+
+    This test will run search_open_pulls against the stub server with and
+    without the review timeline, with search and GraphQL enumeration.
+
+    Expected Result:
+      The timeline and review times are collected, review requests holding
+      their request times read from GraphQL search pages, a single GraphQL
+      request added to the search run, and none to the GraphQL run.
+    """
+    with GithubStubServer(pr_count=6, repo_count=1) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        Collected = {}
+        for _strategy_ in ('search', 'graphql'):
+            GitHubReportObj.enumeration = _strategy_
+            GitHubReportObj.review_history = False
+            Results = GitHubReportObj.search_open_pulls(
+                repo_namespace="StubOrg"
+            )
+            Requests = GitHubReportObj.stats.as_dict()['requests']
+            assert('review_timeline' not in Results[0])
+
+            GitHubReportObj.review_history = True
+            Results = GitHubReportObj.search_open_pulls()
+            assert(
+                GitHubReportObj.stats.as_dict()['requests'] ==
+                Requests + (_strategy_ == 'search')
+            )
+            Collected[_strategy_] = sorted(
+                (_pr_['id'], _pr_['review_timeline']['reviewer'],
+                 _pr_['review_timeline']['at'])
+                for _pr_ in Results
+            )
+
+        for _pr_ in Results:
+            Link = _pr_['link'].split('/')
+            Pull = ThisServer._find_pull('/'.join(Link[-4:-2]), Link[-1])
+            Timeline = _pr_['review_timeline']
+            assert(len(Timeline['state']) == len(Timeline['at']))
+            Reviewed = [
+                _at_ for _state_, _at_ in
+                zip(Timeline['state'], Timeline['at'])
+                if _state_ != 'REQUESTED'
+            ]
+            Requested = [
+                (_reviewer_, _at_) for _reviewer_, _state_, _at_ in
+                zip(Timeline['reviewer'], Timeline['state'], Timeline['at'])
+                if _state_ == 'REQUESTED'
+            ]
+            assert(len(Reviewed) == _pr_['review_count'])
+            assert(_pr_['first_review_at'] == min(Reviewed, default=None))
+            assert(all(_at_ is not None for _, _at_ in Requested))
+            assert(
+                {_reviewer_ for _reviewer_, _ in Requested} >=
+                set(Pull['requested_users']) |
+                set(Pull['requested_teams'])
+            )
+            if _pr_['approved_at'] is not None:
+                assert(
+                    min(_at_ for _, _at_ in Requested) <= _pr_['approved_at']
+                )
+
+    assert(Collected['search'] == Collected['graphql'])
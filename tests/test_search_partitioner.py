@@ -0,0 +1,193 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_search_partitioner.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_search_partitioner.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+from cloudmage.gitutils.search_partitioner import SearchPartitioner
+from cloudmage.gitutils.search_query import SearchQuery
+import github.Requester
+
+# Base Python Module Imports:
+from datetime import datetime, timedelta, timezone
+import pytest
+import time
+
+
+NOW = datetime(2020, 4, 4, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def slow_responses(monkeypatch):
+    """ Widen the window between storing a request and sending it """
+    this_getresponse = github.Requester.HTTPRequestsConnectionClass.getresponse
+
+    def getresponse(self):
+        time.sleep(0.001)
+        return this_getresponse(self)
+
+    monkeypatch.setattr(
+        github.Requester.HTTPRequestsConnectionClass,
+        'getresponse',
+        getresponse
+    )
+
+
+def counter(pulls, probes):
+    """ Return a count function over (repo, created) pairs """
+    def count(query):
+        probes.append(query)
+        return len([
+            _pull_ for _pull_ in pulls
+            if (query.created_after is None or
+                _pull_[1] >= query.created_after) and
+            (query.created_before is None or
+                _pull_[1] < query.created_before) and
+            (not query.repos or _pull_[0] in query.repos)
+        ])
+    return count
+
+
+######################################
+# Test Query Partitioning:           #
+######################################
+def test_partition_date_ranges():
+    """ SearchPartitioner Date Range Test
+
+    This test will partition a query matching 45 pull requests created
+    over 45 days with a result cap of 10.
+
+    Expected Result:
+      Every slice under the cap, an open ended newest slice, and every pull
+      request in exactly one slice.
+    """
+    Pulls = [('api', NOW - timedelta(days=_n_)) for _n_ in range(45)]
+    Probes = []
+    Count = counter(Pulls, Probes)
+    Partitioner = SearchPartitioner(Count, cap=10, now=NOW)
+    Slices = Partitioner.partition(SearchQuery('StubOrg'))
+
+    assert(all(0 < _count_ < 10 for _, _count_ in Slices))
+    assert(sum(_count_ for _, _count_ in Slices) == 45)
+    assert(all(_count_ == Count(_q_) for _q_, _count_ in Slices))
+    assert(Slices[-1][0].created_before is None)
+    assert(Partitioner.truncated == [])
+
+
+def test_partition_repositories():
+    """ SearchPartitioner Repository Fallback Test
+
+    This test will partition a query whose results were all created within
+    the same second, across two repositories, and then within a single
+    repository.
+
+    Expected Result:
+      One slice per repository once the date range can not be split, and
+      a truncated slice when a single repository still exceeds the cap.
+    """
+    Created = NOW - timedelta(days=1)
+    Pulls = [('api', Created)] * 8 + [('web', Created)] * 6
+    Probes = []
+    Partitioner = SearchPartitioner(
+        counter(Pulls, Probes),
+        lambda: ['api', 'web', 'sandbox'],
+        cap=10,
+        now=NOW
+    )
+    Slices = Partitioner.partition(
+        SearchQuery('StubOrg', exclude_repos=['sandbox'])
+    )
+    assert(sorted(
+        (_q_.repos, _count_) for _q_, _count_ in Slices
+    ) == [(('api',), 8), (('web',), 6)])
+    assert(Partitioner.truncated == [])
+    assert(not any(_q_.repos == ('sandbox',) for _q_ in Probes))
+
+    Partitioner = SearchPartitioner(
+        counter(Pulls, []), cap=5, now=NOW
+    )
+    Slices = Partitioner.partition(SearchQuery(repos=['api', 'web']))
+    assert([_count_ for _, _count_ in Slices] == [8, 6])
+    assert(len(Partitioner.truncated) == 2)
+
+
+######################################
+# Test Partitioned Search:           #
+######################################
+def test_search_open_pulls_partitioned():
+    """ GithubReports Class Partitioned Search Test
+
+    This test will search a stub server holding 45 pull requests, with a
+    search result cap of 10 on the server and the report object.
+
+    Expected Result:
+      Every pull request collected exactly once, from several concurrent
+      search slices.
+    """
+    with GithubStubServer(
+        pr_count=45, repo_count=3, search_cap=10
+    ) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.search_result_cap = 10
+        GitHubReportObj.enumeration = 'search'
+        Results = GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+        Stats = GitHubReportObj.stats.as_dict()
+
+    assert(len(Results) == 45)
+    assert(len({_pr_['id'] for _pr_ in Results}) == 45)
+    assert(
+        {(_pr_['repository'], _pr_['number']) for _pr_ in Results} ==
+        {
+            (_pull_['repo'].split('/')[1], _pull_['number'])
+            for _pull_ in ThisServer._pull_list
+        }
+    )
+    assert(Stats['counters']['search_slices'] >= 5)
+
+
+def test_search_open_pulls_partitioned_threads(slow_responses):
+    """ GithubReports Class Concurrent Search Slices Test
+
+    This test will search a stub server holding 45 pull requests, with a
+    search result cap of 10, through the search API, the raw transport and
+    GraphQL, while every response takes a moment longer.
+
+    Expected Result:
+      Every pull request collected exactly once by every strategy, each
+      slice worker reading the responses of its own requests.
+    """
+    with GithubStubServer(
+        pr_count=45, repo_count=3, search_cap=10
+    ) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.repo_namespace = "StubOrg"
+        GitHubReportObj.search_result_cap = 10
+        GitHubReportObj.mergeability = False
+        Expected = sorted(_pull_['id'] for _pull_ in ThisServer._pull_list)
+        for _strategy_, _raw_ in (
+            ('search', False), ('search', True), ('graphql', False)
+        ):
+            GitHubReportObj.enumeration = _strategy_
+            GitHubReportObj.raw_transport = _raw_
+            Results = GitHubReportObj.search_open_pulls()
+            assert(sorted(_pr_['id'] for _pr_ in Results) == Expected)
+            Counters = GitHubReportObj.stats.as_dict()['counters']
+            assert(Counters['search_slices'] >= 5)
@@ -0,0 +1,165 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_search_query.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_search_query.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+from cloudmage.gitutils.search_query import SearchQuery
+
+# Base Python Module Imports:
+from datetime import datetime, timedelta, timezone
+import pytest
+
+
+######################################
+# Test Query Building:               #
+######################################
+def test_search_query_terms():
+    """ SearchQuery Class Query String Test
+
+    This test will build queries with every filter, and copy a query with
+    some of its filters replaced.
+
+    Expected Result:
+      One qualifier per filter, repositories qualified with the namespace,
+      and the original query left unchanged by copy().
+    """
+    assert(
+        str(SearchQuery('octocat')) ==
+        'is:pr is:open is:unmerged user:octocat'
+    )
+    Query = SearchQuery(
+        'CloudMages',
+        is_organization=True,
+        created_before=datetime(2020, 4, 4, 12, tzinfo=timezone.utc),
+        draft=False,
+        labels=['bug', 'help wanted'],
+        exclude_labels=['wip'],
+        repos=['api', 'other/tools'],
+        exclude_repos=['sandbox'],
+        review='required'
+    )
+    assert(Query.terms() == [
+        'is:pr', 'is:open', 'is:unmerged', 'org:CloudMages',
+        'created:<2020-04-04T12:00:00Z', 'draft:false',
+        'label:bug,"help wanted"', '-label:wip',
+        'repo:CloudMages/api', 'repo:other/tools',
+        '-repo:CloudMages/sandbox', 'review:required'
+    ])
+
+    Slice = Query.copy(created_after=datetime(2020, 1, 1), review=None)
+    assert(
+        'created:2020-01-01T00:00:00Z..2020-04-04T12:00:00Z' in Slice.terms()
+    )
+    assert('review:required' not in Slice.terms())
+    assert('review:required' in Query.terms())
+
+    with pytest.raises(ValueError):
+        SearchQuery(review='pending')
+    with pytest.raises(ValueError):
+        SearchQuery(draft='false')
+
+
+def test_search_query_listing_filters():
+    """ SearchQuery Class Listing Filter Test
+
+    This test will match repositories and creation times against queries,
+    as per repository pull request listings do.
+
+    Expected Result:
+      Included and excluded repositories compared by qualified name, the
+      created bounds applied as the created: qualifier does, and listings
+      unable to apply label, draft and review filters.
+    """
+    Query = SearchQuery(
+        'CloudMages',
+        created_after=datetime(2020, 1, 1),
+        created_before=datetime(2020, 4, 4, tzinfo=timezone.utc),
+        repos=['api', 'CloudMages/web', 'sandbox'],
+        exclude_repos=['CloudMages/sandbox']
+    )
+    assert(Query.listable)
+    assert(Query.includes_repo('API') and Query.includes_repo('web'))
+    assert(not Query.includes_repo('sandbox'))
+    assert(not Query.includes_repo('tools'))
+    assert(SearchQuery('CloudMages').includes_repo('tools'))
+
+    assert(Query.includes_created(datetime(2020, 1, 1)))
+    assert(Query.includes_created(
+        datetime(2020, 4, 3, 23, 59, tzinfo=timezone.utc)
+    ))
+    assert(not Query.includes_created(datetime(2019, 12, 31)))
+    assert(not Query.includes_created(datetime(2020, 4, 4)))
+
+    assert(not SearchQuery(labels=['bug']).listable)
+    assert(not SearchQuery(draft=False).listable)
+    assert(not SearchQuery(review='none').listable)
+
+
+######################################
+# Test Server Side Filtering:        #
+######################################
+def test_search_open_pulls_filters(capsys):
+    """ GithubReports Class 'search_query' and 'stale_only' Test
+
+    This test will search the stub server with label, draft and stale only
+    filters, and set an invalid search query.
+
+    Expected Result:
+      Only matching pull requests are downloaded and hydrated, and an error
+      is logged for the invalid query.
+    """
+    with GithubStubServer(
+        pr_count=40, repo_count=2, draft_ratio=0.5
+    ) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        AllPulls = GitHubReportObj.search_open_pulls(
+            repo_namespace="StubOrg"
+        )
+        assert(len(AllPulls) == 40)
+
+        GitHubReportObj.search_query = SearchQuery(
+            draft=False,
+            labels=['bug'],
+            exclude_repos=['repo-1']
+        )
+        GitHubReportObj.stale_only = True
+        Results = GitHubReportObj.search_open_pulls()
+        Hydrated = GitHubReportObj.stats.as_dict()['endpoints'][
+            'GET /repos/{repo}/pulls/{number}'
+        ]['requests']
+
+    def pull(pr):
+        return ThisServer._find_pull(
+            f"StubOrg/{pr['repository']}",
+            pr['number']
+        )
+
+    Expected = [
+        _pr_ for _pr_ in AllPulls
+        if _pr_['repository'] == 'repo-0' and
+        _pr_['age'] >= timedelta(days=_pr_['days_open_threshold'] + 1) and
+        not pull(_pr_)['draft'] and 'bug' in pull(_pr_)['labels']
+    ]
+    assert(0 < len(Results) == len(Expected) == Hydrated)
+    assert(all(
+        _pr_['age_days'] > _pr_['days_open_threshold'] for _pr_ in Results
+    ))
+
+    GitHubReportObj.search_query = "draft:false"
+    assert(isinstance(GitHubReportObj.search_query, SearchQuery))
+    out, err = capsys.readouterr()
+    assert("search_query property argument expected type SearchQuery" in err)
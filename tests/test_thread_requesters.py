@@ -0,0 +1,209 @@
+# Run PyTest:
+# `poetry run pytest tests -v`
+# Run single test file instead of entire test suite:
+# `poetry run pytest tests/test_thread_requesters.py -v`
+# Run single test from a single test file
+# `poetry run pytest tests/test_thread_requesters.py::{testname} -v`
+
+################
+# Imports:     #
+################
+
+# Pip Installed Imports:
+from cloudmage.gitutils import GithubReports, GithubNotifier
+from cloudmage.gitutils.github_stub_server import GithubStubServer
+from cloudmage.gitutils.thread_requesters import ThreadRequesters
+from github import Github
+import github.Requester
+
+# Base Python Module Imports:
+import threading
+import pytest
+import time
+
+
+######################################
+# Define Test Fixtures:              #
+######################################
+@pytest.fixture
+def slow_responses(monkeypatch):
+    """ Widen the window between storing a request and sending it """
+    this_getresponse = github.Requester.HTTPRequestsConnectionClass.getresponse
+
+    def getresponse(self):
+        time.sleep(0.001)
+        return this_getresponse(self)
+
+    monkeypatch.setattr(
+        github.Requester.HTTPRequestsConnectionClass,
+        'getresponse',
+        getresponse
+    )
+
+
+def published(server):
+    """ Return the number of reminders published on each stub pull request """
+    return sorted(
+        len([_c_ for _c_ in _pull_['comments'] if _c_['user'] == 'stub-bot'])
+        for _pull_ in server._pull_list
+    )
+
+
+######################################
+# Test Thread Requesters:            #
+######################################
+def test_thread_requesters():
+    """ ThreadRequesters Class Test
+
+    This test will read the requester of a ThreadRequesters object from the
+    building thread and from two other threads.
+
+    Expected Result:
+      The original requester for the building thread, a prepared requester
+      of its own with the same settings for each other thread, and the
+      object itself from a with method keeping the settings.
+    """
+    ThisGithub = Github(
+        "12345678910987654321",
+        base_url="http://localhost:1/api/v3",
+        per_page=100
+    )
+    Prepared = []
+    Requesters = ThreadRequesters(
+        ThisGithub.requester, prepare=Prepared.append
+    )
+    assert(Requesters.current is ThisGithub.requester)
+    assert(Requesters.per_page == 100)
+    assert(Requesters.withLazy(False) is Requesters)
+
+    Current = []
+
+    def read():
+        Current.append((Requesters.current, Requesters.current))
+
+    Threads = [threading.Thread(target=read) for _n_ in range(2)]
+    for _thread_ in Threads:
+        _thread_.start()
+    for _thread_ in Threads:
+        _thread_.join()
+    assert(all(_first_ is _second_ for _first_, _second_ in Current))
+    assert(Current[0][0] is not Current[1][0])
+    assert(ThisGithub.requester not in [_r_ for _r_, _ in Current])
+    assert(sorted(map(id, Prepared)) == sorted(id(_r_) for _r_, _ in Current))
+    assert(all(
+        _r_.base_url == ThisGithub.requester.base_url and
+        _r_.per_page == 100
+        for _r_, _ in Current
+    ))
+
+
+def test_search_open_pulls_notify_threads(slow_responses):
+    """ GithubReports Concurrent Notification Test
+
+    This test will publish reminders on every pull request of the stub
+    server with each enumeration strategy, while every response takes a
+    moment longer, and then through a notifier handed pull requests of a
+    plain Github object.
+
+    Expected Result:
+      A single reminder published on each pull request.
+    """
+    for _strategy_ in ('search', 'list', 'graphql'):
+        with GithubStubServer(pr_count=40, repo_count=2) as ThisServer:
+            GitHubReportObj = GithubReports(
+                auth_token="12345678910987654321",
+                base_url=ThisServer.base_url
+            )
+            GitHubReportObj.request_interval = 0
+            GitHubReportObj.is_organization = True
+            GitHubReportObj.repo_namespace = "StubOrg"
+            GitHubReportObj.open_pr_threshold = 0
+            GitHubReportObj.enumeration = _strategy_
+            GitHubReportObj.notify = True
+            GitHubReportObj.notifier = GithubNotifier(
+                writes_per_minute=60000
+            )
+            assert(len(GitHubReportObj.search_open_pulls()) == 40)
+            assert(published(ThisServer) == [1] * 40)
+
+    with GithubStubServer(pr_count=20, repo_count=1) as ThisServer:
+        ThisGithub = Github(
+            "12345678910987654321",
+            base_url=ThisServer.base_url,
+            seconds_between_requests=0,
+            seconds_between_writes=0
+        )
+        NotifierObj = GithubNotifier(writes_per_minute=60000)
+        for _pull_ in ThisGithub.get_repo('StubOrg/repo-0').get_pulls():
+            NotifierObj.enqueue(_pull_, f"@user {_pull_.number} reminder")
+        assert(NotifierObj.dispatch()['published'] == 20)
+        assert(published(ThisServer) == [1] * 20)
+
+
+def test_search_open_pulls_mergeability_threads(slow_responses):
+    """ GithubReports Concurrent Mergeability Polling Test
+
+    This test will poll the pending mergeability of the pull requests of a
+    stub server in concurrent batches, while every response takes a moment
+    longer.
+
+    Expected Result:
+      The mergeability of each pull request recorded on its own record.
+    """
+    with GithubStubServer(
+        pr_count=60, repo_count=2, merge_delay=0.05
+    ) as ThisServer:
+        GitHubReportObj = GithubReports(
+            auth_token="12345678910987654321",
+            base_url=ThisServer.base_url
+        )
+        GitHubReportObj.request_interval = 0
+        GitHubReportObj.is_organization = True
+        GitHubReportObj.enumeration = 'search'
+        GitHubReportObj.lean_hydration = True
+        GitHubReportObj.mergeability_polls = 20
+        GitHubReportObj.mergeability_poll_interval = 0.05
+        Results = GitHubReportObj.search_open_pulls(repo_namespace="StubOrg")
+        Expected = {
+            (_pull_['repo'], _pull_['number']): (
+                _pull_['mergeable'], _pull_['mergeable_state']
+            )
+            for _pull_ in ThisServer._pull_list
+        }
+
+    assert(len(Results) == 60)
+    assert(GitHubReportObj.stats.as_dict()['counters']['mergeability_polled'])
+    assert(all(
+        (_pr_['mergable'], _pr_['merge_state']) == Expected[(
+            '/'.join(_pr_['link'].split('/')[-4:-2]), _pr_['number']
+        )]
+        for _pr_ in Results
+    ))
+
+
+def test_search_open_pulls_prefetch_threads(slow_responses):
+    """ GithubReports Concurrent Page Prefetching Test
+
+    This test will search and list the pages of a busy stub repository,
+    fetched ahead while the pull requests of the current page are
+    hydrated, while every response takes a moment longer.
+
+    Expected Result:
+      Every pull request collected once with each strategy.
+    """
+    for _strategy_ in ('search', 'list'):
+        with GithubStubServer(pr_count=250, repo_count=1) as ThisServer:
+            GitHubReportObj = GithubReports(
+                auth_token="12345678910987654321",
+                base_url=ThisServer.base_url
+            )
+            GitHubReportObj.request_interval = 0
+            GitHubReportObj.is_organization = True
+            GitHubReportObj.repo_namespace = "StubOrg"
+            GitHubReportObj.enumeration = _strategy_
+            GitHubReportObj.mergeability = False
+            Results = GitHubReportObj.search_open_pulls()
+
+        assert(sorted(_pr_['number'] for _pr_ in Results) == list(
+            range(1, 251)
+        ))